@@ -0,0 +1,146 @@
+import json
+
+import avro.datafile
+import avro.io
+import fastavro
+import cavro
+from io import BytesIO
+
+from benchmark.simple import SCHEMA, make_readings
+
+
+class ContainerRead:
+
+    """
+    Measure the time taken to read 100,000 records from an object container,
+    using a simple (3 field) record schema, one record at a time.
+    """
+
+    NUM_RUNS = 3
+    NAME = "container_read"
+
+    def __init__(self, mul=1):
+        schema = cavro.Schema(SCHEMA)
+        self.buf = BytesIO()
+        with cavro.ContainerWriter(self.buf, schema) as writer:
+            writer.write_many(make_readings(100_000 * mul))
+
+    def avro(self):
+        self.buf.seek(0)
+        file_reader = avro.datafile.DataFileReader(self.buf, avro.io.DatumReader())
+        for value in file_reader:
+            pass
+
+    def fastavro(self):
+        self.buf.seek(0)
+        for value in fastavro.reader(self.buf):
+            pass
+
+    def cavro(self):
+        self.buf.seek(0)
+        for value in cavro.ContainerReader(self.buf):
+            pass
+
+
+class ContainerReadBatch(ContainerRead):
+
+    """
+    Measure the time taken to read 100,000 records from an object container,
+    using a simple (3 field) record schema, decoding a whole block at a time with
+    `ContainerReader.read_block_objects()`
+    """
+
+    NAME = "container_read_batch"
+
+    def cavro(self):
+        self.buf.seek(0)
+        reader = cavro.ContainerReader(self.buf)
+        while True:
+            values = reader.read_block_objects()
+            if not values:
+                break
+            for value in values:
+                pass
+
+
+class ContainerReadColumns(ContainerRead):
+
+    """
+    Measure the time taken to read 100,000 records from an object container,
+    using a simple (3 field) record schema, decoding them into per-field columns with
+    `ContainerReader.iter_columns()`
+    """
+
+    NAME = "container_read_columns"
+
+    def cavro(self):
+        self.buf.seek(0)
+        reader = cavro.ContainerReader(self.buf)
+        for columns in reader.iter_columns():
+            pass
+
+
+class SimpleRecordDecodeMany:
+
+    """
+    Measure the time taken to decode 100,000 concatenated records using a simple (3 field)
+    record schema, decoding them all with a single call to `Schema.binary_decode_many`
+    """
+
+    NUM_RUNS = 3
+    NAME = "simple_record_decode_many"
+
+    def __init__(self, mul=1):
+        schema = cavro.Schema(SCHEMA)
+        self.count = 100_000 * mul
+        self.encoded = b''.join(schema.binary_encode(v) for v in make_readings(self.count))
+
+    def avro(self):
+        schema = avro.schema.parse(SCHEMA)
+        reader = avro.io.DatumReader(schema)
+        decoder = avro.io.BinaryDecoder(BytesIO(self.encoded))
+        values = [reader.read(decoder) for _ in range(self.count)]
+
+    def fastavro(self):
+        schema = fastavro.schema.parse_schema(json.loads(SCHEMA))
+        buf = BytesIO(self.encoded)
+        values = [fastavro.schemaless_reader(buf, schema) for _ in range(self.count)]
+
+    def cavro(self):
+        schema = cavro.Schema(SCHEMA)
+        values = schema.binary_decode_many(self.encoded, self.count)
+
+
+class SimpleRecordEncodeMany:
+
+    """
+    Measure the time taken to encode 100,000 dicts using a simple (3 field)
+    record schema, encoding them all with a single call to `Schema.binary_encode_many`
+    """
+
+    NUM_RUNS = 3
+    NAME = "simple_record_encode_many"
+
+    def __init__(self, mul=1):
+        self.values = make_readings(100_000 * mul)
+
+    def avro(self):
+        schema = avro.schema.parse(SCHEMA)
+        writer = avro.io.DatumWriter(schema)
+        encoded = []
+        for value in self.values:
+            output_buf = BytesIO()
+            writer.write(value, avro.io.BinaryEncoder(output_buf))
+            encoded.append(output_buf.getvalue())
+
+    def fastavro(self):
+        schema = fastavro.schema.parse_schema(json.loads(SCHEMA))
+        encoded = []
+        for value in self.values:
+            output_buf = BytesIO()
+            fastavro.schemaless_writer(output_buf, schema, value)
+            encoded.append(output_buf.getvalue())
+
+    def cavro(self):
+        schema = cavro.Schema(SCHEMA)
+        encoded = schema.binary_encode_many(self.values)
@@ -52,3 +52,55 @@ class ComplexSchema:
         for encoded_value in self.values:
             decoded = schema.binary_decode(encoded_value)
             encoded = schema.binary_encode(decoded)
+
+
+class ComplexSchemaCompiled(ComplexSchema):
+    """
+    Measure the time taken to decode and re-encode 1,000 values, randomly
+    generated to match a 70 kb schema.
+    cavro uses a compiled schema
+    """
+
+    NAME = "complex_schema_compiled"
+
+    def cavro(self):
+        schema = cavro.Schema(SCHEMA).compile()
+        for encoded_value in self.values:
+            decoded = schema.binary_decode(encoded_value)
+            encoded = schema.binary_encode(decoded)
+
+
+class ComplexSchemaDecodeEach:
+    """
+    Measure the time taken to decode 100 values, randomly generated to match
+    a 70 kb schema, looking up the schema for each value.
+    Every library re-uses its parsed schema through a cache keyed on the
+    schema source, which starts empty for each run (cavro uses a SchemaCache)
+    """
+
+    NUM_RUNS = 3
+    NAME = "complex_schema_decode_each"
+
+    def __init__(self, mul):
+        schema = cavro.Schema(SCHEMA)
+        raw_values = [make_value_for_type(schema.type, 5) for _ in range(int(100 * mul))]
+        self.values = [schema.binary_encode(value) for value in raw_values]
+
+    def avro(self):
+        cache = {}
+        for encoded_value in self.values:
+            if SCHEMA not in cache:
+                cache[SCHEMA] = avro.io.DatumReader(avro.schema.parse(SCHEMA))
+            cache[SCHEMA].read(avro.io.BinaryDecoder(BytesIO(encoded_value)))
+
+    def fastavro(self):
+        cache = {}
+        for encoded_value in self.values:
+            if SCHEMA not in cache:
+                cache[SCHEMA] = fastavro.schema.parse_schema(json.loads(SCHEMA))
+            fastavro.schemaless_reader(BytesIO(encoded_value), cache[SCHEMA])
+
+    def cavro(self):
+        cache = cavro.SchemaCache()
+        for encoded_value in self.values:
+            cache.get(SCHEMA).binary_decode(encoded_value)
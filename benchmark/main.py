@@ -5,7 +5,7 @@ import json
 import random
 import time
 import numpy
-from benchmark import simple, many_numbers, complex, pypifile, promotion
+from benchmark import simple, many_numbers, complex, pypifile, promotion, batch, union
 import cProfile
 import click
 
@@ -152,15 +152,30 @@ def wrap_results(results):
 
 ALL_TEST_CLASSES = [
     many_numbers.ManyNumbersEncode,
+    many_numbers.ManyNumbersEncodeNumpy,
     many_numbers.ManyNumbersDecode,
+    many_numbers.ManyNumbersDecodeNumpy,
     complex.ComplexSchema,
+    complex.ComplexSchemaCompiled,
+    complex.ComplexSchemaDecodeEach,
     pypifile.PypiFile,
+    pypifile.PypiFileLazy,
     simple.SimpleRecordEncode,
     simple.SimpleRecordEncodeDict,
     simple.SimpleRecordDecode,
     simple.SimpleRecordDecodeDict,
+    simple.SimpleRecordSingleObjectDecode,
+    simple.SimpleRecordRegistryDecode,
     promotion.SchemaPromotion,
     promotion.ContainerSchemaPromotion,
+    promotion.NarrowSchemaProjection,
+    batch.ContainerRead,
+    batch.ContainerReadBatch,
+    batch.ContainerReadColumns,
+    batch.SimpleRecordDecodeMany,
+    batch.SimpleRecordEncodeMany,
+    union.WideUnionEncodeDict,
+    union.WideUnionEncode,
 ]
 libs = ['avro', 'cavro', 'fastavro']
 if HAVE_AVRO_COMPAT:
@@ -3,6 +3,7 @@ import json
 import avro.io
 import fastavro
 import cavro
+import numpy
 import numpy.random
 from io import BytesIO
 
@@ -52,6 +53,20 @@ class ManyNumbersDecode(ManyNumbersBase):
         decoded = schema.binary_decode(self.value)
 
 
+class ManyNumbersDecodeNumpy(ManyNumbersDecode):
+
+    """
+    Given a large, single array of `long` values encoded in the avro binary format,
+    measure the time taken to decode them.  cavro decodes to a numpy array (`array_decodes_to_numpy`)
+    """
+
+    NAME = "many_numbers_decode_numpy"
+
+    def cavro(self):
+        schema = cavro.Schema(SCHEMA, array_decodes_to_numpy=True)
+        decoded = schema.binary_decode(self.value)
+
+
 class ManyNumbersEncode(ManyNumbersBase):
 
     """
@@ -80,3 +95,22 @@ class ManyNumbersEncode(ManyNumbersBase):
     def cavro(self):
         schema = cavro.Schema(SCHEMA)
         encoded = schema.binary_encode(self.values)
+
+
+class ManyNumbersEncodeNumpy(ManyNumbersEncode):
+
+    """
+    Given a large, single array of `long` values,
+    measure the time taken to encode them in the avro binary format.
+    cavro is given the values as an int64 `numpy.ndarray`
+    """
+
+    NAME = "many_numbers_encode_numpy"
+
+    def __init__(self, mul):
+        super().__init__(mul)
+        self.array = numpy.array(self.values, dtype=numpy.int64)
+
+    def cavro(self):
+        schema = cavro.Schema(SCHEMA)
+        encoded = schema.binary_encode(self.array)
@@ -97,3 +97,62 @@ class ContainerSchemaPromotion:
         reader = cavro.ContainerReader(self.buf, reader_schema)
         for value in reader:
             pass
+
+
+WIDE_FIELD_TYPES = ['string', 'long', 'double', {'type': 'map', 'values': 'string'}, ['null', 'string']]
+WIDE_WRITER_SCHEMA = json.dumps({
+    'type': 'record',
+    'name': 'Wide',
+    'fields': [
+        {'name': f'field_{i}', 'type': WIDE_FIELD_TYPES[i % len(WIDE_FIELD_TYPES)]}
+        for i in range(120)
+    ],
+})
+NARROW_READER_SCHEMA = json.dumps({
+    'type': 'record',
+    'name': 'Wide',
+    'fields': [
+        {'name': f'field_{i}', 'type': WIDE_FIELD_TYPES[i % len(WIDE_FIELD_TYPES)]}
+        for i in (0, 1, 2)
+    ],
+})
+
+
+class NarrowSchemaProjection:
+    """
+    Measure the time taken to decode 10,000 values of a 120 field record,
+    using a reader schema that only has 3 of the fields.
+    """
+
+    NUM_RUNS = 3
+    NAME = "narrow_schema_projection"
+
+    def __init__(self, mul):
+        schema = cavro.Schema(WIDE_WRITER_SCHEMA)
+        self.values = [
+            schema.binary_encode(make_value_for_type(schema.type, 3))
+            for _ in range(int(10_000 * mul))
+        ]
+
+    def avro(self):
+        reader_schema = avro.schema.parse(NARROW_READER_SCHEMA)
+        writer_schema = avro.schema.parse(WIDE_WRITER_SCHEMA)
+        reader = avro.io.DatumReader(writer_schema, reader_schema)
+        for encoded_value in self.values:
+            decoded = reader.read(avro.io.BinaryDecoder(BytesIO(encoded_value)))
+
+    def fastavro(self):
+        reader_schema = fastavro.schema.parse_schema(json.loads(NARROW_READER_SCHEMA))
+        writer_schema = fastavro.schema.parse_schema(json.loads(WIDE_WRITER_SCHEMA))
+        for encoded_value in self.values:
+            decoded = fastavro.schemaless_reader(
+                BytesIO(encoded_value),
+                writer_schema=writer_schema,
+                reader_schema=reader_schema
+            )
+
+    def cavro(self):
+        writer_schema = cavro.Schema(WIDE_WRITER_SCHEMA)
+        reader_schema = cavro.Schema(NARROW_READER_SCHEMA).reader_for_writer(writer_schema)
+        for encoded_value in self.values:
+            decoded = reader_schema.binary_decode(encoded_value)
@@ -46,3 +46,23 @@ class PypiFile:
                 for record in cavro.ContainerReader(fo):
                     projects.add(record.file.project)
         return projects
+
+
+class PypiFileLazy(PypiFile):
+
+    """
+    Measure the time taken to read the project of all records from one file (11 Mb) of pypi
+    download logs, sourced from google bigquery public dataset
+    cavro decodes records lazily
+    """
+
+    NAME = "pypi_file_lazy"
+
+    def cavro(self):
+        projects = set()
+        options = cavro.Options(record_decodes_lazily=True)
+        for i in range(self.mul):
+            with open(self.BULK_FILE, 'rb') as fo:
+                for record in cavro.ContainerReader(fo, options=options):
+                    projects.add(record.file.project)
+        return projects
@@ -139,4 +139,97 @@ class SimpleRecordDecodeDict(SimpleRecordDecode):
         schema = cavro.Schema(SCHEMA)
         for value in self.values:
             record = schema.binary_decode(value)
-            decoded = record._asdict()
\ No newline at end of file
+            decoded = record._asdict()
+
+READER_SCHEMA = json.dumps({
+    'name': 'Weather',
+    'namespace': 'test',
+    'type': 'record',
+    'fields': [
+        {'name': 'station', 'type': 'string'},
+        {'name': 'time', 'type': 'long'},
+        {'name': 'temp', 'type': 'long'},
+        {'name': 'source', 'type': 'string', 'default': 'sensor'},
+    ],
+})
+
+
+class SimpleRecordSingleObjectDecode:
+
+    """
+    Measure the time taken to decode 100,000 single-object encoded records,
+    looking up the writer schema by fingerprint, and resolving it to a reader schema
+    """
+
+    NUM_RUNS = 3
+    NAME = "simple_record_single_object_decode"
+
+    def __init__(self, mul=1):
+        raw = make_readings(100_000 * mul)
+        schema = cavro.Schema(SCHEMA)
+        self.fingerprint = schema.fingerprint().digest()
+        self.values = [schema.single_object_encode(r) for r in raw]
+
+    def avro(self):
+        writers = {self.fingerprint: avro.schema.parse(SCHEMA)}
+        reader_schema = avro.schema.parse(READER_SCHEMA)
+        readers = {}
+        for value in self.values:
+            fingerprint = value[2:10]
+            reader = readers.get(fingerprint)
+            if reader is None:
+                reader = readers[fingerprint] = avro.io.DatumReader(writers[fingerprint], reader_schema)
+            reader.read(avro.io.BinaryDecoder(BytesIO(value[10:])))
+
+    def fastavro(self):
+        writers = {self.fingerprint: fastavro.schema.parse_schema(json.loads(SCHEMA))}
+        reader_schema = fastavro.schema.parse_schema(json.loads(READER_SCHEMA))
+        for value in self.values:
+            input_buf = BytesIO(value)
+            input_buf.seek(10)
+            fastavro.schemaless_reader(input_buf, writers[value[2:10]], reader_schema)
+
+    def cavro(self):
+        store = cavro.SchemaStore([cavro.Schema(SCHEMA)], reader_schema=cavro.Schema(READER_SCHEMA))
+        for value in self.values:
+            store.decode(value)
+
+
+class SimpleRecordRegistryDecode:
+
+    """
+    Measure the time taken to decode 100,000 records framed with a schema
+    registry header, looking up the writer schema by id, and resolving it to a reader schema
+    """
+
+    NUM_RUNS = 3
+    NAME = "simple_record_registry_decode"
+
+    def __init__(self, mul=1):
+        raw = make_readings(100_000 * mul)
+        registry = cavro.MemorySchemaRegistry({1: cavro.Schema(SCHEMA)})
+        self.values = cavro.RegistryCodec(registry, cavro.Schema(SCHEMA)).encode_many(raw)
+
+    def avro(self):
+        writers = {1: avro.schema.parse(SCHEMA)}
+        reader_schema = avro.schema.parse(READER_SCHEMA)
+        readers = {}
+        for value in self.values:
+            schema_id = int.from_bytes(value[1:5], 'big')
+            reader = readers.get(schema_id)
+            if reader is None:
+                reader = readers[schema_id] = avro.io.DatumReader(writers[schema_id], reader_schema)
+            reader.read(avro.io.BinaryDecoder(BytesIO(value[5:])))
+
+    def fastavro(self):
+        writers = {1: fastavro.schema.parse_schema(json.loads(SCHEMA))}
+        reader_schema = fastavro.schema.parse_schema(json.loads(READER_SCHEMA))
+        for value in self.values:
+            input_buf = BytesIO(value)
+            input_buf.seek(5)
+            fastavro.schemaless_reader(input_buf, writers[int.from_bytes(value[1:5], 'big')], reader_schema)
+
+    def cavro(self):
+        registry = cavro.MemorySchemaRegistry({1: cavro.Schema(SCHEMA)})
+        codec = cavro.RegistryCodec(registry, cavro.Schema(READER_SCHEMA))
+        codec.decode_many(self.values)
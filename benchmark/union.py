@@ -0,0 +1,79 @@
+import json
+
+import avro.io
+import fastavro
+import cavro
+from io import BytesIO
+
+NUM_RECORD_TYPES = 12
+
+SCHEMA = json.dumps([
+    {
+        'type': 'record',
+        'name': f'Event{i}',
+        'fields': [
+            {'name': 'id', 'type': 'long'},
+            {'name': f'payload_{i}', 'type': 'string'},
+            {'name': 'tags', 'type': {'type': 'array', 'items': 'string'}},
+        ],
+    }
+    for i in range(NUM_RECORD_TYPES)
+])
+
+
+def make_events(count):
+    return [
+        {'id': i, f'payload_{i % NUM_RECORD_TYPES}': f'payload {i}', 'tags': ['a', 'b', 'c']}
+        for i in range(count)
+    ]
+
+
+class WideUnionEncodeDict:
+
+    """
+    Measure the time taken to encode 20,000 dicts using a union of 12 record types.
+    """
+
+    NUM_RUNS = 3
+    NAME = "wide_union_encode_dict"
+
+    def __init__(self, mul=1):
+        self.values = make_events(20_000 * mul)
+
+    def avro(self):
+        schema = avro.schema.parse(SCHEMA)
+        writer = avro.io.DatumWriter(schema)
+        for value in self.values:
+            writer.write(value, avro.io.BinaryEncoder(BytesIO()))
+
+    def fastavro(self):
+        schema = fastavro.schema.parse_schema(json.loads(SCHEMA))
+        for value in self.values:
+            fastavro.schemaless_writer(BytesIO(), schema, value)
+
+    def cavro(self):
+        schema = cavro.Schema(SCHEMA)
+        for value in self.values:
+            schema.binary_encode(value)
+
+
+class WideUnionEncode(WideUnionEncodeDict):
+
+    """
+    Measure the time taken to encode 20,000 records using a union of 12 record types.
+    This takes advantage of cavro's class-based record types
+    """
+
+    NAME = "wide_union_encode"
+
+    def __init__(self, mul=1):
+        schema = cavro.Schema(SCHEMA)
+        self.records = [
+            schema.named_types[f'Event{value["id"] % NUM_RECORD_TYPES}'].record(**value)
+            for value in make_events(20_000 * mul)
+        ]
+
+    def cavro(self):
+        schema = cavro.Schema(SCHEMA)
+        for value in self.records:
+            schema.binary_encode(value)
@@ -9,7 +9,7 @@ cimport cython
 import warnings
 from cpython.object cimport Py_SIZE
 from libc.stdint cimport *
-from libc.string cimport memcmp
+from libc.string cimport memcmp, memmove, memset
 import inspect
 import dataclasses
 
@@ -25,6 +25,7 @@ from cython cimport bint
 from functools import partial
 import uuid
 import math
+import itertools
 from types import MappingProxyType
 from typing import Union
 from cpython.dict cimport PyDictProxy_New
@@ -69,11 +70,13 @@ include "src/option.pxi"
 include "src/io.pxi"
 include "src/buffer.pxi"
 include "src/zigzag.pxi"
+include "src/validate.pxi"
 include "src/rabin.pxi"
 
 include "src/tests/test_zigzag.pxi"
 include "src/tests/test_buffer.pxi"
 include "src/tests/test_perf.pxi"
+include "src/tests/test_union.pxi"
 
 include "src/array.pxi"
 include "src/enum.pxi"
@@ -86,11 +89,18 @@ include "src/union.pxi"
 
 include "src/type.pxi"
 include "src/schema.pxi"
+include "src/schema_store.pxi"
+include "src/registry.pxi"
+include "src/compiled.pxi"
 
 include "src/logical.pxi"
 
 include "src/codec.pxi"
+include "src/index.pxi"
+include "src/columnar.pxi"
+include "src/predicate.pxi"
 include "src/container.pxi"
+include "src/parallel.pxi"
 
 include "src/promotions.pxi"
 
@@ -1,6 +1,23 @@
 import numpy
 import collections
 
+# How an ndarray value can be encoded in bulk (see ArrayType._ndarray_encoding)
+cdef int NDARRAY_GENERIC = 0  # Each item is encoded individually
+cdef int NDARRAY_VARINTS = 1  # Items are encoded as zigzag varints from an int64 array
+cdef int NDARRAY_RAW = 2      # Items are encoded by copying the array data
+
+# Avro floats are little-endian IEEE 754, whatever the byte order of the host
+cdef object FLOAT_LE_DTYPE = numpy.dtype('<f4')
+cdef object DOUBLE_LE_DTYPE = numpy.dtype('<f8')
+
+# Item types that can be decoded directly into a numpy array, by dtype
+cdef dict NUMPY_ITEM_DTYPES = {
+    IntType: numpy.int32,
+    LongType: numpy.int64,
+    FloatType: FLOAT_LE_DTYPE,
+    DoubleType: DOUBLE_LE_DTYPE,
+}
+
 @cython.final
 cdef class ArrayType(AvroType):
     """The avro array type."""
@@ -29,8 +46,49 @@ cdef class ArrayType(AvroType):
     cpdef dict _get_schema_extra(self, set created):
         return {'items': self.item_type.get_schema(created)}
 
+    cdef int _ndarray_encoding(self, value):
+        if not isinstance(value, numpy.ndarray) or value.ndim != 1 or self.item_type.value_adapters:
+            return NDARRAY_GENERIC
+        item_cls = type(self.item_type)
+        dtype = value.dtype
+        if item_cls is LongType and (dtype == numpy.int64 or dtype == numpy.int32):
+            return NDARRAY_VARINTS
+        if item_cls is IntType and dtype == numpy.int32:
+            return NDARRAY_VARINTS
+        if item_cls is DoubleType and (dtype == numpy.float64 or dtype == numpy.float32):
+            return NDARRAY_RAW
+        if item_cls is FloatType and dtype == numpy.float32:
+            return NDARRAY_RAW
+        if item_cls is BoolType and dtype == numpy.bool_:
+            return NDARRAY_RAW
+        return NDARRAY_GENERIC
+
+    cdef int _binary_buffer_encode_ndarray(self, _Writer buffer, value, int encoding) except -1:
+        cdef Py_ssize_t length = len(value)
+        cdef MemoryWriter out
+        if length:
+            zigzag_encode_long(buffer, length)
+            if encoding == NDARRAY_RAW:
+                if type(self.item_type) is DoubleType:
+                    value = value.astype(DOUBLE_LE_DTYPE, copy=False)
+                elif type(self.item_type) is FloatType:
+                    value = value.astype(FLOAT_LE_DTYPE, copy=False)
+                buffer.write_n(numpy.ascontiguousarray(value).view(numpy.uint8))
+            else:
+                value = numpy.ascontiguousarray(value, dtype=numpy.int64)
+                out = buffer if isinstance(buffer, MemoryWriter) else MemoryWriter(0)
+                # A varint is at most 10 bytes
+                out.reserve(length * 10)
+                out.len += _encode_varints(out.buffer.data.as_uchars + out.len, value)
+                if out is not buffer:
+                    buffer.write_n(out.view())
+        zigzag_encode_long(buffer, 0)
+
     cdef int _binary_buffer_encode(self, _Writer buffer, value) except -1:
         cdef size_t idx = 0
+        cdef int ndarray_encoding = self._ndarray_encoding(value)
+        if ndarray_encoding != NDARRAY_GENERIC:
+            return self._binary_buffer_encode_ndarray(buffer, value, ndarray_encoding)
         if len(value):
             zigzag_encode_long(buffer, len(value))
             for item in value:
@@ -44,6 +102,10 @@ cdef class ArrayType(AvroType):
         zigzag_encode_long(buffer, 0)
 
     cdef _binary_buffer_decode(self, _Reader buffer):
+        if self.options.array_decodes_to_numpy and not self.item_type.value_adapters:
+            dtype = NUMPY_ITEM_DTYPES.get(type(self.item_type))
+            if dtype is not None:
+                return self._binary_buffer_decode_numpy(buffer, dtype)
         cdef list out = []
         cdef size_t length
         cdef str key
@@ -56,6 +118,61 @@ cdef class ArrayType(AvroType):
                 out.append(value)
                 length -= 1
 
+    cdef int binary_buffer_skip(self, _Reader buffer) except -1:
+        cdef int64_t count
+        while True:
+            count = zigzag_decode_long(buffer)
+            if count == 0:
+                return 0
+            if count < 0:
+                # Negative counts are followed by the size of the block in bytes, so the whole block can be skipped
+                skip_length_prefixed(buffer)
+                continue
+            while count:
+                self.item_type.binary_buffer_skip(buffer)
+                count -= 1
+
+    cdef const uint8_t *binary_buffer_validate(self, _Validator validator, const uint8_t *ptr) except NULL:
+        cdef int64_t count
+        cdef int64_t size
+        cdef const uint8_t *block_start
+        while True:
+            ptr = validator.read_long(ptr, &count)
+            if count == 0:
+                return ptr
+            size = -1
+            if count < 0:
+                # Negative counts are followed by the size of the block in bytes
+                count = -count
+                ptr = validator.read_length(ptr, &size)
+            block_start = ptr
+            while count:
+                ptr = self.item_type.binary_buffer_validate(validator, ptr)
+                if ptr == block_start:
+                    # Items that take no space (e.g. nulls) are all valid, and could be very numerous
+                    break
+                count -= 1
+            if size >= 0 and ptr - block_start != size:
+                raise validator.error(block_start, f"Array block size is {size}, but its items are {ptr - block_start} bytes")
+
+    cdef _binary_buffer_decode_numpy(self, _Reader buffer, dtype):
+        cdef list blocks = []
+        cdef int64_t count
+        while True:
+            count = zigzag_decode_long(buffer)
+            if count == 0:
+                break
+            if count < 0:
+                # Negative counts are followed by the size of the block in bytes
+                count = -count
+                zigzag_decode_long(buffer)
+            blocks.append(_read_numpy_block(buffer, dtype, count))
+        if not blocks:
+            return numpy.empty(0, dtype)
+        if len(blocks) == 1:
+            return blocks[0]
+        return numpy.concatenate(blocks)
+
     cdef _json_format(self, value):
         return [self.item_type.json_format(item) for item in value]
 
@@ -64,6 +181,8 @@ cdef class ArrayType(AvroType):
 
     cdef int _get_value_fitness(self, value) except -1:
         cdef int level = FIT_OK
+        if self._ndarray_encoding(value) != NDARRAY_GENERIC:
+            return FIT_EXACT
         if isinstance(value, (list, tuple, numpy.ndarray)):
             level = FIT_EXACT
         elif isinstance(value, dict):
@@ -82,6 +201,10 @@ cdef class ArrayType(AvroType):
                 break
         return level
 
+    cdef bint _may_fit_type(self, type value_type) except -1:
+        # Strings are rejected, and the others are not iterable
+        return value_type not in (str, bytes, int, float, py_bool, NoneType)
+
     cdef list _make_converted_list(self, value):
         cdef AvroType item_type = self.item_type
         cdef list out = []
@@ -96,6 +219,9 @@ cdef class ArrayType(AvroType):
         if self.options.missing_values_can_be_empty_container and value is MISSING_VALUE:
             return []
 
+        if self._ndarray_encoding(value) != NDARRAY_GENERIC:
+            return value
+
         it = iter(value)
         for item in it:
             item_fitness = item_type.get_value_fitness(item)
@@ -122,4 +248,39 @@ cdef class ArrayType(AvroType):
 
     cdef bint accepts_missing_value(self):
         if self.options.missing_values_can_be_empty_container:
-            return True
\ No newline at end of file
+            return True
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _read_numpy_block(_Reader buffer, dtype, int64_t count):
+    cdef int64_t i
+    cdef int32_t[::1] ints
+    cdef int64_t[::1] longs
+    if dtype is FLOAT_LE_DTYPE or dtype is DOUBLE_LE_DTYPE:
+        # The data may be a view of a reused buffer, so must be copied
+        return numpy.frombuffer(buffer.read_n(count * dtype.itemsize), dtype).copy()
+    if isinstance(buffer, MemoryReader):
+        # Each value takes at least one byte, so fail early rather than allocate a huge array
+        (<MemoryReader>buffer).ensure(count)
+    out = numpy.empty(count, dtype)
+    if dtype is numpy.int32:
+        ints = out
+        for i in range(count):
+            ints[i] = zigzag_decode_int(buffer)
+    else:
+        longs = out
+        for i in range(count):
+            longs[i] = zigzag_decode_long(buffer)
+    return out
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef size_t _encode_varints(uint8_t *out, const int64_t[::1] values):
+    cdef size_t written = 0
+    cdef Py_ssize_t i
+    with nogil:
+        for i in range(values.shape[0]):
+            written += zigzag_encode_long_ptr(out + written, values[i])
+    return written
@@ -1,3 +1,5 @@
+import mmap
+
 
 
 cdef array.array byte_buffer_template = array.array('B', [])
@@ -19,13 +21,27 @@ cdef class MemoryWriter(_Writer):
         self.buffer = array.clone(byte_buffer_template, initial_size, zero=True)
         self.len = 0
 
-    cdef bytes bytes(self):
+    cpdef bytes bytes(self):
+        """
+        Return a copy of the data written so far.
+        """
         return self.buffer.data.as_chars[:self.len]
 
     cdef const uint8_t[:] view(self):
         return self.buffer.data.as_uchars[:self.len]
 
-    cdef reset(self):
+    cpdef int reserve(self, size_t num) except -1:
+        """
+        Ensure that at least `num` more bytes can be written without resizing the buffer.
+        Useful to pre-size the buffer before writing many values.
+        """
+        if <size_t>self.buffer.ob_size - self.len < num:
+            array.resize_smart(self.buffer, self.len + num)
+
+    cpdef reset(self):
+        """
+        Discard the data written so far, keeping the allocated buffer for re-use.
+        """
         self.len = 0
 
     cdef int write_u8(self, uint8_t val) except -1:
@@ -96,3 +112,82 @@ cdef class MemoryReader(_Reader):
         cdef const uint8_t* ptr = self.ptr
         self.advance(n)
         return ptr[:n]
+
+    cdef int skip(self, Py_ssize_t n) except -1:
+        self.advance(n)
+
+    cpdef Py_ssize_t tell(self) except -1:
+        """
+        Return the offset of the next byte to be read.
+        """
+        return self.ptr - &self.data[0]
+
+    cpdef int seek(self, Py_ssize_t pos) except -1:
+        """
+        Move the read position to offset `pos`.
+        """
+        cdef const uint8_t *start = &self.data[0]
+        if pos < 0 or pos > self.end_ptr - start:
+            raise EOFError(f"Cannot seek to {pos}, outside of the buffer")
+        self.ptr = start + pos
+
+
+cdef class MmapReader(MemoryReader):
+
+    """
+    A class that allows cavro to read binary data from a memory-mapped file.
+
+    Unlike `MemoryReader`, `read_n` returns views directly into the mapped file, without copying.
+    Call `close()`, or use the reader as a context manager, to release the mapping.
+
+    Arguments:
+     * src: The file to map. Either a path, or a file object that implements `.fileno()`.
+    """
+
+    cdef readonly object mapping
+
+    def __init__(self, src):
+        if hasattr(src, 'fileno'):
+            self._map(src)
+        else:
+            with open(src, 'rb') as fh:
+                self._map(fh)
+
+    cdef _map(self, fh):
+        try:
+            self.mapping = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self.mapping = None
+            self._reset_to(b'')
+        else:
+            self._reset_to(self.mapping)
+
+    def close(self):
+        """
+        Release the mapping.  Nothing more can be read afterwards.
+        Raises `BufferError` if values that view the mapping (e.g. lazily decoded records) are still in use.
+        """
+        if self.mapping is None:
+            return
+        cdef Py_ssize_t position = self.tell()
+        self._reset_to(b'')
+        try:
+            self.mapping.close()
+        except BufferError:
+            self._reset_to(self.mapping)
+            self.ptr += position
+            raise
+        self.mapping = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    cdef const uint8_t[:] read_n(self, Py_ssize_t n):
+        cdef Py_ssize_t offset = self.ptr - &self.data[0]
+        self.advance(n)
+        return self.data[offset:offset + n]
@@ -1,4 +1,6 @@
 
+import threading
+
 HAVE_BZIP2 = False
 try:
     import bz2
@@ -53,17 +55,32 @@ cdef class Codec:
     Abstract base class for all codecs.  This class is not meant to be used directly.
 
     Subclasses must be implemented in cython.
+    Implementations of `compress` and `decompress` must be safe to call from multiple threads at once.
     """
 
     name = NotImplemented
 
     cdef const uint8_t[:] read_block(self, _Reader reader, size_t length):
+        return self.decompress(reader.read_n(length))
+
+    cpdef object decompress(self, const uint8_t[:] data):
+        """
+        Decompress a single block of data, and return the result.
+        """
         raise NotImplementedError(
-            f"{type(self).__name__} does not implement read_block")
+            f"{type(self).__name__} does not implement decompress")
 
     cdef ssize_t write_block(self, _Writer writer, const uint8_t[:] data) except -1:
+        cdef bytes compressed = self.compress(data)
+        writer.write_n(compressed)
+        return len(compressed)
+
+    cpdef bytes compress(self, const uint8_t[:] data):
+        """
+        Compress a single block of data, and return the result.
+        """
         raise NotImplementedError(
-            f"{type(self).__name__} does not implement write_block")
+            f"{type(self).__name__} does not implement compress")
 
 
 @cython.final
@@ -74,20 +91,15 @@ cdef class _SnappyCodec(Codec):
 
     name = 'snappy'
 
-    cdef const uint8_t[:] read_block(self, _Reader reader, size_t length):
-        cdef const uint8_t[:] compressed = reader.read_n(length - 4)
-        cdef const uint8_t[:] checksum = reader.read_n(4)
-        cdef bytes decompressed = snappy.decompress(compressed)
-        cdef const uint8_t[:] view = decompressed
-        return view
+    cpdef object decompress(self, const uint8_t[:] data):
+        # The last 4 bytes are the crc32 checksum of the uncompressed data
+        return snappy.decompress(data[:data.shape[0] - 4])
 
-    cdef ssize_t write_block(self, _Writer writer, const uint8_t[:] data) except -1:
+    cpdef bytes compress(self, const uint8_t[:] data):
         cdef bytes compressed = snappy.compress(data)
         cdef uint32_t crc = crc32(compressed)
         cdef uint8_t *crc_ptr = <uint8_t *>&crc
-        writer.write_n(compressed)
-        writer.write_n(crc_ptr[:4])
-        return len(compressed) + 4
+        return compressed + crc_ptr[:4]
 
 
 cdef class _NullCodec(Codec):
@@ -99,10 +111,16 @@ cdef class _NullCodec(Codec):
     cdef const uint8_t[:] read_block(self, _Reader reader, size_t length):
         return reader.read_n(length)
 
+    cpdef object decompress(self, const uint8_t[:] data):
+        return data
+
     cdef ssize_t write_block(self, _Writer writer, const uint8_t[:] data) except -1:
         writer.write_n(data)
         return data.shape[0]
 
+    cpdef bytes compress(self, const uint8_t[:] data):
+        return bytes(data)
+
 
 cdef class _DeflateCodec(Codec):
     """
@@ -110,13 +128,11 @@ cdef class _DeflateCodec(Codec):
     """
     name = 'deflate'
 
-    cdef const uint8_t[:] read_block(self, _Reader reader, size_t length):
-        return zlib.decompress(reader.read_n(length), wbits=-15)
+    cpdef object decompress(self, const uint8_t[:] data):
+        return zlib.decompress(data, wbits=-15)
 
-    cdef ssize_t write_block(self, _Writer writer, const uint8_t[:] data) except -1:
-        cdef bytes compressed = zlib.compress(data)[2:-1]
-        writer.write_n(compressed)
-        return len(compressed)
+    cpdef bytes compress(self, const uint8_t[:] data):
+        return zlib.compress(data)[2:-1]
 
 
 cdef class __Bzip2Codec(Codec):
@@ -125,13 +141,11 @@ cdef class __Bzip2Codec(Codec):
     """
     name = 'bzip2'
 
-    cdef const uint8_t[:] read_block(self, _Reader reader, size_t length):
-        return bz2.decompress(reader.read_n(length))
+    cpdef object decompress(self, const uint8_t[:] data):
+        return bz2.decompress(data)
 
-    cdef ssize_t write_block(self, _Writer writer, const uint8_t[:] data) except -1:
-        cdef bytes compressed = bz2.compress(data)
-        writer.write_n(compressed)
-        return len(compressed)    
+    cpdef bytes compress(self, const uint8_t[:] data):
+        return bz2.compress(data)
 
 
 cdef class _LzmaCodec(Codec):
@@ -140,13 +154,11 @@ cdef class _LzmaCodec(Codec):
     """
     name = 'xz'
 
-    cdef const uint8_t[:] read_block(self, _Reader reader, size_t length):
-        return lzma.decompress(reader.read_n(length))
+    cpdef object decompress(self, const uint8_t[:] data):
+        return lzma.decompress(data)
 
-    cdef ssize_t write_block(self, _Writer writer, const uint8_t[:] data) except -1:
-        cdef bytes compressed = lzma.compress(data)
-        writer.write_n(compressed)
-        return len(compressed)
+    cpdef bytes compress(self, const uint8_t[:] data):
+        return lzma.compress(data)
 
 
 cdef class _ZStandardCodec(Codec):
@@ -157,19 +169,36 @@ cdef class _ZStandardCodec(Codec):
 
     cdef readonly object compressor
     cdef readonly object decompressor
+    cdef object _local
 
     def __init__(self):
         self.compressor = zstandard.ZstdCompressor()
         self.decompressor = zstandard.ZstdDecompressor()
+        # zstandard (de)compressors are not thread-safe, so each thread gets its own
+        self._local = threading.local()
+        self._local.compressor = self.compressor
+        self._local.decompressor = self.decompressor
 
-    cdef const uint8_t[:] read_block(self, _Reader reader, size_t length):
-        decompress_obj = self.decompressor.decompressobj()
-        return decompress_obj.decompress(reader.read_n(length))
+    cdef object _thread_compressor(self):
+        try:
+            return self._local.compressor
+        except AttributeError:
+            self._local.compressor = zstandard.ZstdCompressor()
+            return self._local.compressor
 
-    cdef ssize_t write_block(self, _Writer writer, const uint8_t[:] data) except -1:
-        cdef bytes compressed = self.compressor.compress(data)
-        writer.write_n(compressed)
-        return len(compressed)
+    cdef object _thread_decompressor(self):
+        try:
+            return self._local.decompressor
+        except AttributeError:
+            self._local.decompressor = zstandard.ZstdDecompressor()
+            return self._local.decompressor
+
+    cpdef object decompress(self, const uint8_t[:] data):
+        decompress_obj = self._thread_decompressor().decompressobj()
+        return decompress_obj.decompress(data)
+
+    cpdef bytes compress(self, const uint8_t[:] data):
+        return self._thread_compressor().compress(data)
 
 
 cdef class _Lz4Codec(Codec):
@@ -178,13 +207,11 @@ cdef class _Lz4Codec(Codec):
     """
     name = 'lz4'
 
-    cdef const uint8_t[:] read_block(self, _Reader reader, size_t length):
-        return lz4.frame.decompress(reader.read_n(length))
+    cpdef object decompress(self, const uint8_t[:] data):
+        return lz4.frame.decompress(data)
 
-    cdef ssize_t write_block(self, _Writer writer, const uint8_t[:] data) except -1:
-        cdef bytes compressed = lz4.frame.compress(data)
-        writer.write_n(compressed)
-        return len(compressed)
+    cpdef bytes compress(self, const uint8_t[:] data):
+        return lz4.frame.compress(data)
 
 
 CODECS = {
@@ -0,0 +1,393 @@
+
+DEFAULT_COLUMN_BATCH_SIZE = 65536
+
+# How a _NumericColumn decodes each value
+cdef int COLUMN_INT = 0
+cdef int COLUMN_LONG = 1
+cdef int COLUMN_FLOAT = 2
+cdef int COLUMN_DOUBLE = 3
+cdef int COLUMN_BOOL = 4
+
+
+@cython.final
+cdef class BinaryColumn:
+
+    """
+    A column of string or bytes values, as returned by `ContainerReader.read_columns()`.
+
+    The values are stored end-to-end in a single `data` buffer, value `i` being `data[offsets[i]:offsets[i + 1]]`.
+    Indexing (or iterating over) the column creates the individual `str`/`bytes` objects on demand.
+
+    Arguments:
+     * `offsets`: An int64 numpy array of `len(column) + 1` offsets into `data`
+     * `data`: The bytes of all the values, concatenated
+     * `is_string`: If `True`, values are utf-8 encoded strings, and are decoded when accessed
+     * `validity`: `None` if the column cannot contain nulls, otherwise a boolean numpy array that is `False` where the value is null
+     * `unicode_errors`: The error handling scheme used when decoding strings. Defaults to `'strict'`
+    """
+
+    cdef readonly object offsets
+    cdef readonly bytes data
+    cdef readonly bint is_string
+    cdef readonly object validity
+    cdef readonly str unicode_errors
+
+    def __init__(self, offsets, bytes data, bint is_string=False, validity=None, str unicode_errors='strict'):
+        self.offsets = numpy.asarray(offsets, dtype=numpy.int64)
+        self.data = data
+        self.is_string = is_string
+        self.validity = validity
+        self.unicode_errors = unicode_errors
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, Py_ssize_t index):
+        cdef Py_ssize_t length = len(self.offsets) - 1
+        if index < 0:
+            index += length
+        if index < 0 or index >= length:
+            raise IndexError(f"Index {index} out of range for column of length {length}")
+        if self.validity is not None and not self.validity[index]:
+            return None
+        value = self.data[self.offsets[index]:self.offsets[index + 1]]
+        if self.is_string:
+            return value.decode('utf-8', errors=self.unicode_errors)
+        return value
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        kind = 'string' if self.is_string else 'bytes'
+        return f'<BinaryColumn {kind} length={len(self)}>'
+
+    def to_list(self):
+        """
+        Return the values of this column as a list.
+        """
+        return list(self)
+
+
+cdef class _Column:
+    # Accumulates the decoded values of a single field, until `finish()` is called at the end of each batch
+
+    cdef readonly str name
+
+    def __init__(self, str name):
+        self.name = name
+
+    cdef int append(self, MemoryReader buffer) except -1:
+        raise NotImplementedError(f"{type(self).__name__} does not implement append")
+
+    cdef int append_null(self) except -1:
+        raise NotImplementedError(f"{type(self).__name__} does not implement append_null")
+
+    cdef int truncate(self, Py_ssize_t length) except -1:
+        # Discard any values after the first `length`
+        raise NotImplementedError(f"{type(self).__name__} does not implement truncate")
+
+    cdef object finish(self, Py_ssize_t length, validity):
+        raise NotImplementedError(f"{type(self).__name__} does not implement finish")
+
+
+@cython.final
+cdef class _NumericColumn(_Column):
+
+    cdef int kind
+    cdef object dtype
+    cdef size_t itemsize
+    cdef MemoryWriter values
+
+    def __init__(self, str name, int kind, dtype):
+        super().__init__(name)
+        self.kind = kind
+        self.dtype = dtype
+        self.itemsize = numpy.dtype(dtype).itemsize
+        self.values = MemoryWriter(0)
+
+    cdef int append(self, MemoryReader buffer) except -1:
+        cdef int32_t int_val
+        cdef int64_t long_val
+        self.values.reserve(self.itemsize)
+        cdef uint8_t *out = self.values.buffer.data.as_uchars + self.values.len
+        if self.kind == COLUMN_INT:
+            int_val = zigzag_decode_int(buffer)
+            memcpy(out, &int_val, sizeof(int_val))
+        elif self.kind == COLUMN_LONG:
+            long_val = zigzag_decode_long(buffer)
+            memcpy(out, &long_val, sizeof(long_val))
+        elif self.kind == COLUMN_BOOL:
+            out[0] = buffer.read_u8() != 0
+        else:
+            # Avro floats are little-endian IEEE 754, so can be copied directly
+            memcpy(out, buffer.advance(self.itemsize), self.itemsize)
+        self.values.len += self.itemsize
+
+    cdef int append_null(self) except -1:
+        self.values.reserve(self.itemsize)
+        memset(self.values.buffer.data.as_uchars + self.values.len, 0, self.itemsize)
+        self.values.len += self.itemsize
+
+    cdef int truncate(self, Py_ssize_t length) except -1:
+        self.values.len = length * self.itemsize
+
+    cdef object finish(self, Py_ssize_t length, validity):
+        out = numpy.frombuffer(self.values.buffer, self.dtype, length)
+        # The array now owns the buffer, so start the next batch with a new one of the same size
+        self.values = MemoryWriter(len(self.values.buffer))
+        if validity is not None:
+            return numpy.ma.MaskedArray(out, mask=~validity)
+        return out
+
+
+@cython.final
+cdef class _BinaryColumn(_Column):
+
+    cdef bint is_string
+    cdef str unicode_errors
+    cdef MemoryWriter offsets
+    cdef MemoryWriter data
+
+    def __init__(self, str name, bint is_string, str unicode_errors):
+        super().__init__(name)
+        self.is_string = is_string
+        self.unicode_errors = unicode_errors
+        self.data = MemoryWriter(0)
+        self._start_offsets(0)
+
+    cdef int _start_offsets(self, size_t initial_size) except -1:
+        self.offsets = MemoryWriter(initial_size)
+        self._append_offset()
+
+    cdef inline int _append_offset(self) except -1:
+        cdef int64_t offset = self.data.len
+        self.offsets.reserve(sizeof(offset))
+        memcpy(self.offsets.buffer.data.as_uchars + self.offsets.len, &offset, sizeof(offset))
+        self.offsets.len += sizeof(offset)
+
+    cdef int append(self, MemoryReader buffer) except -1:
+        cdef size_t length = zigzag_decode_long(buffer)
+        cdef const uint8_t *src = buffer.advance(length)
+        self.data.reserve(length)
+        memcpy(self.data.buffer.data.as_uchars + self.data.len, src, length)
+        self.data.len += length
+        self._append_offset()
+
+    cdef int append_null(self) except -1:
+        self._append_offset()
+
+    cdef int truncate(self, Py_ssize_t length) except -1:
+        cdef int64_t offset
+        memcpy(&offset, self.offsets.buffer.data.as_uchars + length * sizeof(offset), sizeof(offset))
+        self.offsets.len = (length + 1) * sizeof(offset)
+        self.data.len = offset
+
+    cdef object finish(self, Py_ssize_t length, validity):
+        offsets = numpy.frombuffer(self.offsets.buffer, numpy.int64, length + 1)
+        column = BinaryColumn(offsets, self.data.bytes(), self.is_string, validity, self.unicode_errors)
+        self.data.reset()
+        self._start_offsets(len(self.offsets.buffer))
+        return column
+
+
+@cython.final
+cdef class _NullableColumn(_Column):
+    # A ["null", T] union, stored as a column of T, with a validity mask
+
+    cdef _Column inner
+    cdef int64_t null_index
+    cdef MemoryWriter validity
+
+    def __init__(self, str name, _Column inner, int64_t null_index):
+        super().__init__(name)
+        self.inner = inner
+        self.null_index = null_index
+        self.validity = MemoryWriter(0)
+
+    cdef int append(self, MemoryReader buffer) except -1:
+        cdef int64_t index = zigzag_decode_long(buffer)
+        if index == self.null_index:
+            self.inner.append_null()
+            self.validity.write_u8(0)
+        elif index == 1 - self.null_index:
+            self.inner.append(buffer)
+            self.validity.write_u8(1)
+        else:
+            raise ValueError(f"Value {index} is not valid for a union of 2 items")
+
+    cdef int truncate(self, Py_ssize_t length) except -1:
+        self.inner.truncate(length)
+        self.validity.len = length
+
+    cdef object finish(self, Py_ssize_t length, validity):
+        valid = numpy.frombuffer(self.validity.buffer, numpy.bool_, length)
+        self.validity = MemoryWriter(len(self.validity.buffer))
+        return self.inner.finish(length, valid)
+
+
+@cython.final
+cdef class _ObjectColumn(_Column):
+    # Any other type is decoded as normal, into a numpy array of objects
+
+    cdef AvroType avro_type
+    cdef list values
+
+    def __init__(self, str name, AvroType avro_type):
+        super().__init__(name)
+        self.avro_type = avro_type
+        self.values = []
+
+    cdef int append(self, MemoryReader buffer) except -1:
+        self.values.append(self.avro_type.binary_buffer_decode(buffer))
+
+    cdef int truncate(self, Py_ssize_t length) except -1:
+        del self.values[length:]
+
+    cdef object finish(self, Py_ssize_t length, validity):
+        cdef Py_ssize_t i
+        out = numpy.empty(length, dtype=object)
+        # Assign items individually, so that list values are not treated as extra dimensions
+        for i in range(length):
+            out[i] = self.values[i]
+        self.values = []
+        return out
+
+
+@cython.final
+cdef class _SkipColumn(_Column):
+    # A writer field that is not in the reader schema, skipped over
+
+    cdef AvroType avro_type
+
+    def __init__(self, AvroType avro_type):
+        super().__init__(None)
+        self.avro_type = avro_type
+
+    cdef int append(self, MemoryReader buffer) except -1:
+        self.avro_type.binary_buffer_skip(buffer)
+
+    cdef int truncate(self, Py_ssize_t length) except -1:
+        pass
+
+
+cdef _Column _primitive_column(str name, AvroType avro_type):
+    if avro_type.value_adapters:
+        return None
+    type_cls = type(avro_type)
+    if type_cls is IntType:
+        return _NumericColumn(name, COLUMN_INT, numpy.int32)
+    if type_cls is LongType:
+        return _NumericColumn(name, COLUMN_LONG, numpy.int64)
+    if type_cls is FloatType:
+        return _NumericColumn(name, COLUMN_FLOAT, FLOAT_LE_DTYPE)
+    if type_cls is DoubleType:
+        return _NumericColumn(name, COLUMN_DOUBLE, DOUBLE_LE_DTYPE)
+    if type_cls is BoolType:
+        return _NumericColumn(name, COLUMN_BOOL, numpy.bool_)
+    if type_cls is StringType:
+        return _BinaryColumn(name, True, avro_type.options.unicode_errors)
+    if type_cls is BytesType:
+        return _BinaryColumn(name, False, avro_type.options.unicode_errors)
+    return None
+
+
+cdef _Column _typed_column(str name, AvroType avro_type):
+    cdef _Column column = _primitive_column(name, avro_type)
+    cdef UnionType union_type
+    cdef Py_ssize_t null_index
+    if column is not None or not isinstance(avro_type, UnionType) or avro_type.value_adapters:
+        return column
+    union_type = avro_type
+    if len(union_type.union_types) != 2:
+        return None
+    for null_index in range(2):
+        if type(union_type.union_types[null_index]) is NullType:
+            column = _primitive_column(name, union_type.union_types[1 - null_index])
+            if column is not None:
+                return _NullableColumn(name, column, null_index)
+    return None
+
+
+cdef int _plan_record(RecordType record, str prefix, list decode_columns, list output_columns, frozenset active) except -1:
+    # Adds the columns for each field of `record` to `decode_columns`, in the order they are encoded,
+    # and the columns to be returned to `output_columns`, in reader field order.
+    # Nested records are flattened, with dotted column names.
+    cdef RecordField field
+    cdef Py_ssize_t index = 0
+    cdef Py_ssize_t reader_index
+    cdef _Column column
+    cdef list field_columns
+    cdef list by_reader_index = []
+    for field in record.fields:
+        reader_index = index
+        if isinstance(record, PromotingRecordType):
+            reader_index = (<PromotingRecordType>record).decode_indexes[index]
+        index += 1
+        if reader_index < 0:
+            decode_columns.append(_SkipColumn(field.type))
+            continue
+        name = prefix + field.name
+        field_columns = []
+        column = _typed_column(name, field.type)
+        if column is None and isinstance(field.type, RecordType) and not field.type.value_adapters and field.type not in active:
+            _plan_record(field.type, name + '.', decode_columns, field_columns, active | {field.type})
+        else:
+            if column is None:
+                column = _ObjectColumn(name, field.type)
+            decode_columns.append(column)
+            field_columns.append(column)
+        by_reader_index.append((reader_index, field_columns))
+    by_reader_index.sort(key=lambda item: item[0])
+    for _, field_columns in by_reader_index:
+        output_columns.extend(field_columns)
+
+
+cdef class _ColumnarDecoder:
+    # Decodes records from a container block into columns, see ContainerReader.read_columns()
+
+    cdef list decode_columns
+    cdef list output_columns
+    # The number of complete rows decoded since the last call to finish()
+    cdef Py_ssize_t length
+
+    def __init__(self, Schema schema):
+        if not isinstance(schema.type, RecordType) or schema.type.value_adapters:
+            raise ValueError(f"Reading columns requires a record schema, not '{schema.type.type_name}'")
+        self.decode_columns = []
+        self.output_columns = []
+        _plan_record(schema.type, '', self.decode_columns, self.output_columns, frozenset({schema.type}))
+
+    cdef int decode_rows(self, MemoryReader buffer, size_t count) except -1:
+        # If a row cannot be decoded, it is rolled back, and the buffer is left at the start of it
+        cdef list columns = self.decode_columns
+        cdef Py_ssize_t num_columns = len(columns)
+        cdef Py_ssize_t i
+        cdef size_t row
+        cdef const uint8_t *row_start = buffer.ptr
+        try:
+            for row in range(count):
+                for i in range(num_columns):
+                    (<_Column>columns[i]).append(buffer)
+                self.length += 1
+                row_start = buffer.ptr
+        except BaseException:
+            self.discard_partial()
+            buffer.ptr = row_start
+            raise
+
+    cdef int discard_partial(self) except -1:
+        cdef _Column column
+        for column in self.decode_columns:
+            column.truncate(self.length)
+
+    cdef int discard(self) except -1:
+        self.length = 0
+        self.discard_partial()
+
+    cdef dict finish(self):
+        cdef _Column column
+        cdef Py_ssize_t length = self.length
+        self.length = 0
+        return {column.name: column.finish(length, None) for column in self.output_columns}
@@ -0,0 +1,589 @@
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from cpython.ref cimport PyObject
+from cpython.unicode cimport PyUnicode_DecodeUTF8
+
+# A compiled program is a flat list of operations, run in order by `_Program.decode()` or `_Program.encode()`.
+# Nested records are inlined into the program of the type that contains them: an OP_RECORD operation starts
+# a new frame (a list of field values), the field operations read from/write to that frame, and OP_END closes it.
+# Arrays, maps and unions hold a separate program for their items, as these are run a variable number of times.
+cdef enum _OpCode:
+    OP_GENERIC      # obj: the type, encoded/decoded through the normal AvroType methods
+    OP_LEAF         # obj: the type, encoded via _binary_buffer_encode (encode only)
+    OP_SKIP         # obj: the type of a writer-only field (decode only)
+    OP_CONST        # extra: the value to decode to (decode only)
+    OP_NULL
+    OP_BOOL
+    OP_INT
+    OP_LONG
+    OP_FLOAT
+    OP_DOUBLE
+    OP_STRING       # extra: the unicode error handling scheme, as bytes
+    OP_BYTES
+    OP_FIXED        # count: the size
+    OP_ENUM         # extra: the symbols
+    OP_RECORD       # decode: count: the number of fields. encode: extra: a _RecordEncoder, jump: the index of the matching OP_END
+    OP_DICT_RECORD  # decode only
+    OP_END          # decode: extra: the record class, or None for dicts
+    OP_ARRAY        # extra: the item _Program
+    OP_MAP          # extra: (key _Program, value _Program)
+    OP_UNION        # extra: a _UnionPlan
+    OP_CALL         # extra: the _Program of a recursive type
+
+
+cdef struct _Op:
+    int code
+    # Where the value is stored (decode), or read from (encode), in the current frame. -1 for the program's value
+    Py_ssize_t slot
+    # The field name, when decoding into a dict frame
+    PyObject *key
+    Py_ssize_t count
+    Py_ssize_t jump
+    PyObject *obj
+    PyObject *extra
+
+
+@cython.final
+cdef class _Program:
+    # A flattened encode or decode plan for a single type
+
+    cdef AvroType avro_type
+    cdef _Op *ops
+    cdef Py_ssize_t num_ops
+    # Holds references to the objects pointed to by `ops`
+    cdef list refs
+
+    def __init__(self, AvroType avro_type):
+        self.avro_type = avro_type
+
+    def __dealloc__(self):
+        PyMem_Free(self.ops)
+
+    cdef int set_ops(self, list ops) except -1:
+        cdef Py_ssize_t i
+        cdef _Op *op
+        self.ops = <_Op*>PyMem_Malloc(max(len(ops), 1) * sizeof(_Op))
+        if self.ops == NULL:
+            raise MemoryError()
+        self.refs = ops
+        for i, (code, slot, key, count, jump, obj, extra) in enumerate(ops):
+            op = &self.ops[i]
+            op.code = code
+            op.slot = slot
+            op.key = NULL if key is None else <PyObject*>key
+            op.count = count
+            op.jump = jump
+            op.obj = <PyObject*>obj
+            op.extra = <PyObject*>extra
+        self.num_ops = len(ops)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef object decode(self, _Reader buffer):
+        cdef MemoryReader mem = buffer if isinstance(buffer, MemoryReader) else None
+        cdef _Op *op
+        cdef Py_ssize_t i
+        cdef object frame = None
+        cdef list frames = None
+        cdef object result = None
+        cdef Record rec
+        cdef type record_cls
+        cdef uint64_t length
+        cdef const uint8_t *ptr
+        cdef float float_val
+        cdef double double_val
+        for i in range(self.num_ops):
+            op = &self.ops[i]
+            if op.code == OP_LONG:
+                value = zigzag_decode_long(buffer)
+            elif op.code == OP_INT:
+                value = zigzag_decode_int(buffer)
+            elif op.code == OP_STRING:
+                if mem is None:
+                    value = (<AvroType><object>op.obj)._binary_buffer_decode(buffer)
+                else:
+                    length = zigzag_decode_long(mem)
+                    ptr = mem.advance(length)
+                    value = PyUnicode_DecodeUTF8(<const char*>ptr, length, <bytes><object>op.extra)
+            elif op.code == OP_DOUBLE:
+                if mem is None:
+                    value = (<AvroType><object>op.obj)._binary_buffer_decode(buffer)
+                else:
+                    memcpy(&double_val, mem.advance(8), 8)
+                    value = double_val
+            elif op.code == OP_FLOAT:
+                if mem is None:
+                    value = (<AvroType><object>op.obj)._binary_buffer_decode(buffer)
+                else:
+                    memcpy(&float_val, mem.advance(4), 4)
+                    value = float_val
+            elif op.code == OP_BOOL:
+                value = True if buffer.read_u8() else False
+            elif op.code == OP_NULL:
+                value = None
+            elif op.code == OP_BYTES:
+                length = zigzag_decode_long(buffer)
+                value = buffer.read_bytes(length)
+            elif op.code == OP_FIXED:
+                value = buffer.read_bytes(op.count)
+            elif op.code == OP_ENUM:
+                value = (<object>op.extra)[zigzag_decode_long(buffer)]
+            elif op.code == OP_RECORD:
+                if frames is None:
+                    frames = []
+                frames.append(frame)
+                frame = [None] * op.count
+                continue
+            elif op.code == OP_DICT_RECORD:
+                if frames is None:
+                    frames = []
+                frames.append(frame)
+                frame = {}
+                continue
+            elif op.code == OP_END:
+                if <object>op.extra is None:
+                    value = frame
+                else:
+                    record_cls = <type><object>op.extra
+                    rec = Record.__new__(record_cls)
+                    rec.data = frame
+                    value = rec
+                frame = frames.pop()
+            elif op.code == OP_SKIP:
+                (<AvroType><object>op.obj).binary_buffer_skip(buffer)
+                continue
+            elif op.code == OP_CONST:
+                value = <object>op.extra
+            elif op.code == OP_ARRAY:
+                value = _decode_array(<_Program><object>op.extra, buffer)
+            elif op.code == OP_MAP:
+                value = _decode_map(<tuple><object>op.extra, buffer)
+            elif op.code == OP_UNION:
+                value = (<_UnionPlan><object>op.extra).decode(buffer)
+            elif op.code == OP_CALL:
+                value = (<_Program><object>op.extra).decode(buffer)
+            else:
+                value = (<AvroType><object>op.obj).binary_buffer_decode(buffer)
+
+            if op.slot < 0:
+                result = value
+            elif op.key != NULL:
+                (<dict>frame)[<object>op.key] = value
+            else:
+                (<list>frame)[op.slot] = value
+        return result
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef int encode(self, _Writer buffer, value) except -1:
+        cdef _Op *op
+        cdef Py_ssize_t i = 0
+        cdef list frame = None
+        cdef list frames = None
+        cdef list fields
+        while i < self.num_ops:
+            op = &self.ops[i]
+            item = value if op.slot < 0 else frame[op.slot]
+            if op.code == OP_LONG:
+                if type(item) is int:
+                    zigzag_encode_long(buffer, item)
+                else:
+                    (<AvroType><object>op.obj)._binary_buffer_encode(buffer, item)
+            elif op.code == OP_INT:
+                if type(item) is int:
+                    zigzag_encode_int(buffer, item)
+                else:
+                    (<AvroType><object>op.obj)._binary_buffer_encode(buffer, item)
+            elif op.code == OP_LEAF:
+                (<AvroType><object>op.obj)._binary_buffer_encode(buffer, item)
+            elif op.code == OP_RECORD:
+                fields = (<_RecordEncoder><object>op.extra).field_values(item)
+                if fields is None:
+                    # Not a plain record or dict value, so let the record type handle it
+                    (<AvroType><object>op.obj).binary_buffer_encode(buffer, item)
+                    i = op.jump + 1
+                    continue
+                if frames is None:
+                    frames = []
+                frames.append(frame)
+                frame = fields
+            elif op.code == OP_END:
+                frame = frames.pop()
+            elif op.code == OP_ARRAY:
+                _encode_array(<AvroType><object>op.obj, <_Program><object>op.extra, buffer, item)
+            elif op.code == OP_MAP:
+                _encode_map(<AvroType><object>op.obj, <tuple><object>op.extra, buffer, item)
+            elif op.code == OP_UNION:
+                (<_UnionPlan><object>op.extra).encode(buffer, item)
+            elif op.code == OP_CALL:
+                (<_Program><object>op.extra).encode(buffer, item)
+            else:
+                (<AvroType><object>op.obj).binary_buffer_encode(buffer, item)
+            i += 1
+
+
+cdef list _decode_array(_Program item, _Reader buffer):
+    cdef list out = []
+    cdef int64_t count
+    while True:
+        count = zigzag_decode_long(buffer)
+        if count == 0:
+            return out
+        if count < 0:
+            # Negative counts are followed by the size of the block in bytes
+            count = -count
+            zigzag_decode_long(buffer)
+        while count:
+            out.append(item.decode(buffer))
+            count -= 1
+
+
+cdef dict _decode_map(tuple programs, _Reader buffer):
+    cdef _Program key_program = programs[0]
+    cdef _Program value_program = programs[1]
+    cdef dict out = {}
+    cdef int64_t count
+    cdef str key
+    while True:
+        count = zigzag_decode_long(buffer)
+        if count == 0:
+            return out
+        if count < 0:
+            count = -count
+            zigzag_decode_long(buffer)
+        while count:
+            key = key_program.decode(buffer)
+            out[key] = value_program.decode(buffer)
+            count -= 1
+
+
+cdef int _encode_array(AvroType array_type, _Program item, _Writer buffer, value) except -1:
+    if type(value) is not list and type(value) is not tuple:
+        # e.g. numpy arrays, or other iterables
+        return array_type.binary_buffer_encode(buffer, value)
+    if len(value):
+        zigzag_encode_long(buffer, len(value))
+        for item_value in value:
+            item.encode(buffer, item_value)
+    zigzag_encode_long(buffer, 0)
+
+
+cdef int _encode_map(AvroType map_type, tuple programs, _Writer buffer, value) except -1:
+    cdef _Program key_program = programs[0]
+    cdef _Program value_program = programs[1]
+    if type(value) is not dict:
+        return map_type.binary_buffer_encode(buffer, value)
+    zigzag_encode_long(buffer, len(value))
+    if value:
+        for key, item_value in (<dict>value).items():
+            key_program.encode(buffer, key)
+            value_program.encode(buffer, item_value)
+        zigzag_encode_long(buffer, 0)
+
+
+@cython.final
+cdef class _UnionPlan:
+
+    cdef UnionType union_type
+    cdef tuple programs
+    # The type name to return a (name, value) tuple with, for each member, or None
+    cdef tuple type_names
+
+    def __init__(self, UnionType union_type, tuple programs):
+        cdef AvroType member
+        self.union_type = union_type
+        self.programs = programs
+        self.type_names = tuple(
+            member.type if is_tuple else None
+            for member, is_tuple in zip(union_type.union_types, union_type.return_type_tuple)
+        )
+
+    cdef object decode(self, _Reader buffer):
+        cdef Py_ssize_t index = zigzag_decode_long(buffer)
+        if index < 0 or index >= len(self.programs):
+            raise ValueError(f"Value {index} is not valid for a union of {len(self.programs)} items")
+        decoded = (<_Program>self.programs[index]).decode(buffer)
+        type_name = self.type_names[index]
+        if type_name is not None:
+            return (type_name, decoded)
+        return decoded
+
+    cdef int encode(self, _Writer buffer, value) except -1:
+        cdef Py_ssize_t index = self.union_type.resolve_from_value(value)
+        zigzag_encode_long(buffer, index)
+        (<_Program>self.programs[index]).encode(buffer, value)
+
+
+@cython.final
+cdef class _RecordEncoder:
+    # Gets the field values to encode from a record or dict value
+
+    cdef type record
+    cdef tuple names
+    cdef tuple defaults
+    cdef bint encodes_dicts
+
+    def __init__(self, RecordType record_type):
+        cdef RecordField field
+        cdef Options options = record_type.options
+        self.record = record_type.record
+        self.names = tuple(field.name for field in record_type.fields)
+        self.defaults = tuple(field.default_value for field in record_type.fields)
+        # Only the default (permissive) options are handled here, other dicts are encoded by the record type
+        self.encodes_dicts = (
+            options.record_can_encode_dict and options.record_allow_extra_fields and options.record_encode_use_defaults
+        )
+
+    cdef list field_values(self, value):
+        # Returns None if the value should be encoded by the record type instead
+        cdef list values
+        cdef Py_ssize_t i
+        if isinstance(value, self.record):
+            values = (<Record>value)._field_data()
+        elif type(value) is dict and self.encodes_dicts:
+            values = [(<dict>value).get(self.names[i], self.defaults[i]) for i in range(len(self.names))]
+        else:
+            return None
+        for item in values:
+            if item is NO_DEFAULT:
+                return None
+        return values
+
+
+cdef dict _DECODE_LEAVES = {
+    NullType: OP_NULL,
+    BoolType: OP_BOOL,
+    IntType: OP_INT,
+    LongType: OP_LONG,
+    FloatType: OP_FLOAT,
+    DoubleType: OP_DOUBLE,
+    StringType: OP_STRING,
+    BytesType: OP_BYTES,
+    FixedType: OP_FIXED,
+    EnumType: OP_ENUM,
+}
+
+cdef dict _ENCODE_LEAVES = {
+    NullType: OP_LEAF,
+    BoolType: OP_LEAF,
+    IntType: OP_INT,
+    LongType: OP_LONG,
+    FloatType: OP_LEAF,
+    DoubleType: OP_LEAF,
+    StringType: OP_LEAF,
+    BytesType: OP_LEAF,
+    FixedType: OP_LEAF,
+    EnumType: OP_LEAF,
+}
+
+
+cdef class _Compiler:
+    # Builds the _Programs for a type, sharing programs between uses of the same type
+
+    cdef bint encoding
+    cdef dict programs  # id(type) -> _Program
+
+    def __init__(self, bint encoding):
+        self.encoding = encoding
+        self.programs = {}
+
+    cdef _Program program(self, AvroType avro_type):
+        cdef _Program program = self.programs.get(id(avro_type))
+        cdef list ops
+        if program is None:
+            program = _Program(avro_type)
+            # Registered before compiling, so that recursive types refer back to this program
+            self.programs[id(avro_type)] = program
+            ops = []
+            self.emit(ops, avro_type, -1, None, frozenset())
+            program.set_ops(ops)
+        return program
+
+    cdef int emit(self, list ops, AvroType avro_type, Py_ssize_t slot, str key, frozenset active) except -1:
+        if self.encoding:
+            return self._emit_encode(ops, avro_type, slot, active)
+        return self._emit_decode(ops, avro_type, slot, key, active)
+
+    cdef int _emit_decode(self, list ops, AvroType avro_type, Py_ssize_t slot, str key, frozenset active) except -1:
+        cdef RecordType record_type
+        cdef RecordField field
+        cdef Py_ssize_t index
+        cdef Py_ssize_t field_slot
+        type_cls = type(avro_type)
+        if avro_type.value_adapters:
+            ops.append((OP_GENERIC, slot, key, 0, 0, avro_type, None))
+        elif type_cls in _DECODE_LEAVES:
+            extra = None
+            count = 0
+            if type_cls is StringType:
+                extra = avro_type.options.unicode_errors.encode('ascii')
+            elif type_cls is EnumType:
+                extra = (<EnumType>avro_type).symbols
+            elif type_cls is FixedType:
+                count = (<FixedType>avro_type).size
+            ops.append((_DECODE_LEAVES[type_cls], slot, key, count, 0, avro_type, extra))
+        elif type_cls is _PlaceholderType:
+            ops.append((OP_CONST, slot, key, 0, 0, avro_type, (<_PlaceholderType>avro_type).default_value))
+        elif type_cls is RecordType or type_cls is PromotingRecordType:
+            record_type = avro_type
+            if record_type.options.record_decodes_lazily and not record_type.options.record_decodes_to_dict:
+                # Lazy records skip over their fields, so there is nothing to flatten
+                ops.append((OP_GENERIC, slot, key, 0, 0, avro_type, None))
+                return 0
+            if record_type in active:
+                ops.append((OP_CALL, slot, key, 0, 0, avro_type, self.program(avro_type)))
+                return 0
+            active = active | {record_type}
+            if record_type.options.record_decodes_to_dict:
+                ops.append((OP_DICT_RECORD, 0, None, 0, 0, avro_type, None))
+                for field in record_type.fields:
+                    if field.name is None:
+                        ops.append((OP_SKIP, 0, None, 0, 0, field.type, None))
+                    else:
+                        self._emit_decode(ops, field.type, 0, field.name, active)
+                ops.append((OP_END, slot, key, 0, 0, avro_type, None))
+                return 0
+            ops.append((OP_RECORD, 0, None, len(record_type.fields), 0, avro_type, None))
+            for index, field in enumerate(record_type.fields):
+                field_slot = index
+                if type_cls is PromotingRecordType:
+                    field_slot = (<PromotingRecordType>record_type).decode_indexes[index]
+                if field_slot < 0:
+                    ops.append((OP_SKIP, 0, None, 0, 0, field.type, None))
+                else:
+                    self._emit_decode(ops, field.type, field_slot, None, active)
+            ops.append((OP_END, slot, key, 0, 0, avro_type, record_type.record))
+        elif type_cls is ArrayType and not self._decodes_to_numpy(avro_type):
+            ops.append((OP_ARRAY, slot, key, 0, 0, avro_type, self.program((<ArrayType>avro_type).item_type)))
+        elif type_cls is MapType:
+            extra = (self.program((<MapType>avro_type).key_type), self.program((<MapType>avro_type).value_type))
+            ops.append((OP_MAP, slot, key, 0, 0, avro_type, extra))
+        elif type_cls is UnionType:
+            ops.append((OP_UNION, slot, key, 0, 0, avro_type, self._union_plan(avro_type)))
+        else:
+            ops.append((OP_GENERIC, slot, key, 0, 0, avro_type, None))
+
+    cdef bint _decodes_to_numpy(self, ArrayType array_type):
+        if not array_type.options.array_decodes_to_numpy or array_type.item_type.value_adapters:
+            return False
+        return type(array_type.item_type) in NUMPY_ITEM_DTYPES
+
+    cdef int _emit_encode(self, list ops, AvroType avro_type, Py_ssize_t slot, frozenset active) except -1:
+        cdef RecordType record_type
+        cdef RecordField field
+        cdef Py_ssize_t index
+        cdef Py_ssize_t start
+        type_cls = type(avro_type)
+        if avro_type.value_adapters or avro_type.options.allow_tuple_notation:
+            ops.append((OP_GENERIC, slot, None, 0, 0, avro_type, None))
+        elif type_cls in _ENCODE_LEAVES:
+            ops.append((_ENCODE_LEAVES[type_cls], slot, None, 0, 0, avro_type, None))
+        elif type_cls is RecordType:
+            record_type = avro_type
+            if record_type in active:
+                ops.append((OP_CALL, slot, None, 0, 0, avro_type, self.program(avro_type)))
+                return 0
+            active = active | {record_type}
+            start = len(ops)
+            ops.append(None)
+            for index, field in enumerate(record_type.fields):
+                self._emit_encode(ops, field.type, index, active)
+            ops[start] = (OP_RECORD, slot, None, 0, len(ops), avro_type, _RecordEncoder(record_type))
+            # The end reads nothing from the frame
+            ops.append((OP_END, -1, None, 0, 0, avro_type, None))
+        elif type_cls is ArrayType:
+            ops.append((OP_ARRAY, slot, None, 0, 0, avro_type, self.program((<ArrayType>avro_type).item_type)))
+        elif type_cls is MapType:
+            extra = (self.program((<MapType>avro_type).key_type), self.program((<MapType>avro_type).value_type))
+            ops.append((OP_MAP, slot, None, 0, 0, avro_type, extra))
+        elif type_cls is UnionType:
+            ops.append((OP_UNION, slot, None, 0, 0, avro_type, self._union_plan(avro_type)))
+        else:
+            ops.append((OP_GENERIC, slot, None, 0, 0, avro_type, None))
+
+    cdef _UnionPlan _union_plan(self, UnionType union_type):
+        return _UnionPlan(union_type, tuple(self.program(member) for member in union_type.union_types))
+
+
+@cython.final
+cdef class CompiledSchema:
+
+    """
+    A `Schema` that has been compiled into flat encode and decode programs, as returned by `Schema.compile()`.
+
+    Nested records are inlined into a single list of operations, and types without value adapters are
+    encoded and decoded directly, rather than through the per-type methods used by `Schema`.
+    Values are encoded and decoded exactly as they are by the schema.
+    """
+
+    cdef readonly Schema schema
+    cdef _Program decoder
+    cdef _Program encoder
+
+    def __init__(self, Schema schema):
+        self.schema = schema
+        self.decoder = _Compiler(False).program(schema.type)
+        self.encoder = _Compiler(True).program(schema.type)
+
+    def binary_decode(self, value) -> object:
+        """
+        Decode `value` (any object supporting the buffer protocol) and return the decoded value.
+        """
+        return self.decoder.decode(MemoryReader(value))
+
+    def binary_decode_many(self, value, count=None) -> list:
+        """
+        Decode consecutive values from `value`, as for `Schema.binary_decode_many()`.
+        """
+        cdef MemoryReader buffer = MemoryReader(value)
+        cdef list values = []
+        cdef Py_ssize_t i
+        if count is not None:
+            if count < 0:
+                raise ValueError(f"count must not be negative, got: {count}")
+            for i in range(count):
+                values.append(self.decoder.decode(buffer))
+            return values
+        while buffer.ptr < buffer.end_ptr:
+            values.append(self.decoder.decode(buffer))
+        return values
+
+    cpdef binary_read(self, _Reader reader):
+        """
+        Read a single value from `reader`.
+        """
+        return self.decoder.decode(reader)
+
+    cdef int _encode(self, MemoryWriter buffer, value) except -1:
+        cdef size_t start = buffer.len
+        try:
+            self.encoder.encode(buffer, value)
+        except Exception:
+            # Encode again through the schema, so invalid values raise exactly the same errors
+            buffer.len = start
+            self.schema.type.binary_buffer_encode(buffer, value)
+
+    def binary_encode(self, value) -> bytes:
+        """
+        Encode `value` and return the avro bytes representing it.
+        """
+        cdef MemoryWriter buffer = self.schema._take_scratch()
+        try:
+            self._encode(buffer, value)
+            return buffer.bytes()
+        finally:
+            self.schema._release_scratch(buffer)
+
+    cpdef binary_write(self, _Writer writer, value):
+        """
+        Encode `value`, and write it to `writer`.
+        """
+        cdef MemoryWriter buffer
+        if isinstance(writer, MemoryWriter):
+            self._encode(writer, value)
+            return
+        buffer = self.schema._take_scratch()
+        try:
+            self._encode(buffer, value)
+            writer.write_n(buffer.view())
+        finally:
+            self.schema._release_scratch(buffer)
@@ -1,3 +1,5 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 import uuid
 
@@ -8,6 +10,11 @@ OBJ_FILE_METADATA = Schema({"type": "map", "values": "bytes"}, bytes_codec='utf8
 
 _SLICE_TYPE = type(OBJ_MAGIC)
 
+DEFAULT_READ_BUFFER_SIZE = 256 * 1024
+DEFAULT_WRITE_BUFFER_SIZE = 64 * 1024
+
+cdef Py_ssize_t MARKER_SIZE = 16
+
 
 cdef int viewcmp(const uint8_t[:] a, const uint8_t[:] b):
     if len(a) != len(b):
@@ -15,26 +22,30 @@ cdef int viewcmp(const uint8_t[:] a, const uint8_t[:] b):
     return memcmp(&a[0], &b[0], len(a))
 
 
-cdef _Reader make_reader(src):
+cdef _Reader make_reader(src, Py_ssize_t buffer_size=0, bint use_mmap=False):
     if isinstance(src, _Reader):
         return src
+    if use_mmap:
+        if not isinstance(src, (str, Path)):
+            raise ValueError(f"Memory-mapping is only supported when reading from a path, got: '{src}'")
+        return MmapReader(src)
     elif isinstance(src, bytes):
         return MemoryReader(src)
     elif isinstance(src, (str, Path)):
-        return FileReader(Path(src).open('rb'))
+        return FileReader(Path(src).open('rb'), buffer_size)
     elif hasattr(src, 'read'):
-        return FileReader(src)
+        return FileReader(src, buffer_size)
     else:
         raise NotImplementedError(f"Cannot read from '{src}'")
 
 
-cdef _Writer make_writer(src):
+cdef _Writer make_writer(src, Py_ssize_t buffer_size=0):
     if isinstance(src, _Writer):
         return src
     elif isinstance(src, (str, Path)):
-        return FileWriter(Path(src).open('wb'))
+        return FileWriter(Path(src).open('wb'), buffer_size)
     elif hasattr(src, 'write'):
-        return FileWriter(src)
+        return FileWriter(src, buffer_size)
     raise NotImplementedError(f"Cannot write to '{src}'")
     
 
@@ -53,6 +64,28 @@ cdef class ContainerReader:
      * `src`: The source to read from. Can be a file-like object, instance of `cavro.MemoryReader`, or a path to a file (str|Path)
      * `reader_schema`: The schema to use when reading objects. If not provided, the writer schema will be used.
      * `options`: An Options object to use when constructing the writer schema. Defaults to the default options. This does not affect the `reader_schema` options.
+     * `buffer_size`:
+        The size of the read-ahead window used when reading from files, `0` disables buffering.
+        Defaults to `DEFAULT_READ_BUFFER_SIZE` (256 KiB) when `src` is a path, and `0` for file-like objects,
+        as buffered reads may go past the end of the container, leaving the file object at an arbitrary position.
+     * `use_mmap`:
+        If `True`, `src` must be a path, and the file is memory-mapped (see `MmapReader`) rather than read.
+        Blocks using the `null` codec are then decoded directly from the mapping, without being copied. Defaults to `False`.
+     * `decompress_workers`:
+        If > 0, compressed blocks are decompressed by a pool of this many threads, reading ahead of the objects being decoded.
+        Has no effect for the `null` codec. Defaults to `0` (decompress each block when it's needed).
+        Use the reader as a context manager, or call `close()`, to stop the threads.
+     * `prefetch_blocks`: The maximum number of blocks to read ahead when `decompress_workers` is used.  Defaults to `2 * decompress_workers`.
+     * `index`:
+        A `BlockIndex` for this container, used by `seek_block()` and `seek_record()`.
+        If not provided, one is built (see `build_index()`) the first time it's needed.
+     * `start`, `end`:
+        Restrict reading to the blocks whose sync marker starts within the byte range [`start`, `end`) of the file.
+        The reader skips forward from `start` to the next sync marker, so a set of contiguous ranges covering the file
+        (see `container_splits()`) will read each block exactly once.  Requires a seekable source.
+     * `where`:
+        A `Predicate` (see `field()`) that objects must match to be returned.  Only the fields used by the predicate are
+        decoded for objects that do not match, the rest of the object is skipped over.  Requires a record schema.
     """
 
     cdef readonly object metadata
@@ -62,16 +95,45 @@ cdef class ContainerReader:
     cdef readonly Schema schema
     cdef readonly str codec_name
     cdef readonly size_t objects_left_in_block
+    cdef readonly BlockIndex index
+    cdef Py_ssize_t data_start
+    cdef Py_ssize_t end
     cdef MemoryReader current_block
+    cdef _ColumnarDecoder columns
+    cdef readonly Predicate where
+    cdef _FieldExtractor where_fields
     cdef Codec codec
     cdef _Reader reader
 
-    def __init__(self, src, reader_schema=None, options=DEFAULT_OPTIONS):
-        self.reader = make_reader(src)
+    cdef object executor
+    cdef object prefetched
+    cdef Py_ssize_t prefetch_blocks
+    cdef bint framing_done
+    cdef object framing_error
+    cdef bint owns_source
+    cdef bint closed
+    cdef int decompress_workers
+
+    def __init__(self, src, reader_schema=None, options=DEFAULT_OPTIONS, buffer_size=None, bint use_mmap=False, int decompress_workers=0, prefetch_blocks=None, BlockIndex index=None, start=None, end=None, Predicate where=None):
+        if decompress_workers < 0:
+            raise ValueError(f"decompress_workers must not be negative, got: {decompress_workers}")
+        if prefetch_blocks is None:
+            prefetch_blocks = 2 * decompress_workers
+        elif decompress_workers and prefetch_blocks < 1:
+            raise ValueError(f"prefetch_blocks must be at least 1, got: {prefetch_blocks}")
+        if buffer_size is None:
+            buffer_size = DEFAULT_READ_BUFFER_SIZE if isinstance(src, (str, Path)) else 0
+        self.reader = make_reader(src, buffer_size, use_mmap)
+        self.owns_source = isinstance(src, (str, Path))
         cdef const uint8_t[:] header = self.reader.read_n(4)
         if viewcmp(header, OBJ_MAGIC):
             raise ValueError(f"Invalid file header, expected: {bytes(OBJ_MAGIC)} got {bytes(header)}")
         self.metadata = OBJ_FILE_METADATA.binary_read(self.reader)
+        try:
+            self.data_start = self.reader.tell()
+        except (OSError, AttributeError, NotImplementedError):
+            # Not seekable, so cannot be indexed
+            self.data_start = -1
         writer_options = options
         if reader_schema is not None:
             writer_options = writer_options.replace(allow_invalid_default_values=True)
@@ -88,37 +150,439 @@ cdef class ContainerReader:
             self.codec = CODECS[codec_name]
         except KeyError:
             raise CodecUnavailable(f"Unsupported codec: '{codec_name.decode('utf-8')}'")
+        if index is not None and index.codec_name != self.codec_name:
+            raise ValueError(f"Index is for a container using the '{index.codec_name}' codec, not '{self.codec_name}'")
+        self.index = index
+        if where is not None:
+            self.where_fields = _FieldExtractor.for_predicate(self.schema, where)
+        self.where = where
         self.objects_left_in_block = 0
-        self.current_block = MemoryReader(empty_buffer)
+        self.current_block = MemoryReader(b'')
         self.marker = b''
+        self.end = -1
+        if start is not None or end is not None:
+            self._seek_split(start or 0, -1 if end is None else end)
+        if decompress_workers and not isinstance(self.codec, _NullCodec):
+            self.decompress_workers = decompress_workers
+            self.prefetched = deque()
+            self.prefetch_blocks = prefetch_blocks
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def close(self):
+        """
+        Stop any decompression threads, and close the source file if the reader opened it (i.e. `src` was a path).
+        No more blocks are read after closing.
+        """
+        if self.prefetched is not None:
+            for _, future in self.prefetched:
+                future.cancel()
+            self.prefetched.clear()
+            self.framing_done = True
+        self.closed = True
+        if self.owns_source:
+            # Views of a memory mapped source must be released before it can be closed,
+            # including those held by decompression tasks that are already running
+            self._shutdown_executor(wait=True)
+            self.objects_left_in_block = 0
+            self.current_block._reset_to(b'')
+            if isinstance(self.reader, MmapReader):
+                self.reader.close()
+            else:
+                (<FileReader>self.reader).file_obj.close()
+            self.owns_source = False
+        else:
+            self._shutdown_executor()
+
+    cdef object _decompress_executor(self):
+        # The pool is shut down once the end of the container is reached, and restarted if the reader seeks back
+        if self.executor is None:
+            if self.closed:
+                raise ValueError("ContainerReader is closed")
+            self.executor = ThreadPoolExecutor(self.decompress_workers, thread_name_prefix='cavro-decompress')
+        return self.executor
+
+    cdef int _shutdown_executor(self, bint wait=False) except -1:
+        if self.executor is not None:
+            # Blocks already submitted are still decompressed
+            self.executor.shutdown(wait=wait)
+            self.executor = None
 
     cpdef _read_marker(self):
-        value = self.reader.read_n(16)
+        value = self.reader.read_n(MARKER_SIZE)
         if not len(self.marker):
-            self.marker = value
+            # Copied, so that the marker doesn't hold a view of a memory mapped source
+            self.marker = bytes(value)
         else:
             if viewcmp(value, self.marker):
                 raise ValueError(f"Invalid block sync marker, expected {bytes(self.marker)}, got {bytes(value)}")
 
+    cdef int _seek_split(self, Py_ssize_t start, Py_ssize_t end) except -1:
+        if self.data_start < 0:
+            raise ValueError("Reading a byte range of a container requires a seekable source")
+        self.reader.seek(self.data_start)
+        self._read_marker()
+        self.end = end
+        self.objects_left_in_block = 0
+        self.current_block._reset_to(b'')
+        if start <= self.data_start:
+            self.reader.seek(self.data_start)
+            return 0
+        cdef Py_ssize_t marker_pos = self._find_marker(start)
+        if marker_pos < 0:
+            # No blocks start in this range
+            self.end = 0
+        else:
+            self.reader.seek(marker_pos)
+
+    cdef Py_ssize_t _find_marker(self, Py_ssize_t position) except -2:
+        # Return the position of the first sync marker at, or after `position`, or -1 if there isn't one
+        cdef uint8_t window[16]
+        cdef const uint8_t[:] marker = self.marker
+        cdef Py_ssize_t found = 0
+        try:
+            self.reader.seek(position)
+            while True:
+                if found == MARKER_SIZE:
+                    if memcmp(window, &marker[0], MARKER_SIZE) == 0:
+                        return self.reader.tell() - MARKER_SIZE
+                    memmove(window, window + 1, MARKER_SIZE - 1)
+                    found -= 1
+                window[found] = self.reader.read_u8()
+                found += 1
+        except EOFError:
+            return -1
+
+    cdef bint _past_end(self) except -1:
+        return self.end >= 0 and self.reader.tell() >= self.end
+
+    cdef int _prefetch_blocks(self) except -1:
+        cdef Py_ssize_t count
+        cdef size_t block_size
+        while not self.framing_done and len(self.prefetched) < self.prefetch_blocks:
+            if self._past_end():
+                self.framing_done = True
+                self._shutdown_executor()
+                break
+            try:
+                self._read_marker()
+            except (EOFError, ValueError) as e:
+                # Iteration stops quietly here, as in next_block(), but verify() reports the error
+                self.framing_error = e
+                self.framing_done = True
+                self._shutdown_executor()
+                break
+            try:
+                count = zigzag_decode_long(self.reader)
+            except (EOFError, ValueError) as e:
+                # Running out of data after a marker is the normal end of the container
+                if not isinstance(e, EOFError):
+                    self.framing_error = e
+                self.framing_done = True
+                self._shutdown_executor()
+                break
+            try:
+                block_size = zigzag_decode_long(self.reader)
+                if block_size > 0:
+                    future = self._decompress_executor().submit(self.codec.decompress, self.reader.read_n(block_size))
+                else:
+                    future = Future()
+                    future.set_result(b'')
+            except Exception as e:
+                # Report the error once the consumer reaches this block
+                future = Future()
+                future.set_exception(e)
+                self.framing_done = True
+                self._shutdown_executor()
+            self.prefetched.append((count, future))
+
+    cdef int _next_prefetched_block(self) except -1:
+        if not self.prefetched:
+            self._prefetch_blocks()
+            if not self.prefetched:
+                raise StopIteration()
+        count, future = self.prefetched.popleft()
+        self._prefetch_blocks()
+        cdef const uint8_t[:] block_bytes = future.result()
+        self.objects_left_in_block = count
+        self.current_block._reset_to(block_bytes)
+
     cdef int next_block(self) except -1:
+        if self.prefetched is not None:
+            return self._next_prefetched_block()
+        if self._past_end():
+            raise StopIteration()
         try:
             self._read_marker()
             self.objects_left_in_block = zigzag_decode_long(self.reader)
         except (EOFError, ValueError) as e:
             raise StopIteration() from e
+        self._read_block_data()
+
+    cdef int _read_block_data(self) except -1:
         cdef size_t block_size = zigzag_decode_long(self.reader)
         cdef const uint8_t[:] block_bytes
         if block_size > 0:
             block_bytes = self.codec.read_block(self.reader, block_size)
         else:
-            block_bytes = empty_buffer
+            block_bytes = b''
         self.current_block._reset_to(block_bytes)
 
-    cpdef object next_object(self):
+    def build_index(self, bint decompress=False):
+        """
+        Scan the block framing of the container, and return a `BlockIndex` describing it.
+        The index is also stored as `self.index`.
+
+        Block data is skipped rather than decompressed, so the uncompressed size of blocks is only known
+        for the `null` codec, unless `decompress` is `True`.  An incomplete block at the end of the file is not indexed,
+        a block followed by an invalid sync marker raises `ValueError`.
+
+        The source must be seekable, the current read position is restored afterwards.
+        """
+        if self.data_start < 0:
+            raise ValueError("Cannot index a container that does not support seeking")
+        cdef Py_ssize_t position = self.reader.tell()
+        cdef list blocks = []
+        cdef bytes marker = b''
+        cdef Py_ssize_t offset, count, size
+        cdef Py_ssize_t first_record = 0
+        cdef bint is_null = isinstance(self.codec, _NullCodec)
+        self.reader.seek(self.data_start)
+        try:
+            marker = self.reader.read_bytes(MARKER_SIZE)
+            while True:
+                offset = self.reader.tell()
+                count = zigzag_decode_long(self.reader)
+                size = zigzag_decode_long(self.reader)
+                if decompress and size > 0:
+                    uncompressed_size = len(self.codec.decompress(self.reader.read_n(size)))
+                else:
+                    self.reader.skip(size)
+                    uncompressed_size = size if (is_null or size == 0) else None
+                block_marker = self.reader.read_n(MARKER_SIZE)
+                if viewcmp(block_marker, marker):
+                    raise ValueError(f"Invalid block sync marker, expected {marker}, got {bytes(block_marker)}")
+                blocks.append(BlockInfo(offset, count, first_record, size, uncompressed_size))
+                first_record += count
+        except EOFError:
+            pass
+        finally:
+            self.reader.seek(position)
+        self.index = BlockIndex(marker, self.codec_name, blocks)
+        return self.index
+
+    cpdef seek_block(self, Py_ssize_t block):
+        """
+        Position the reader at the start of the given block, so that the next object returned is the first object in that block.
+        Negative values count back from the last block.
+        """
+        if self.index is None:
+            self.build_index()
+        cdef BlockInfo info = self.index.blocks[block]
+        if not len(self.marker):
+            self.marker = self.index.marker
+        if self.prefetched is not None:
+            for _, future in self.prefetched:
+                future.cancel()
+            self.prefetched.clear()
+            self.framing_done = False
+            self.framing_error = None
+        if self.columns is not None:
+            self.columns.discard()
+        self.reader.seek(info.offset - MARKER_SIZE)
+        self._read_marker()
+        self.objects_left_in_block = zigzag_decode_long(self.reader)
+        self._read_block_data()
+
+    cpdef seek_record(self, Py_ssize_t record):
+        """
+        Position the reader so that the next object returned is the `record`-th object in the container (counting from 0).
+        Records are counted whether or not they match `where`.
+        """
+        if self.index is None:
+            self.build_index()
+        cdef Py_ssize_t block = self.index.block_for_record(record)
+        self.seek_block(block)
+        cdef BlockInfo info = self.index.blocks[block]
+        cdef Py_ssize_t to_skip = record - info.first_record
+        for _ in range(to_skip):
+            self.schema.type.binary_buffer_skip(self.current_block)
+        self.objects_left_in_block -= to_skip
+
+    def verify(self, bint check_utf8=False) -> int:
+        """
+        Check that the rest of the container is well formed, without decoding any values, and return the number of values checked.
+
+        Each value is checked against the writer schema as for `Schema.validate_bytes()`, blocks must contain exactly their values,
+        and block sync markers must match.  The reader is left at the end of the container.
+
+        Raises `InvalidEncoding` for invalid values (with the offset into the decompressed block data),
+        and `ValueError` or `EOFError` if the block framing is damaged.
+        """
+        cdef AvroType writer_type = self.writer_schema.type
+        cdef MemoryReader block = self.current_block
+        cdef _Validator validator
+        cdef const uint8_t *ptr
+        cdef Py_ssize_t checked = 0
+        while True:
+            validator = _Validator(block, check_utf8)
+            ptr = block.ptr
+            while self.objects_left_in_block > 0:
+                try:
+                    ptr = writer_type.binary_buffer_validate(validator, ptr)
+                except InvalidEncoding as e:
+                    raise InvalidEncoding(f"Value {checked}: {e.reason}", e.offset) from None
+                self.objects_left_in_block -= 1
+                checked += 1
+            if ptr != block.end_ptr:
+                raise validator.error(ptr, f"{block.end_ptr - ptr} bytes of trailing data in block")
+            block.ptr = ptr
+            if self.prefetched is not None:
+                try:
+                    self._next_prefetched_block()
+                except StopIteration:
+                    if self.framing_error is not None:
+                        raise self.framing_error
+                    return checked
+                continue
+            if self._past_end():
+                return checked
+            # Unlike next_block(), a missing or invalid marker is an error
+            self._read_marker()
+            try:
+                self.objects_left_in_block = zigzag_decode_long(self.reader)
+            except EOFError:
+                return checked
+            self._read_block_data()
+
+    cdef bint _ensure_block(self) except -1:
+        # Returns False once the end of the container has been reached
         while self.objects_left_in_block < 1:
-            self.next_block()
-        self.objects_left_in_block -= 1
-        return self.schema.binary_read(self.current_block)
+            try:
+                self.next_block()
+            except StopIteration:
+                return False
+        return True
+
+    cdef bint _next_matches(self) except -1:
+        # Check the next object against `where`, leaving the block positioned at the start of the object if it
+        # matches, or after it if not.
+        cdef Py_ssize_t start = self.current_block.tell()
+        cdef dict values = {}
+        self.where_fields.extract(self.current_block, values)
+        if self.where.evaluate(values):
+            self.current_block.seek(start)
+            return True
+        self.where_fields.skip_rest(self.current_block)
+        return False
+
+    cdef list _read_objects(self, size_t count):
+        # Decode the next `count` objects from the current block, keeping those that match `where`
+        cdef list values
+        if self.where is None:
+            values = self.schema.binary_read_many(self.current_block, count)
+        else:
+            values = []
+            for _ in range(count):
+                if self._next_matches():
+                    values.append(self.schema.binary_read(self.current_block))
+        self.objects_left_in_block -= count
+        return values
+
+    cpdef list read_block_objects(self):
+        """
+        Return a list of the remaining objects in the current block, reading the next block first if the current one has been fully read.
+        Returns an empty list once the end of the container has been reached.
+        If `where` was given, blocks with no matching objects are passed over.
+        """
+        cdef list values = []
+        while not values and self._ensure_block():
+            values = self._read_objects(self.objects_left_in_block)
+        return values
+
+    cpdef list read_batch(self, Py_ssize_t n):
+        """
+        Return a list of (up to) the next `n` objects in the container, which may span multiple blocks.
+        The list will be shorter than `n` only when the end of the container is reached.
+        """
+        if n < 0:
+            raise ValueError(f"n must not be negative, got: {n}")
+        cdef list values = []
+        cdef size_t wanted
+        while len(values) < n and self._ensure_block():
+            wanted = min(<size_t>(n - len(values)), self.objects_left_in_block)
+            if values:
+                values.extend(self._read_objects(wanted))
+            else:
+                values = self._read_objects(wanted)
+        return values
+
+    def read_columns(self, Py_ssize_t batch_size=DEFAULT_COLUMN_BATCH_SIZE):
+        """
+        Decode (up to) the next `batch_size` records in the container into columns, without creating an object per record.
+
+        Returns a dict of field name to column, in reader schema field order.
+        Fields of nested records are flattened into separate columns, named with a `.` separated path, e.g. `'file.project'`.
+        Columns are:
+         * numpy arrays for `int`, `long`, `float`, `double` and `boolean` fields
+         * `BinaryColumn`s for `string` and `bytes` fields
+         * numpy masked arrays (or `BinaryColumn`s with a `validity` mask) for `["null", T]` unions of the above
+         * numpy object arrays of the normally decoded values for any other fields (including those with logical types)
+
+        Returns an empty dict once the end of the container has been reached.
+        The schema must be a record.  If `where` was given, only matching records are included.
+
+        If a record cannot be decoded, the error is raised and the reader is left at the start of that record.
+        Records decoded before it are returned by the next call.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got: {batch_size}")
+        if self.columns is None:
+            self.columns = _ColumnarDecoder(self.schema)
+        cdef size_t wanted
+        while self.columns.length < batch_size and self._ensure_block():
+            if self.where is not None:
+                if self._next_matches():
+                    self._decode_columns(1)
+                else:
+                    self.objects_left_in_block -= 1
+                continue
+            wanted = min(<size_t>(batch_size - self.columns.length), self.objects_left_in_block)
+            self._decode_columns(wanted)
+        if self.columns.length == 0:
+            return {}
+        return self.columns.finish()
+
+    cdef int _decode_columns(self, size_t count) except -1:
+        # Rows decoded before an error are kept, and returned by the next call to read_columns()
+        cdef Py_ssize_t before = self.columns.length
+        try:
+            self.columns.decode_rows(self.current_block, count)
+        finally:
+            self.objects_left_in_block -= self.columns.length - before
+
+    def iter_columns(self, Py_ssize_t batch_size=DEFAULT_COLUMN_BATCH_SIZE):
+        """
+        Yield the remaining records in the container as batches of columns, see `read_columns()`.
+        """
+        while True:
+            columns = self.read_columns(batch_size)
+            if not columns:
+                return
+            yield columns
+
+    cpdef object next_object(self):
+        while True:
+            while self.objects_left_in_block < 1:
+                self.next_block()
+            self.objects_left_in_block -= 1
+            if self.where is None or self._next_matches():
+                return self.schema.binary_read(self.current_block)
 
     def __iter__(self):
         return self
@@ -127,6 +591,27 @@ cdef class ContainerReader:
         return self.next_object()
 
 
+def container_splits(src, Py_ssize_t num_splits):
+    """
+    Divide an avro object container file into `num_splits` contiguous byte ranges of (roughly) equal size.
+
+    Returns a list of `(start, end)` tuples, that can be passed to `ContainerReader(src, start=start, end=end)`,
+    so that each block in the file is read by exactly one reader.
+    Small files may result in some ranges that contain no blocks.
+
+    Arguments:
+     * `src`: A path to a container file (str|Path)
+     * `num_splits`: The number of ranges to return
+    """
+    if num_splits < 1:
+        raise ValueError(f"num_splits must be at least 1, got: {num_splits}")
+    cdef Py_ssize_t size = Path(src).stat().st_size
+    return [
+        (size * i // num_splits, size * (i + 1) // num_splits)
+        for i in range(num_splits)
+    ]
+
+
 @cython.no_gc_clear
 cdef class ContainerWriter:
 
@@ -148,6 +633,13 @@ cdef class ContainerWriter:
      * `metadata`: A dictionary of metadata to write to the file. Defaults to an empty dictionary.
      * `marker`: A 16-byte marker to use to separate blocks. Defaults to a random UUID.
      * `options`: An Options object to use when writing. Defaults to the default options.
+     * `buffer_size`: 
+        The size of the staging buffer used when writing to files. Defaults to `DEFAULT_WRITE_BUFFER_SIZE` (64 KiB), `0` disables buffering.
+        Buffered data is always written out when a block is flushed, so the destination holds complete blocks only.
+     * `compress_workers`:
+        If > 0, full blocks are compressed by a pool of this many threads while encoding continues.
+        Blocks are still written in order, and `flush()`/`close()` wait for all outstanding blocks to be written.
+        Has no effect for the `null` codec. Defaults to `0` (compress each block as it is written).
     """
 
     cdef _Writer writer
@@ -168,9 +660,15 @@ cdef class ContainerWriter:
     
     cdef readonly dict metadata
 
-    def __cinit__(self, dest, Schema schema, str codec='null', size_t max_blocksize=16352, write_header=True, metadata=None, marker=None, options=DEFAULT_OPTIONS):
+    cdef object executor
+    cdef object compressing
+    cdef Py_ssize_t max_compressing
+
+    def __cinit__(self, dest, Schema schema, str codec='null', size_t max_blocksize=16352, write_header=True, metadata=None, marker=None, options=DEFAULT_OPTIONS, Py_ssize_t buffer_size=DEFAULT_WRITE_BUFFER_SIZE, int compress_workers=0):
         if schema is None:
             raise ValueError('Schema is required')
+        if compress_workers < 0:
+            raise ValueError(f"compress_workers must not be negative, got: {compress_workers}")
         self.should_write_header = write_header
         self.num_pending = 0
         self.pending_block = MemoryWriter(max_blocksize)
@@ -182,7 +680,7 @@ cdef class ContainerWriter:
             metadata = {}
         self.metadata = metadata
 
-        self.writer = make_writer(dest)
+        self.writer = make_writer(dest, buffer_size)
         try:
             self.schema = schema
             codec_b = codec.encode('utf8')
@@ -200,6 +698,10 @@ cdef class ContainerWriter:
             self.marker = marker
             self.max_blocksize = max_blocksize
             self.blocks_written = 0
+            if compress_workers and not isinstance(self.codec, _NullCodec):
+                self.executor = ThreadPoolExecutor(compress_workers, thread_name_prefix='cavro-compress')
+                self.compressing = deque()
+                self.max_compressing = 2 * compress_workers
         except:
             self.writer = None
             raise
@@ -239,23 +741,50 @@ cdef class ContainerWriter:
         if self.writer is None:
             raise ValueError('Trying to close a closed Container')
         cdef _Writer writer = self.writer
-        self._flush_block(self.blocks_written == 0)
+        self._flush_block(self.blocks_written == 0 and not self.compressing)
         self.writer = None
         self.next_item = None
-
-    cdef int _flush_block(self, int force=False) except -1:
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    cdef int _write_block(self, size_t count, const uint8_t[:] compressed) except -1:
+        if self.blocks_written == 0 and self.should_write_header:
+            self._write_header()
+        zigzag_encode_long(self.writer, count)
+        zigzag_encode_long(self.writer, compressed.shape[0])
+        if compressed.shape[0] > 0:
+            self.writer.write_n(compressed)
+        self.writer.write_n(self.marker)
+        self.blocks_written += 1
+
+    cdef bint _write_compressed_blocks(self, bint wait) except -1:
+        # Write out blocks that have finished compressing, in order.
+        # If wait is False, only wait for blocks when too many are in-flight.
+        cdef bint written = False
+        while self.compressing:
+            count, future = self.compressing[0]
+            if not wait and not future.done() and len(self.compressing) <= self.max_compressing:
+                break
+            self.compressing.popleft()
+            self._write_block(count, future.result())
+            written = True
+        return written
+
+    cdef int _flush_block(self, int force=False, bint wait=True) except -1:
         cdef size_t pending_len = self.pending_block.len
+        if self.executor is not None:
+            if force or self.num_pending > 0:
+                future = self.executor.submit(self.codec.compress, self.pending_block.bytes())
+                self.compressing.append((self.num_pending, future))
+                self.pending_block.reset()
+                self.num_pending = 0
+            if self._write_compressed_blocks(wait) or wait:
+                self.writer.flush()
+            return 0
         if force or self.num_pending > 0:
-            if self.blocks_written == 0 and self.should_write_header:
-                self._write_header()
-            zigzag_encode_long(self.writer, self.num_pending)
             self.next_block.reset()
             self.codec.write_block(self.next_block, self.pending_block.view())
-            zigzag_encode_long(self.writer, self.next_block.len)
-            if self.next_block.len > 0:
-                self.writer.write_n(self.next_block.view())
-            self.writer.write_n(self.marker)
-            self.blocks_written += 1
+            self._write_block(self.num_pending, self.next_block.view())
             self.pending_block.reset()
             self.num_pending = 0
         self.writer.flush()
@@ -272,14 +801,14 @@ cdef class ContainerWriter:
 
         if not self.options.container_fill_blocks:
             if self.pending_block.len + self.next_item.len > self.max_blocksize:
-                self._flush_block()
+                self._flush_block(False, False)
 
         self.pending_block.write_n(self.next_item.view())
         self.num_pending += 1
 
         if self.options.container_fill_blocks:
             if self.pending_block.len >= self.max_blocksize:
-                self._flush_block()
+                self._flush_block(False, False)
 
     def write_many(self, objs):
         for obj in objs:
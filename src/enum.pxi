@@ -76,6 +76,16 @@ cdef class EnumType(_NamedType):
     cdef _binary_buffer_decode(self, _Reader buffer):
         return self.symbols[zigzag_decode_long(buffer)]
 
+    cdef int binary_buffer_skip(self, _Reader buffer) except -1:
+        skip_varint(buffer)
+
+    cdef const uint8_t *binary_buffer_validate(self, _Validator validator, const uint8_t *ptr) except NULL:
+        cdef int64_t index
+        cdef const uint8_t *end = validator.read_long(ptr, &index, True)
+        if index < 0 or index >= len(self.symbols):
+            raise validator.error(ptr, f"Value {index} is not valid for an enum of {len(self.symbols)} symbols")
+        return end
+
     cdef int _get_value_fitness(self, value) except -1:
         try:
             if value in self.symbol_indexes:
@@ -89,4 +89,65 @@ class InvalidValue(CavroException, ValueError):
         if self.schema_path:
             path_str = ".".join(str(p) for p in self.schema_path)
             return f"Invalid value {repr(self.value)} for type {self.dest_type.type_name} at {path_str}"
-        return f"Invalid value {repr(self.value)} for type {self.dest_type.type_name}"
\ No newline at end of file
+        return f"Invalid value {repr(self.value)} for type {self.dest_type.type_name}"
+
+class InvalidSingleObject(CavroException, ValueError):
+    """
+    A value does not start with the avro single-object encoding header
+    """
+
+
+class UnknownFingerprint(CavroException, KeyError):
+
+    """
+    A single-object encoded value was written with a schema that is not known to the reader
+
+    Attributes:
+     * `fingerprint`: The 8-byte Rabin fingerprint of the unknown schema
+    """
+
+    def __init__(self, fingerprint):
+        self.fingerprint = fingerprint
+        super().__init__(f"Unknown schema fingerprint: {fingerprint.hex()}")
+
+    def __str__(self):
+        return self.args[0]
+
+
+class InvalidRegistryFraming(CavroException, ValueError):
+    """
+    A value does not start with the schema registry header (a zero byte followed by a 4-byte schema id)
+    """
+
+
+class UnknownSchemaId(CavroException, KeyError):
+
+    """
+    A schema registry does not have a schema with the requested id
+
+    Attributes:
+     * `schema_id`: The id of the unknown schema
+    """
+
+    def __init__(self, schema_id):
+        self.schema_id = schema_id
+        super().__init__(f"Unknown schema id: {schema_id}")
+
+    def __str__(self):
+        return self.args[0]
+
+
+class InvalidEncoding(CavroException, ValueError):
+
+    """
+    Encoded data is not valid for a schema (see `Schema.validate_bytes()` and `ContainerReader.verify()`)
+
+    Attributes:
+     * `reason`: A description of the problem
+     * `offset`: The offset in the data of the start of the invalid value
+    """
+
+    def __init__(self, reason, offset):
+        self.reason = reason
+        self.offset = offset
+        super().__init__(f"{reason} (at offset {offset})")
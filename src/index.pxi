@@ -0,0 +1,148 @@
+import bisect
+import json
+
+INDEX_FORMAT_VERSION = 1
+
+
+@cython.final
+cdef class BlockInfo:
+
+    """
+    Describes a single block within an avro object container file.
+
+    Attributes:
+     * `offset`: The file offset of the start of the block (the object count)
+     * `count`: The number of objects in the block
+     * `first_record`: The position of the first object in the block, counting from the start of the file
+     * `compressed_size`: The size of the block data as stored in the file
+     * `uncompressed_size`: The size of the block data once decompressed, or `None` if not known
+    """
+
+    cdef readonly Py_ssize_t offset
+    cdef readonly Py_ssize_t count
+    cdef readonly Py_ssize_t first_record
+    cdef readonly Py_ssize_t compressed_size
+    cdef readonly object uncompressed_size
+
+    def __init__(self, Py_ssize_t offset, Py_ssize_t count, Py_ssize_t first_record, Py_ssize_t compressed_size, uncompressed_size=None):
+        self.offset = offset
+        self.count = count
+        self.first_record = first_record
+        self.compressed_size = compressed_size
+        self.uncompressed_size = uncompressed_size
+
+    def __repr__(self):
+        return (
+            f'<BlockInfo offset={self.offset} count={self.count} first_record={self.first_record} '
+            f'compressed_size={self.compressed_size} uncompressed_size={self.uncompressed_size}>'
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, BlockInfo):
+            return NotImplemented
+        return self._as_list() == other._as_list()
+
+    cpdef list _as_list(self):
+        return [self.offset, self.count, self.first_record, self.compressed_size, self.uncompressed_size]
+
+
+cdef class BlockIndex:
+
+    """
+    An index of the blocks in an avro object container file.
+
+    Indexes are created by `ContainerReader.build_index()`, which only reads the block framing,
+    without decompressing any data.  An index can be saved alongside the container file, using `save()`,
+    and loaded again with `BlockIndex.load()`, so that the container does not have to be scanned each time it is opened.
+
+    Passing an index to `ContainerReader` allows `seek_block()` and `seek_record()` to jump straight to the relevant block.
+
+    Arguments:
+     * `marker`: The sync marker of the container file
+     * `codec_name`: The name of the codec used by the container file
+     * `blocks`: A sequence of `BlockInfo` objects, in file order
+    """
+
+    cdef readonly bytes marker
+    cdef readonly str codec_name
+    cdef readonly tuple blocks
+    cdef readonly Py_ssize_t num_records
+    cdef list record_starts
+
+    def __init__(self, bytes marker, str codec_name, blocks):
+        self.marker = marker
+        self.codec_name = codec_name
+        self.blocks = tuple(blocks)
+        self.record_starts = [block.first_record for block in self.blocks]
+        if self.blocks:
+            self.num_records = self.blocks[-1].first_record + self.blocks[-1].count
+        else:
+            self.num_records = 0
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def __getitem__(self, item):
+        return self.blocks[item]
+
+    def __iter__(self):
+        return iter(self.blocks)
+
+    def __repr__(self):
+        return f'<BlockIndex blocks={len(self.blocks)} records={self.num_records}>'
+
+    cpdef Py_ssize_t block_for_record(self, Py_ssize_t record) except -1:
+        """
+        Return the position (in `blocks`) of the block that contains the given record.
+        """
+        if record < 0 or record >= self.num_records:
+            raise IndexError(f"Record {record} out of range, container has {self.num_records} records")
+        return bisect.bisect_right(self.record_starts, record) - 1
+
+    def to_dict(self):
+        """
+        Return a JSON-compatible representation of this index.
+        """
+        return {
+            'version': INDEX_FORMAT_VERSION,
+            'marker': self.marker.hex(),
+            'codec': self.codec_name,
+            'blocks': [
+                [block.offset, block.count, block.compressed_size, block.uncompressed_size]
+                for block in self.blocks
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create an index from the output of `to_dict()`.
+        """
+        if data.get('version') != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported block index version: {data.get('version')}")
+        blocks = []
+        cdef Py_ssize_t first_record = 0
+        for offset, count, compressed_size, uncompressed_size in data['blocks']:
+            blocks.append(BlockInfo(offset, count, first_record, compressed_size, uncompressed_size))
+            first_record += count
+        return cls(bytes.fromhex(data['marker']), data['codec'], blocks)
+
+    def save(self, dest):
+        """
+        Write this index as JSON to `dest`, which can be a path (str|Path) or a file-like object.
+        """
+        if hasattr(dest, 'write'):
+            json.dump(self.to_dict(), dest)
+        else:
+            with open(dest, 'w') as fh:
+                json.dump(self.to_dict(), fh)
+
+    @classmethod
+    def load(cls, src):
+        """
+        Load an index previously written by `save()` from `src`, which can be a path (str|Path) or a file-like object.
+        """
+        if hasattr(src, 'read'):
+            return cls.from_dict(json.load(src))
+        with open(src) as fh:
+            return cls.from_dict(json.load(fh))
@@ -11,7 +11,7 @@ cdef class _Writer:
         raise NotImplementedError(
             f"{type(self).__name__} does not implement write_n")
 
-    cdef int flush(self) except -1:
+    cpdef int flush(self) except -1:
         pass
 
 
@@ -29,40 +29,152 @@ cdef class _Reader:
         raise NotImplementedError(
             f"{type(self).__name__} does not implement read_n")
 
+    cdef int skip(self, Py_ssize_t n) except -1:
+        self.read_n(n)
+
+    cpdef Py_ssize_t tell(self) except -1:
+        """
+        Return the current read position.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not implement tell")
+
+    cpdef int seek(self, Py_ssize_t pos) except -1:
+        """
+        Move the read position to `pos`, as returned by `tell()`.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not implement seek")
+
 
 cdef class FileReader(_Reader):
 
     """
     A cavro wrapper for reading data from a file-like object (Object that implements `.read(n)`).
     
-    This class will not close or seek the underlying file object
+    This class will not close the underlying file object, and only seeks it when `seek()` is called, or when skipping data.
+
+    By default, every read is passed straight through to the file object.  If `buffer_size` is given,
+    then data is read from the file in chunks of (up to) `buffer_size` bytes, and values are served from
+    this internal window.  This is much faster for small reads, but means that the file object may be read past
+    the end of the last value decoded.
 
     Arguments:
         `file_obj`: The file-like object to read from.
+        `buffer_size`: The size of the internal read-ahead window in bytes, `0` disables buffering. Defaults to `0`.
     """
 
     cdef object file_obj
-
-    def __init__(self, file_obj):
+    cdef object _read
+    cdef readonly Py_ssize_t buffer_size
+    cdef bytes window
+    cdef const uint8_t *ptr
+    cdef const uint8_t *end_ptr
+
+    def __init__(self, file_obj, Py_ssize_t buffer_size=0):
+        if buffer_size < 0:
+            raise ValueError(f"buffer_size must not be negative, got: {buffer_size}")
         self.file_obj = file_obj
+        self.buffer_size = buffer_size
+        # read1() returns whatever is available, rather than blocking until the window is full (pipes/sockets)
+        self._read = getattr(file_obj, 'read1', file_obj.read)
+        self.window = b''
+        self.ptr = self.end_ptr = NULL
+
+    cdef bytes _read_at_least(self, Py_ssize_t min_size, Py_ssize_t max_size):
+        cdef bytes data = self._read(max_size)
+        while len(data) < min_size:
+            more = self._read(max_size - len(data))
+            if not more:
+                raise EOFError(f"End of file found trying to read {min_size} bytes")
+            data += more
+        return data
+
+    cdef int _clear_window(self) except -1:
+        # Called whenever the file position moves outside the window, so that seek() cannot use stale data
+        self.window = b''
+        self.ptr = self.end_ptr = NULL
+
+    cdef int _fill(self, Py_ssize_t min_size) except -1:
+        # Only called once the current window has been fully consumed
+        self.window = self._read_at_least(min_size, self.buffer_size)
+        self.ptr = <const uint8_t *>(<char *>self.window)
+        self.end_ptr = self.ptr + len(self.window)
 
     cdef uint8_t read_u8(self) except? 0xba:
-        cdef bytes data = self.file_obj.read(1)
-        if len(data) != 1:
-            raise EOFError(f"End of file found trying to read 1 byte")
-        return ord(data)
+        cdef bytes data
+        if self.buffer_size == 0:
+            data = self.file_obj.read(1)
+            if len(data) != 1:
+                raise EOFError(f"End of file found trying to read 1 byte")
+            return ord(data)
+        if self.ptr == self.end_ptr:
+            self._fill(1)
+        self.ptr += 1
+        return self.ptr[-1]
 
     cdef bytes read_bytes(self, Py_ssize_t n):
-        cdef bytes result = self.file_obj.read(n)
-        if len(result) != n:
-            raise EOFError(f"End of file found trying to read {n} bytes")
-        return result
+        cdef Py_ssize_t available
+        cdef bytes head
+        cdef bytes result
+        if self.buffer_size == 0:
+            result = self.file_obj.read(n)
+            if len(result) != n:
+                raise EOFError(f"End of file found trying to read {n} bytes")
+            return result
+        available = self.end_ptr - self.ptr
+        if available >= n:
+            result = self.ptr[:n]
+            self.ptr += n
+            return result
+        head = self.ptr[:available]
+        self.ptr = self.end_ptr
+        n -= available
+        if n >= self.buffer_size:
+            self._clear_window()
+            return head + self._read_at_least(n, n)
+        self._fill(n)
+        result = self.ptr[:n]
+        self.ptr += n
+        return head + result
 
     cdef const uint8_t[:] read_n(self, Py_ssize_t n):
-        cdef bytes result = self.file_obj.read(n)
-        if len(result) != n:
-            raise EOFError(f"End of file found trying to read {n} bytes")
-        return result
+        return self.read_bytes(n)
+
+    cdef int skip(self, Py_ssize_t n) except -1:
+        cdef Py_ssize_t available = self.end_ptr - self.ptr
+        if available >= n:
+            self.ptr += n
+            return 0
+        self.ptr = self.end_ptr
+        n -= available
+        seekable = getattr(self.file_obj, 'seekable', None)
+        if seekable is not None and seekable():
+            self._clear_window()
+            self.file_obj.seek(n, io.SEEK_CUR)
+        else:
+            self.read_bytes(n)
+
+    cpdef Py_ssize_t tell(self) except -1:
+        """
+        Return the position of the next byte to be read, relative to the start of the file object.
+        """
+        return self.file_obj.tell() - (self.end_ptr - self.ptr)
+
+    cpdef int seek(self, Py_ssize_t pos) except -1:
+        """
+        Move the read position to `pos`, relative to the start of the file object.
+        The file object must be seekable.
+        """
+        cdef Py_ssize_t window_end
+        cdef Py_ssize_t window_len = len(self.window)
+        if self.ptr != NULL:
+            window_end = self.file_obj.tell()
+            if window_end - window_len <= pos <= window_end:
+                self.ptr = self.end_ptr - (window_end - pos)
+                return 0
+        self.file_obj.seek(pos)
+        self._clear_window()
 
 
 cdef class FileWriter(_Writer):
@@ -70,18 +182,70 @@ cdef class FileWriter(_Writer):
     A cavro wrapper for writing data to a file-like object (Object that implements `.write(data)` and `.flush()`).
     
     This class will not close or seek the underlying file object
+
+    By default, every write is passed straight through to the file object.  If `buffer_size` is given,
+    then writes are staged in an internal buffer of `buffer_size` bytes, which is only written to the file
+    object when full, or when `flush()` is called.
+
+    Arguments:
+        `file_obj`: The file-like object to write to.
+        `buffer_size`: The size of the internal staging buffer in bytes, `0` disables buffering. Defaults to `0`.
     """
 
     cdef object file_obj
+    cdef readonly Py_ssize_t buffer_size
+    cdef array.array buffer
+    cdef Py_ssize_t len
 
-    def __init__(self, file_obj):
+    def __init__(self, file_obj, Py_ssize_t buffer_size=0):
+        if buffer_size < 0:
+            raise ValueError(f"buffer_size must not be negative, got: {buffer_size}")
         self.file_obj = file_obj
+        self.buffer_size = buffer_size
+        self.len = 0
+        if buffer_size:
+            self.buffer = array.clone(byte_buffer_template, buffer_size, zero=False)
+
+    def __del__(self):
+        if self.len:
+            try:
+                self._write_buffer()
+            except ValueError as e:
+                warnings.warn(f'Error writing buffered data during __del__: {e}', ResourceWarning)
+
+    cdef int _write_buffer(self) except -1:
+        cdef Py_ssize_t length = self.len
+        if length:
+            self.len = 0
+            self.file_obj.write(self.buffer.data.as_chars[:length])
 
     cdef int write_u8(self, uint8_t val) except -1:
-        self.file_obj.write(bytes([val]))
+        if self.buffer_size == 0:
+            self.file_obj.write(bytes([val]))
+            return 0
+        if self.len == self.buffer_size:
+            self._write_buffer()
+        self.buffer.data.as_uchars[self.len] = val
+        self.len += 1
 
     cdef int write_n(self, const uint8_t[:] data) except -1:
-        self.file_obj.write(data)
-
-    cdef int flush(self) except -1:
-        self.file_obj.flush()
\ No newline at end of file
+        cdef Py_ssize_t num = data.shape[0]
+        if self.buffer_size == 0:
+            self.file_obj.write(data)
+            return 0
+        if num == 0:
+            return 0
+        if self.buffer_size - self.len < num:
+            self._write_buffer()
+            if num >= self.buffer_size:
+                self.file_obj.write(data)
+                return 0
+        memcpy(self.buffer.data.as_uchars + self.len, &data[0], num)
+        self.len += num
+
+    cpdef int flush(self) except -1:
+        """
+        Write any buffered data to the file object, and flush it.
+        """
+        self._write_buffer()
+        self.file_obj.flush()
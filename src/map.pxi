@@ -59,6 +59,42 @@ cdef class MapType(AvroType):
                 out[key] = value
                 length -= 1
 
+    cdef int binary_buffer_skip(self, _Reader buffer) except -1:
+        cdef int64_t count
+        while True:
+            count = zigzag_decode_long(buffer)
+            if count == 0:
+                return 0
+            if count < 0:
+                # Negative counts are followed by the size of the block in bytes, so the whole block can be skipped
+                skip_length_prefixed(buffer)
+                continue
+            while count:
+                self.key_type.binary_buffer_skip(buffer)
+                self.value_type.binary_buffer_skip(buffer)
+                count -= 1
+
+    cdef const uint8_t *binary_buffer_validate(self, _Validator validator, const uint8_t *ptr) except NULL:
+        cdef int64_t count
+        cdef int64_t size
+        cdef const uint8_t *block_start
+        while True:
+            ptr = validator.read_long(ptr, &count)
+            if count == 0:
+                return ptr
+            size = -1
+            if count < 0:
+                # Negative counts are followed by the size of the block in bytes
+                count = -count
+                ptr = validator.read_length(ptr, &size)
+            block_start = ptr
+            while count:
+                ptr = _validate_string(validator, ptr)
+                ptr = self.value_type.binary_buffer_validate(validator, ptr)
+                count -= 1
+            if size >= 0 and ptr - block_start != size:
+                raise validator.error(block_start, f"Map block size is {size}, but its items are {ptr - block_start} bytes")
+
     cdef _json_format(self, value):
         cdef str key
         cdef dict out = {}
@@ -107,6 +143,10 @@ cdef class MapType(AvroType):
                 break
         return level
 
+    cdef bint _may_fit_type(self, type value_type) except -1:
+        # These are not iterable
+        return value_type not in (int, float, py_bool, NoneType)
+
     cdef dict _make_converted_map(self, value):
         cdef AvroType key_type = self.key_type
         cdef AvroType value_type = self.value_type
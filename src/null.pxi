@@ -20,6 +20,12 @@ cdef class NullType(AvroType):
     cdef _binary_buffer_decode(self, _Reader buffer):
         return None
 
+    cdef int binary_buffer_skip(self, _Reader buffer) except -1:
+        return 0
+
+    cdef const uint8_t *binary_buffer_validate(self, _Validator validator, const uint8_t *ptr) except NULL:
+        return ptr
+
     cdef int _get_value_fitness(self, value) except -1:
         if value is None:
             return FIT_EXACT
@@ -29,6 +35,11 @@ cdef class NullType(AvroType):
             return FIT_OK
         return FIT_NONE
 
+    cdef bint _may_fit_type(self, type value_type) except -1:
+        if value_type is NoneType or self.options.allow_false_values_for_null:
+            return True
+        return self.options.missing_values_can_be_null and value_type is type(MISSING_VALUE)
+
     cdef _json_format(self, value):
         return None
 
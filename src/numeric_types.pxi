@@ -28,6 +28,15 @@ cdef class BoolType(AvroType):
     cdef object _binary_buffer_decode(self, _Reader buffer):
         return py_bool(buffer.read_u8())
 
+    cdef int binary_buffer_skip(self, _Reader buffer) except -1:
+        buffer.skip(1)
+
+    cdef const uint8_t *binary_buffer_validate(self, _Validator validator, const uint8_t *ptr) except NULL:
+        validator.need(ptr, 1)
+        if ptr[0] > 1:
+            raise validator.error(ptr, f"Invalid boolean value: {ptr[0]}")
+        return ptr + 1
+
     cdef int _get_value_fitness(self, value) except -1:
         if isinstance(value, (py_bool, bool_)):
             return FIT_EXACT
@@ -39,6 +48,9 @@ cdef class BoolType(AvroType):
             return FIT_POOR
         return FIT_NONE
 
+    cdef bint _may_fit_type(self, type value_type) except -1:
+        return issubclass(value_type, (py_bool, bool_)) or self.options.coerce_values_to_boolean
+
     cpdef object _convert_value(self, object value):
         if isinstance(value, (py_bool, bool_)):
             return value
@@ -78,6 +90,13 @@ cdef class IntType(AvroType):
     cdef _binary_buffer_decode(self, _Reader buffer):
         return zigzag_decode_int(buffer)
 
+    cdef int binary_buffer_skip(self, _Reader buffer) except -1:
+        skip_varint(buffer)
+
+    cdef const uint8_t *binary_buffer_validate(self, _Validator validator, const uint8_t *ptr) except NULL:
+        cdef int64_t value
+        return validator.read_long(ptr, &value, True)
+
     cdef int _get_value_fitness(self, value) except -1:
         max_fit = FIT_EXACT
         if isinstance(value, (bool_, py_bool)):
@@ -96,6 +115,9 @@ cdef class IntType(AvroType):
             return FIT_POOR if self.options.clamp_int_overflow else FIT_NONE
 
         return max_fit
+
+    cdef bint _may_fit_type(self, type value_type) except -1:
+        return issubclass(value_type, (int, integer)) or self.options.coerce_values_to_int
         
     cpdef object _convert_value(self, object value):
         if not self.options.coerce_values_to_int and isinstance(value, (bool_, py_bool)):
@@ -150,6 +172,13 @@ cdef class LongType(AvroType):
     cdef _binary_buffer_decode(self, _Reader buffer):
         return zigzag_decode_long(buffer)
 
+    cdef int binary_buffer_skip(self, _Reader buffer) except -1:
+        skip_varint(buffer)
+
+    cdef const uint8_t *binary_buffer_validate(self, _Validator validator, const uint8_t *ptr) except NULL:
+        cdef int64_t value
+        return validator.read_long(ptr, &value)
+
     cdef int _get_value_fitness(self, value) except -1:
         max_fit = FIT_EXACT
         if isinstance(value, (bool_, py_bool)):
@@ -168,6 +197,9 @@ cdef class LongType(AvroType):
             return FIT_POOR if self.options.clamp_int_overflow else FIT_NONE
 
         return max_fit
+
+    cdef bint _may_fit_type(self, type value_type) except -1:
+        return issubclass(value_type, (int, integer)) or self.options.coerce_values_to_int
         
     cpdef object _convert_value(self, object value):
         if not self.options.coerce_values_to_int and isinstance(value, (bool_, py_bool)):
@@ -228,6 +260,12 @@ cdef class FloatType(AvroType):
         cdef const uint8_t[:] val = buffer.read_n(4)
         return (<float*>(&val[0]))[0]
 
+    cdef int binary_buffer_skip(self, _Reader buffer) except -1:
+        buffer.skip(4)
+
+    cdef const uint8_t *binary_buffer_validate(self, _Validator validator, const uint8_t *ptr) except NULL:
+        return validator.need(ptr, 4)
+
     cdef int _get_value_fitness(self, value) except -1:
         max_fit = FIT_EXACT
         if not isinstance(value, (float, np_f16, np_f32)):
@@ -253,6 +291,11 @@ cdef class FloatType(AvroType):
             return max_fit
         return FIT_NONE
 
+    cdef bint _may_fit_type(self, type value_type) except -1:
+        if issubclass(value_type, (float, np_f16, np_f32, np_f64)) or self.options.coerce_values_to_float:
+            return True
+        return self.options.coerce_int_to_float and issubclass(value_type, (int, integer))
+
     cpdef object _convert_value(self, object value):
         if isinstance(value, float):
             pass
@@ -343,6 +386,12 @@ cdef class DoubleType(AvroType):
         cdef const uint8_t[:] val = buffer.read_n(8)
         return (<double*>(&val[0]))[0]
 
+    cdef int binary_buffer_skip(self, _Reader buffer) except -1:
+        buffer.skip(8)
+
+    cdef const uint8_t *binary_buffer_validate(self, _Validator validator, const uint8_t *ptr) except NULL:
+        return validator.need(ptr, 8)
+
     cdef int _get_value_fitness(self, value) except -1:
         max_fit = FIT_EXACT
         if not isinstance(value, (float, np_f16, np_f32, np_f64)):
@@ -363,6 +412,11 @@ cdef class DoubleType(AvroType):
         
         return max_fit
 
+    cdef bint _may_fit_type(self, type value_type) except -1:
+        if issubclass(value_type, (float, np_f16, np_f32, np_f64)) or self.options.coerce_values_to_float:
+            return True
+        return self.options.coerce_int_to_float and issubclass(value_type, (int, integer))
+
     cpdef object _convert_value(self, object value):
         if isinstance(value, float):
             pass
@@ -103,6 +103,10 @@ cdef class Options:
         If `True`, then dicts encoded using a record schema can have an optional key `-type` (note the leading '-')
         with a value that is the name of the record, ensuring the correct record schema is chosen.
     * `record_decodes_to_dict` If `True`, then records are decoded to a dict, rather than a record class instance
+    * `record_decodes_lazily`
+        If `True`, then records decoded from a `MemoryReader` (or `bytes`) only decode each field when it is first accessed.
+        The encoded data is referenced by the record, so must not be modified while the record is in use.
+        Errors in the field values are only raised when the field is accessed.  Has no effect if `record_decodes_to_dict` is set.
     * `record_allow_extra_fields` If `True`, then any fields in a dict that are not in the record schema are ignored. If `False`, then an error is raised.
     * `record_fields_must_be_unique` If `True`, then all fields within a record must have a unique name
     * `record_encode_use_defaults` 
@@ -115,6 +119,9 @@ cdef class Options:
     * `union_json_encodes_type_name` 
         If `True` (default), then when JSON encoding a value in a union, the type name is included in the output as per spec.
         If `False`, then the JSON-encoded value of the matching union type is output directly.
+    * `array_decodes_to_numpy`
+        If `True`, then arrays of `int`, `long`, `float` or `double` values (without logical types) are decoded to a `numpy.ndarray`
+        with the matching dtype (`int32`, `int64`, `float32`, `float64`), rather than a list.
     * `allow_primitive_name_collision` If `True`, then named types can have the same name as one of the primitive types (e.g. `int`, `float`, `str` etc..)
     * `allow_primitive_names_in_namespaces` If `True`, then namespace parts can have the same name as one of the primitive types (e.g. `int`, `float`, `str` etc..)
     * `named_type_names_must_be_unique` If `True`, then all named types must have a unique name within the schema
@@ -209,11 +216,13 @@ cdef class Options:
     record_can_encode_dict: bint = True
     record_values_type_hint: bint = False
     record_decodes_to_dict: bint = False
+    record_decodes_lazily: bint = False
     record_allow_extra_fields: bint = True
     record_encode_use_defaults: bint = True
     allow_tuple_notation: bint = False
     union_decodes_to: UnionDecodeOption = UnionDecodeOption.RAW_VALUES
     union_json_encodes_type_name: bint = True
+    array_decodes_to_numpy: bint = False
 
     allow_primitive_name_collision: bint = False
     allow_primitive_names_in_namespaces: bint = False
@@ -0,0 +1,99 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, as_completed, wait
+
+DEFAULT_SPLIT_SIZE = 64 * 1024 * 1024
+
+# Per-process state for parallel_read workers
+cdef ContainerReader _worker_reader = None
+cdef object _worker_fn = None
+
+
+def _parallel_read_init(path, fn, reader_schema, reader_options, options, Py_ssize_t buffer_size, where):
+    global _worker_reader, _worker_fn
+    if reader_schema is not None:
+        reader_schema = Schema(reader_schema, DEFAULT_OPTIONS if reader_options is None else reader_options)
+    _worker_reader = ContainerReader(
+        path,
+        reader_schema,
+        options=DEFAULT_OPTIONS if options is None else options,
+        buffer_size=buffer_size,
+        where=where,
+    )
+    _worker_fn = fn
+
+
+def _parallel_read_split(Py_ssize_t start, Py_ssize_t end):
+    _worker_reader._seek_split(start, end)
+    fn = _worker_fn
+    return [fn(obj) for obj in _worker_reader]
+
+
+def parallel_read(
+        src,
+        fn,
+        workers=None,
+        reader_schema=None,
+        bint ordered=True,
+        Options options=DEFAULT_OPTIONS,
+        Py_ssize_t split_size=DEFAULT_SPLIT_SIZE,
+        Py_ssize_t buffer_size=DEFAULT_READ_BUFFER_SIZE,
+        Predicate where=None):
+    """
+    Read an avro object container file using a pool of worker processes, yielding the result of calling `fn` on each object.
+
+    The file is divided into byte ranges (see `container_splits()`), and each range is decoded by a worker process.
+    Each worker opens the file once, parsing the schema from the file header, so `fn` is the only thing that has to be pickled.
+    `fn` must therefore be picklable (e.g. a module-level function), as must its results.
+
+    Arguments:
+     * `src`: The path to the container file to read (str|Path)
+     * `fn`: A callable that is called, in a worker process, with each object read from the file.
+     * `workers`: The number of worker processes to use. Defaults to `os.cpu_count()`.
+     * `reader_schema`: The schema to use when reading objects, either a `Schema`, or a schema source (JSON string or object). If not provided, the writer schema is used.
+     * `ordered`: If `True` (default), then results are yielded in file order, otherwise results are yielded as soon as each range has been processed.
+     * `options`: An Options object to use when constructing the writer schema.
+     * `split_size`: The approximate size of each byte range, in bytes.  The file is split into at least `workers` ranges. Defaults to `DEFAULT_SPLIT_SIZE` (64 MiB)
+     * `buffer_size`: The read buffer size to use in each worker, see `ContainerReader`.
+     * `where`: A `Predicate` that objects must match to be passed to `fn`, see `ContainerReader`.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got: {workers}")
+    if split_size < 1:
+        raise ValueError(f"split_size must be at least 1, got: {split_size}")
+    path = os.fspath(src)
+    cdef Py_ssize_t size = Path(path).stat().st_size
+    splits = container_splits(path, max(workers, -(-size // split_size)))
+
+    reader_options = None
+    if isinstance(reader_schema, Schema):
+        if reader_schema.options is not DEFAULT_OPTIONS:
+            reader_options = reader_schema.options
+        reader_schema = reader_schema.schema_str
+    initargs = (path, fn, reader_schema, reader_options, None if options is DEFAULT_OPTIONS else options, buffer_size, where)
+
+    # Limit the number of outstanding ranges, so that results don't pile up faster than they're consumed
+    cdef Py_ssize_t max_pending = 2 * workers
+    executor = ProcessPoolExecutor(workers, initializer=_parallel_read_init, initargs=initargs)
+    try:
+        if ordered:
+            pending = deque()
+            for start, end in splits:
+                pending.append(executor.submit(_parallel_read_split, start, end))
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        else:
+            pending = set()
+            for start, end in splits:
+                pending.add(executor.submit(_parallel_read_split, start, end))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+            for future in as_completed(pending):
+                yield from future.result()
+    finally:
+        executor.shutdown(cancel_futures=True)
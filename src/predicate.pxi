@@ -0,0 +1,309 @@
+from cpython.object cimport PyObject_RichCompareBool, Py_LT, Py_LE, Py_EQ, Py_NE, Py_GT, Py_GE
+
+cdef dict COMPARISON_SYMBOLS = {
+    Py_LT: '<',
+    Py_LE: '<=',
+    Py_EQ: '==',
+    Py_NE: '!=',
+    Py_GT: '>',
+    Py_GE: '>=',
+}
+
+
+def field(str path):
+    """
+    Return a `Field` reference to the record field at `path`, for building a `Predicate`.
+
+    Nested record fields are referenced with a `.` separated path, e.g. `field('file.project')`.
+    """
+    return Field(path)
+
+
+@cython.final
+cdef class Field:
+
+    """
+    A reference to a field of a record, used to build `Predicate`s (see `field()`)
+
+    Comparing a `Field` with a value, using `==`, `!=`, `<`, `<=`, `>` or `>=`, returns a `Predicate`.
+    Ordering comparisons are always false for `null` field values.
+
+    Arguments:
+     * `path`: The name of the field, nested record fields are separated by `.`
+    """
+
+    cdef readonly str path
+
+    def __init__(self, str path):
+        if not path or '' in path.split('.'):
+            raise ValueError(f"Invalid field path: '{path}'")
+        self.path = path
+
+    def __repr__(self):
+        return f'field({self.path!r})'
+
+    def __eq__(self, value):
+        return _Comparison(self.path, Py_EQ, value)
+
+    def __ne__(self, value):
+        return _Comparison(self.path, Py_NE, value)
+
+    def __lt__(self, value):
+        return _Comparison(self.path, Py_LT, value)
+
+    def __le__(self, value):
+        return _Comparison(self.path, Py_LE, value)
+
+    def __gt__(self, value):
+        return _Comparison(self.path, Py_GT, value)
+
+    def __ge__(self, value):
+        return _Comparison(self.path, Py_GE, value)
+
+    def isin(self, values):
+        """
+        Return a `Predicate` that is true when the field value is one of `values`.
+        """
+        return _IsIn(self.path, values)
+
+    def between(self, low, high):
+        """
+        Return a `Predicate` that is true when `low <= value <= high`.
+        """
+        return (self >= low) & (self <= high)
+
+    def is_null(self):
+        """
+        Return a `Predicate` that is true when the field value is `None`.
+        """
+        return _Comparison(self.path, Py_EQ, None)
+
+
+cdef class Predicate:
+
+    """
+    A condition on the fields of a record, used to filter the objects read by a `ContainerReader` (see the `where` argument).
+
+    Predicates are created by comparing `field()`s with values, and can be combined with `&` (and), `|` (or) and `~` (not):
+    ```
+    where = (cavro.field('country') == 'GB') & cavro.field('size').between(0, 1024)
+    ```
+    """
+
+    def __and__(self, Predicate other):
+        return _And(self, other)
+
+    def __or__(self, Predicate other):
+        return _Or(self, other)
+
+    def __invert__(self):
+        return _Not(self)
+
+    def __call__(self, dict values):
+        """
+        Evaluate this predicate against a dict of field path to value.
+        """
+        return self.evaluate(values)
+
+    def paths(self):
+        """
+        Return a list of the field paths used by this predicate.
+        """
+        cdef list paths = []
+        self._add_paths(paths)
+        return paths
+
+    cdef bint evaluate(self, dict values) except -1:
+        raise NotImplementedError(f"{type(self).__name__} does not implement evaluate")
+
+    cdef int _add_paths(self, list paths) except -1:
+        raise NotImplementedError(f"{type(self).__name__} does not implement _add_paths")
+
+
+@cython.final
+cdef class _Comparison(Predicate):
+
+    cdef str path
+    cdef int op
+    cdef object value
+
+    def __init__(self, str path, int op, value):
+        self.path = path
+        self.op = op
+        self.value = value
+
+    def __repr__(self):
+        return f'(field({self.path!r}) {COMPARISON_SYMBOLS[self.op]} {self.value!r})'
+
+    cdef bint evaluate(self, dict values) except -1:
+        value = values[self.path]
+        if value is None and self.op != Py_EQ and self.op != Py_NE:
+            return False
+        return PyObject_RichCompareBool(value, self.value, self.op)
+
+    cdef int _add_paths(self, list paths) except -1:
+        if self.path not in paths:
+            paths.append(self.path)
+
+
+@cython.final
+cdef class _IsIn(Predicate):
+
+    cdef str path
+    cdef object values
+
+    def __init__(self, str path, values):
+        self.path = path
+        try:
+            self.values = frozenset(values)
+        except TypeError:
+            # Unhashable values (e.g. lists) are searched in order
+            self.values = tuple(values)
+
+    def __repr__(self):
+        return f'field({self.path!r}).isin({tuple(self.values)!r})'
+
+    cdef bint evaluate(self, dict values) except -1:
+        value = values[self.path]
+        try:
+            return value in self.values
+        except TypeError:
+            # An unhashable field value cannot be in a frozenset
+            return False
+
+    cdef int _add_paths(self, list paths) except -1:
+        if self.path not in paths:
+            paths.append(self.path)
+
+
+@cython.final
+cdef class _And(Predicate):
+
+    cdef Predicate left
+    cdef Predicate right
+
+    def __init__(self, Predicate left, Predicate right):
+        self.left = left
+        self.right = right
+
+    def __repr__(self):
+        return f'({self.left!r} & {self.right!r})'
+
+    cdef bint evaluate(self, dict values) except -1:
+        return self.left.evaluate(values) and self.right.evaluate(values)
+
+    cdef int _add_paths(self, list paths) except -1:
+        self.left._add_paths(paths)
+        self.right._add_paths(paths)
+
+
+@cython.final
+cdef class _Or(Predicate):
+
+    cdef Predicate left
+    cdef Predicate right
+
+    def __init__(self, Predicate left, Predicate right):
+        self.left = left
+        self.right = right
+
+    def __repr__(self):
+        return f'({self.left!r} | {self.right!r})'
+
+    cdef bint evaluate(self, dict values) except -1:
+        return self.left.evaluate(values) or self.right.evaluate(values)
+
+    cdef int _add_paths(self, list paths) except -1:
+        self.left._add_paths(paths)
+        self.right._add_paths(paths)
+
+
+@cython.final
+cdef class _Not(Predicate):
+
+    cdef Predicate inner
+
+    def __init__(self, Predicate inner):
+        self.inner = inner
+
+    def __repr__(self):
+        return f'~{self.inner!r}'
+
+    cdef bint evaluate(self, dict values) except -1:
+        return not self.inner.evaluate(values)
+
+    cdef int _add_paths(self, list paths) except -1:
+        self.inner._add_paths(paths)
+
+
+@cython.final
+cdef class _FieldExtractor:
+    # Decodes just the fields of an encoded record that a predicate needs, skipping over the others.
+    # `extract()` stops after the last needed field, `skip_rest()` then moves past the remaining fields.
+
+    cdef tuple types
+    cdef tuple paths
+    cdef tuple nested
+    cdef Py_ssize_t num_needed
+
+    def __init__(self, RecordType record, str prefix, set wanted, set found):
+        cdef RecordField record_field
+        cdef list types = []
+        cdef list paths = []
+        cdef list nested = []
+        for record_field in record.fields:
+            path = None
+            sub_extractor = None
+            if record_field.name is not None:
+                full_path = prefix + record_field.name
+                has_children = any(w.startswith(full_path + '.') for w in wanted)
+                if full_path in wanted:
+                    if has_children:
+                        raise ValueError(f"Cannot filter on both '{full_path}' and its fields")
+                    path = full_path
+                    found.add(full_path)
+                elif has_children:
+                    if not isinstance(record_field.type, RecordType):
+                        raise ValueError(f"Field '{full_path}' is not a record, so has no fields to filter on")
+                    sub_extractor = _FieldExtractor(record_field.type, full_path + '.', wanted, found)
+            if path is not None or sub_extractor is not None:
+                self.num_needed = len(types) + 1
+            types.append(record_field.type)
+            paths.append(path)
+            nested.append(sub_extractor)
+        self.types = tuple(types)
+        self.paths = tuple(paths)
+        self.nested = tuple(nested)
+
+    @staticmethod
+    cdef _FieldExtractor for_predicate(Schema schema, Predicate predicate):
+        if not isinstance(schema.type, RecordType):
+            raise ValueError(f"Filtering requires a record schema, not '{schema.type.type_name}'")
+        cdef set wanted = set(predicate.paths())
+        cdef set found = set()
+        extractor = _FieldExtractor(schema.type, '', wanted, found)
+        if wanted - found:
+            missing = ', '.join(sorted(wanted - found))
+            raise ValueError(f"Unknown fields in predicate: {missing}")
+        return extractor
+
+    cdef int extract(self, _Reader buffer, dict values) except -1:
+        cdef Py_ssize_t i
+        cdef AvroType field_type
+        for i in range(self.num_needed):
+            field_type = self.types[i]
+            path = self.paths[i]
+            if path is not None:
+                values[path] = field_type.binary_buffer_decode(buffer)
+            elif self.nested[i] is not None:
+                (<_FieldExtractor>self.nested[i]).extract(buffer, values)
+                (<_FieldExtractor>self.nested[i]).skip_rest(buffer)
+            else:
+                field_type.binary_buffer_skip(buffer)
+
+    cdef int skip_rest(self, _Reader buffer) except -1:
+        cdef Py_ssize_t i
+        cdef AvroType field_type
+        for i in range(self.num_needed, len(self.types)):
+            field_type = self.types[i]
+            field_type.binary_buffer_skip(buffer)
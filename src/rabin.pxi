@@ -6,6 +6,9 @@ cdef int64_t RABIN_EMPTY = 0xc15d213aa4d7a795L
 cdef int64_t RABIN_TABLE[256]
 cdef bint RABIN_TABLE_CONFIGURED = 0
 
+# Smaller inputs are hashed without releasing the GIL, as it's quicker than releasing and re-acquiring it
+cdef size_t RABIN_NOGIL_MIN_SIZE = 4096
+
 
 cdef init_rabin_table():
     global RABIN_TABLE_CONFIGURED
@@ -21,6 +24,13 @@ cdef init_rabin_table():
     RABIN_TABLE_CONFIGURED = 1
 
 
+cdef int64_t rabin_update(int64_t value, const uint8_t *data, size_t length) noexcept nogil:
+    cdef size_t i
+    for i in range(length):
+        value = <int64_t>(<uint64_t>value >> 8) ^ RABIN_TABLE[(value ^ data[i]) & 0xff]
+    return value
+
+
 @cython.final
 cdef class Rabin:
 
@@ -41,13 +51,18 @@ cdef class Rabin:
             init_rabin_table()
         self.value = value
     
-    cpdef update(self, bytes data):
-        cdef int64_t swizzle
-        cdef int64_t shifted
-        for char in data:
-            swizzle = RABIN_TABLE[(self.value ^ char) & 0xff]
-            shifted = <int64_t>(<uint64_t>self.value >> 8)
-            self.value = shifted ^ swizzle
+    cpdef update(self, const uint8_t[:] data):
+        """
+        Update the hash with `data`, which may be any object that supports the buffer protocol.
+        """
+        cdef size_t length = data.shape[0]
+        if length == 0:
+            return
+        if length < RABIN_NOGIL_MIN_SIZE:
+            self.value = rabin_update(self.value, &data[0], length)
+        else:
+            with nogil:
+                self.value = rabin_update(self.value, &data[0], length)
 
     def digest(self):
         cdef uint64_t value = self.value
@@ -43,6 +43,9 @@ cdef class _PlaceholderType(AvroType):
     cdef _binary_buffer_decode(self, _Reader buffer):
         return self.default_value
 
+    cdef int binary_buffer_skip(self, _Reader buffer) except -1:
+        return 0
+
     cdef int _get_value_fitness(self, value) except -1:
         return FIT_NONE
 
@@ -84,6 +87,32 @@ cdef list _record_data_from_dict(RecordType record, dict data):
     return field_data
 
 
+# Stands in for the values of fields in a lazily decoded record that have not been decoded yet
+cdef object _NOT_DECODED = object()
+
+
+@cython.final
+cdef class _LazyFields:
+
+    """
+    The encoded form of a record decoded with `record_decodes_lazily`, from which individual fields are decoded on demand.
+    """
+
+    cdef const uint8_t[:] data
+    cdef tuple types
+    cdef array.array offsets
+    cdef Py_ssize_t end
+
+    cdef decode(self, Py_ssize_t index):
+        cdef AvroType field_type = self.types[index]
+        cdef const uint8_t *start = &self.data[0]
+        cdef MemoryReader reader = MemoryReader.__new__(MemoryReader)
+        reader.data = self.data
+        reader.ptr = start + (<Py_ssize_t *>self.offsets.data.as_voidptr)[index]
+        reader.end_ptr = start + self.end
+        return field_type.binary_buffer_decode(reader)
+
+
 @cython.freelist(8)
 cdef class Record:
 
@@ -100,16 +129,19 @@ cdef class Record:
      * `Record(data: dict)`: The keys of the dict must match the field names, and each value should correspond to the relevant field value
      * `Record(data: Record)`: The record must be of the same type as the subclass, or must be adaptable to the subclass (Matching name and fields)
      * `Record(**kwargs)`: Each keyword argument should correspond to a field name, and the value should correspond to the relevant field value
+
+    Records decoded with the `record_decodes_lazily` option keep a reference to the encoded data, and only decode each field when it is first accessed.
     """
 
     cdef list data
+    cdef _LazyFields lazy
 
     def __init__(self, data=None, **kwargs):
         cdef dict data_dict
         cdef Record rec
         if isinstance(data, type(self)):
             rec = data
-            self.data = rec.data
+            self.data = rec._field_data()
             return
         if isinstance(data, Record):
             if data.Type.name == self.Type.name and self.Type.options.adapt_record_types:
@@ -132,7 +164,25 @@ cdef class Record:
     def __getitem__(self, name):
         cdef dict indexes = self._field_to_index
         cdef Py_ssize_t field_index = indexes[name]
-        return self.data[field_index]
+        value = self.data[field_index]
+        if value is _NOT_DECODED:
+            return self._decode_field(field_index)
+        return value
+
+    cdef _decode_field(self, Py_ssize_t index):
+        value = self.lazy.decode(index)
+        self.data[index] = value
+        return value
+
+    cdef list _field_data(self):
+        # Returns the list of field values, first decoding any fields of a lazy record that have not been accessed
+        cdef Py_ssize_t index
+        if self.lazy is not None:
+            for index in range(len(self.data)):
+                if self.data[index] is _NOT_DECODED:
+                    self._decode_field(index)
+            self.lazy = None
+        return self.data
 
     cdef _repr_children(self, remain):
         cdef Record rec
@@ -169,8 +219,9 @@ cdef class Record:
         cdef dict items = {}
         cdef RecordField field
         cdef Py_ssize_t i = 0
+        cdef list field_data = self._field_data()
         for field in self.Type.fields:
-            data = self.data[i]
+            data = field_data[i]
             if isinstance(data, Record):
                 data = data._asdict()
             items[field.name] = data
@@ -181,7 +232,7 @@ cdef class Record:
         if not isinstance(other, self.Type.record):
             return False
         cdef Record other_rec = other
-        return self.data == other_rec.data
+        return self._field_data() == other_rec._field_data()
 
 
 @cython.final
@@ -272,7 +323,10 @@ cdef class _FieldAccessor:
 
     def __get__(self, inst, cls):
         cdef Record record = inst
-        return record.data[self.index]
+        value = record.data[self.index]
+        if value is _NOT_DECODED:
+            return record._decode_field(self.index)
+        return value
 
     def __set__(self, inst, value):
         cdef Record record = inst
@@ -317,6 +371,9 @@ cdef class RecordType(_NamedType):
     cdef readonly type record
 
     cdef bint _setting_up
+    # Field types by data index, and the initial data list, for lazily decoded records
+    cdef tuple _lazy_types
+    cdef list _lazy_template
 
     def __init__(self, schema, source, namespace):
         cdef Schema schema_ = schema
@@ -384,7 +441,7 @@ cdef class RecordType(_NamedType):
                 rec = value
             else:
                 rec = self.record(value)
-            rec_data = rec.data
+            rec_data = rec._field_data()
             for field in self.fields:
                 field_value = rec_data[index]
                 if field_value is NO_DEFAULT:
@@ -436,16 +493,77 @@ cdef class RecordType(_NamedType):
         cdef RecordField field
         cdef dict data = {}
         for field in self.fields:
-            value = field.type.binary_buffer_decode(buffer)
-            if field.name is not None:
-                data[field.name] = value
+            if field.name is None:
+                # Only in the writer schema, so not needed
+                field.type.binary_buffer_skip(buffer)
+                continue
+            data[field.name] = field.type.binary_buffer_decode(buffer)
         return data
 
+    cdef Py_ssize_t _data_index(self, Py_ssize_t position):
+        # The index in the record data of the field at `position` in self.fields, or -1 if it is not kept
+        return position
+
+    cdef int _make_lazy_layout(self) except -1:
+        cdef Py_ssize_t n_fields = len(self.fields)
+        cdef Py_ssize_t position = 0
+        cdef Py_ssize_t index
+        cdef RecordField field
+        cdef list types = [None] * n_fields
+        cdef list template = [None] * n_fields
+        for field in self.fields:
+            index = self._data_index(position)
+            if index >= 0:
+                types[index] = field.type
+                template[index] = _NOT_DECODED
+            position += 1
+        self._lazy_types = tuple(types)
+        self._lazy_template = template
+
+    cdef _binary_buffer_decode_lazy(self, MemoryReader buffer):
+        cdef RecordField field
+        cdef Py_ssize_t position = 0
+        cdef Py_ssize_t index
+        cdef Record rec
+        cdef const uint8_t *start = &buffer.data[0]
+        cdef _LazyFields lazy = _LazyFields.__new__(_LazyFields)
+        if self._lazy_types is None:
+            self._make_lazy_layout()
+        lazy.data = buffer.data
+        lazy.types = self._lazy_types
+        lazy.offsets = array.clone(_EMPTY_ARRAY, len(self.fields), zero=False)
+        cdef Py_ssize_t *offsets = <Py_ssize_t *>lazy.offsets.data.as_voidptr
+        # Skipping validates the framing of the record, so that the buffer is left at the end of it
+        for field in self.fields:
+            index = self._data_index(position)
+            if index >= 0:
+                offsets[index] = buffer.ptr - start
+            field.type.binary_buffer_skip(buffer)
+            position += 1
+        lazy.end = buffer.ptr - start
+        rec = Record.__new__(self.record)
+        rec.data = list(self._lazy_template)
+        rec.lazy = lazy
+        return rec
+
     cdef _binary_buffer_decode(self, _Reader buffer):
         if self.options.record_decodes_to_dict:
             return self._binary_buffer_decode_dict(buffer)
+        if self.options.record_decodes_lazily and isinstance(buffer, MemoryReader):
+            return self._binary_buffer_decode_lazy(buffer)
         return self._binary_buffer_decode_record(buffer)
 
+    cdef int binary_buffer_skip(self, _Reader buffer) except -1:
+        cdef RecordField field
+        for field in self.fields:
+            field.type.binary_buffer_skip(buffer)
+
+    cdef const uint8_t *binary_buffer_validate(self, _Validator validator, const uint8_t *ptr) except NULL:
+        cdef RecordField field
+        for field in self.fields:
+            ptr = field.type.binary_buffer_validate(validator, ptr)
+        return ptr
+
     cdef int _get_value_fitness(self, value) except -1:
         cdef int level = FIT_OK
         cdef RecordField field
@@ -476,11 +594,33 @@ cdef class RecordType(_NamedType):
                 return FIT_NONE
             return level
 
+    cdef bint _may_fit_type(self, type value_type) except -1:
+        if issubclass(value_type, Record):
+            if value_type is self.record or not hasattr(value_type, 'Type'):
+                return True
+            return value_type.Type.name == self.type
+        return issubclass(value_type, dict)
+
+    cdef bint may_fit_keys(self, dict value) except -1:
+        # Returns False if get_value_fitness() is FIT_NONE for every dict with the same keys (and '-type' hint) as `value`
+        keys = value.keys()
+        if self.options.record_values_type_hint and '-type' in value:
+            if value['-type'] != self.type:
+                return False
+            keys = keys - {'-type'}
+        cdef RecordField field
+        for field in self.fields:
+            if field.default_value is NO_DEFAULT and field.name not in keys:
+                return False
+        if not self.options.record_allow_extra_fields:
+            return not (keys - self.field_dict.keys())
+        return True
+
     cdef _json_format(self, value):
         cdef Record record = self._convert_value(value)
         cdef AvroType field_type
         out = {}
-        for field, value in zip(self.fields, record.data):
+        for field, value in zip(self.fields, record._field_data()):
             field_type = field.type
             out[field.name] = field_type.json_format(value)
         return out
@@ -615,6 +755,9 @@ cdef class PromotingRecordType(RecordType):
 
     cdef Py_ssize_t [:] decode_indexes
 
+    cdef Py_ssize_t _data_index(self, Py_ssize_t position):
+        return self.decode_indexes[position]
+
     cdef _binary_buffer_decode_record(self, _Reader buffer):
         cdef RecordField field
         cdef list data = [None] * len(self.fields)
@@ -623,9 +766,10 @@ cdef class PromotingRecordType(RecordType):
         cdef Py_ssize_t field_index
         for field in self.fields:
             field_index = self.decode_indexes[index]
-            value = field.type.binary_buffer_decode(buffer)
-            if field_index >= 0: 
-                data[field_index] = value
+            if field_index >= 0:
+                data[field_index] = field.type.binary_buffer_decode(buffer)
+            else:
+                field.type.binary_buffer_skip(buffer)
             index += 1
         rec = Record.__new__(self.record)
         rec.data = data
@@ -0,0 +1,269 @@
+import os
+
+# Registry framed values start with a zero byte, followed by the 4-byte big-endian schema id
+cdef size_t REGISTRY_HEADER_SIZE = 5
+
+
+cdef int64_t _read_registry_header(MemoryReader buffer) except -1:
+    cdef const uint8_t *header
+    if <size_t>(buffer.end_ptr - buffer.ptr) < REGISTRY_HEADER_SIZE:
+        raise InvalidRegistryFraming("Value is too short to have a schema registry header")
+    header = buffer.advance(REGISTRY_HEADER_SIZE)
+    if header[0] != 0:
+        raise InvalidRegistryFraming(f"Value starts with {header[0]:#04x}, rather than the schema registry magic byte")
+    return (<uint32_t>header[1] << 24) | (<uint32_t>header[2] << 16) | (<uint32_t>header[3] << 8) | header[4]
+
+
+cdef int _write_registry_header(MemoryWriter buffer, uint32_t schema_id) except -1:
+    buffer.reserve(REGISTRY_HEADER_SIZE)
+    cdef uint8_t *header = buffer.buffer.data.as_uchars + buffer.len
+    header[0] = 0
+    header[1] = (schema_id >> 24) & 0xff
+    header[2] = (schema_id >> 16) & 0xff
+    header[3] = (schema_id >> 8) & 0xff
+    header[4] = schema_id & 0xff
+    buffer.len += REGISTRY_HEADER_SIZE
+
+
+cdef str _registry_key(Schema schema):
+    # Registries dedupe on the full schema, as the canonical form drops logical types and defaults
+    return json.dumps(schema.schema, sort_keys=True)
+
+
+cdef class SchemaRegistry:
+
+    """
+    Abstract base class for schema registries, used by `RegistryCodec` to find schemas by id.
+
+    Subclasses (which may be written in python) must implement `get_schema`, and `register` if they are used for encoding.
+    """
+
+    def get_schema(self, schema_id):
+        """
+        Return the schema with the given id, either as a `Schema`, or a schema source (see `Schema()`).
+
+        Raises `UnknownSchemaId` if there is no schema with this id.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not implement get_schema")
+
+    def register(self, Schema schema) -> int:
+        """
+        Add `schema` to the registry if it's not already there, and return its id.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not implement register")
+
+
+@cython.final
+cdef class MemorySchemaRegistry(SchemaRegistry):
+
+    """
+    A `SchemaRegistry` that holds schemas in memory.
+
+    Identical schemas are given the same id.
+
+    Arguments:
+     * `schemas`: Optional dict of schema id to `Schema` to start with
+    """
+
+    cdef dict schemas
+    cdef dict ids_by_schema
+
+    def __init__(self, dict schemas=None):
+        self.schemas = {}
+        self.ids_by_schema = {}
+        if schemas is not None:
+            for schema_id, schema in schemas.items():
+                self.schemas[schema_id] = schema
+                self.ids_by_schema.setdefault(_registry_key(schema), schema_id)
+
+    def __len__(self):
+        return len(self.schemas)
+
+    def get_schema(self, schema_id):
+        try:
+            return self.schemas[schema_id]
+        except KeyError:
+            raise UnknownSchemaId(schema_id) from None
+
+    def register(self, Schema schema) -> int:
+        cdef str key = _registry_key(schema)
+        schema_id = self.ids_by_schema.get(key)
+        if schema_id is None:
+            schema_id = max(self.schemas, default=0) + 1
+            self.schemas[schema_id] = schema
+            self.ids_by_schema[key] = schema_id
+        return schema_id
+
+
+@cython.final
+cdef class FileSchemaRegistry(SchemaRegistry):
+
+    """
+    A `SchemaRegistry` that stores each schema as a json file, named `<id>.avsc`, in a directory.
+
+    Arguments:
+     * `path`: The directory holding the schema files
+    """
+
+    cdef readonly object path
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+
+    cdef str _schema_path(self, schema_id):
+        return os.path.join(self.path, f'{schema_id}.avsc')
+
+    def _schema_ids(self):
+        for filename in os.listdir(self.path):
+            name, ext = os.path.splitext(filename)
+            if ext == '.avsc' and name.isdigit():
+                yield int(name)
+
+    def get_schema(self, schema_id):
+        try:
+            with open(self._schema_path(schema_id), 'r', encoding='utf-8') as fh:
+                return fh.read()
+        except FileNotFoundError:
+            raise UnknownSchemaId(schema_id) from None
+
+    def register(self, Schema schema) -> int:
+        cdef list schema_ids = sorted(self._schema_ids())
+        cdef str key = _registry_key(schema)
+        for schema_id in schema_ids:
+            if _registry_key(Schema(self.get_schema(schema_id), schema.options)) == key:
+                return schema_id
+        schema_id = schema_ids[-1] + 1 if schema_ids else 1
+        with open(self._schema_path(schema_id), 'x', encoding='utf-8') as fh:
+            fh.write(schema.schema_str)
+        return schema_id
+
+
+@cython.final
+cdef class RegistryCodec:
+
+    """
+    Encodes and decodes values framed with a schema registry header: a zero byte, followed by the 4-byte big-endian id of the writer schema.
+
+    Writer schemas are fetched from the `registry` the first time each id is seen, and cached.
+    When a `reader_schema` is given, each writer schema is resolved to it (see `Schema.reader_for_writer()`),
+    and the resolved schema is cached, so all values are decoded to match the reader schema.
+
+    Arguments:
+     * `registry`: The `SchemaRegistry` to fetch schemas from
+     * `reader_schema`: Optional schema that decoded values should match, and that values are encoded with
+     * `options`: The `Options` used to parse schemas fetched from the registry. Defaults to the options of `reader_schema`, or `DEFAULT_OPTIONS`
+    """
+
+    cdef readonly SchemaRegistry registry
+    cdef readonly Schema reader_schema
+    cdef readonly Options options
+    cdef dict writers  # schema id -> writer Schema
+    cdef dict readers  # schema id -> Schema used to decode values written with that id
+    cdef int64_t reader_schema_id
+
+    def __init__(self, SchemaRegistry registry, Schema reader_schema=None, Options options=None):
+        if options is None:
+            options = DEFAULT_OPTIONS if reader_schema is None else reader_schema.options
+        self.registry = registry
+        self.reader_schema = reader_schema
+        self.options = options
+        self.writers = {}
+        self.readers = {}
+        self.reader_schema_id = -1
+
+    cpdef Schema writer_schema(self, int64_t schema_id):
+        """
+        Return the (cached) writer schema with the given id.
+        """
+        cdef Schema schema = self.writers.get(schema_id)
+        if schema is None:
+            source = self.registry.get_schema(schema_id)
+            schema = source if isinstance(source, Schema) else Schema(source, self.options)
+            self.writers[schema_id] = schema
+        return schema
+
+    cdef Schema _reader_for(self, int64_t schema_id):
+        cdef Schema reader = self.readers.get(schema_id)
+        if reader is not None:
+            return reader
+        cdef Schema writer = self.writer_schema(schema_id)
+        if self.reader_schema is None or schema_id == self.reader_schema_id:
+            reader = writer if self.reader_schema is None else self.reader_schema
+        else:
+            reader = self.reader_schema.reader_for_writer(writer)
+        self.readers[schema_id] = reader
+        return reader
+
+    def schema_id(self, value) -> int:
+        """
+        Return the schema id from the header of `value`.
+        """
+        return _read_registry_header(MemoryReader(value))
+
+    def decode(self, value) -> object:
+        """
+        Decode a single registry framed `value`, which may be any object that supports the buffer protocol.
+        """
+        cdef MemoryReader buffer = MemoryReader(value)
+        cdef Schema reader = self._reader_for(_read_registry_header(buffer))
+        return reader.type.binary_buffer_decode(buffer)
+
+    def decode_many(self, values) -> list:
+        """
+        Decode each registry framed value in `values`, and return a list of the decoded values.
+        """
+        cdef MemoryReader buffer = MemoryReader(b'')
+        cdef list decoded = []
+        cdef int64_t schema_id
+        cdef int64_t last_id = -1
+        cdef Schema reader = None
+        for value in values:
+            buffer._reset_to(value)
+            schema_id = _read_registry_header(buffer)
+            # Values in a batch often share a schema, so avoid the lookup where possible
+            if schema_id != last_id:
+                reader = self._reader_for(schema_id)
+                last_id = schema_id
+            decoded.append(reader.type.binary_buffer_decode(buffer))
+        return decoded
+
+    cdef int64_t _encode_schema_id(self) except -1:
+        if self.reader_schema is None:
+            raise ValueError("Encoding requires a RegistryCodec with a reader_schema")
+        if self.reader_schema_id < 0:
+            schema_id = self.registry.register(self.reader_schema)
+            if not 0 <= schema_id <= 0xffffffff:
+                raise ValueError(f"Schema id {schema_id} does not fit in 4 bytes")
+            self.reader_schema_id = schema_id
+        return self.reader_schema_id
+
+    def encode(self, value) -> bytes:
+        """
+        Encode `value` using `reader_schema`, with a header holding its id (registering the schema if needed).
+        """
+        cdef uint32_t schema_id = self._encode_schema_id()
+        cdef MemoryWriter buffer = self.reader_schema._take_scratch()
+        try:
+            _write_registry_header(buffer, schema_id)
+            self.reader_schema.type.binary_buffer_encode(buffer, value)
+            return buffer.bytes()
+        finally:
+            self.reader_schema._release_scratch(buffer)
+
+    def encode_many(self, values) -> list:
+        """
+        Encode each item in `values` as for `encode()`, and return a list of `bytes`.
+        """
+        cdef uint32_t schema_id = self._encode_schema_id()
+        cdef AvroType avro_type = self.reader_schema.type
+        cdef MemoryWriter buffer = self.reader_schema._take_scratch()
+        cdef list encoded = []
+        try:
+            for value in values:
+                buffer.reset()
+                _write_registry_header(buffer, schema_id)
+                avro_type.binary_buffer_encode(buffer, value)
+                encoded.append(buffer.bytes())
+            return encoded
+        finally:
+            self.reader_schema._release_scratch(buffer)
@@ -1,5 +1,7 @@
 import json
 import hashlib
+import threading
+from collections import OrderedDict
 
 cdef str resolve_namespaced_name(str namespace, str name):
     if '.' in name or namespace is None:
@@ -15,6 +17,63 @@ class _class_inst_method:
         return partial(self.func, inst, cls)
 
 
+cdef Py_ssize_t MAX_SCRATCH_SIZE = 1024 * 1024
+
+# Marks the start of a single-object encoded value, followed by the 8-byte little-endian Rabin fingerprint of the writer schema
+SINGLE_OBJECT_MAGIC = b'\xc3\x01'
+cdef size_t SINGLE_OBJECT_HEADER_SIZE = 10
+
+
+cdef int64_t _read_single_object_header(MemoryReader buffer) except? -1:
+    # Returns the schema fingerprint from the header
+    cdef uint64_t fingerprint = 0
+    cdef const uint8_t *header
+    cdef int i
+    if <size_t>(buffer.end_ptr - buffer.ptr) < SINGLE_OBJECT_HEADER_SIZE:
+        raise InvalidSingleObject("Value is too short to be single-object encoded")
+    header = buffer.advance(SINGLE_OBJECT_HEADER_SIZE)
+    if header[0] != 0xc3 or header[1] != 0x01:
+        raise InvalidSingleObject("Value does not start with the single-object encoding marker")
+    for i in range(7, -1, -1):
+        fingerprint = (fingerprint << 8) | header[2 + i]
+    return <int64_t>fingerprint
+
+
+cdef bytes _fingerprint_bytes(int64_t fingerprint):
+    return (<uint64_t>fingerprint).to_bytes(8, 'little', signed=False)
+
+
+def fingerprint_many(schemas) -> list:
+    """
+    Return the 8-byte Rabin fingerprint digest of each item in `schemas`.
+
+    Items may be `Schema` instances, whose (cached) fingerprints are used, or objects supporting the buffer protocol
+    that hold the utf-8 encoded parsing canonical form of a schema.
+    """
+    cdef list out = []
+    cdef int64_t value
+    cdef const uint8_t[:] data
+    if not RABIN_TABLE_CONFIGURED:
+        init_rabin_table()
+    for schema in schemas:
+        if isinstance(schema, Schema):
+            out.append((<Schema>schema)._fingerprint_hasher('rabin').digest())
+            continue
+        data = schema
+        value = RABIN_EMPTY
+        if data.shape[0]:
+            value = rabin_update(value, &data[0], data.shape[0])
+        out.append(_fingerprint_bytes(value))
+    return out
+
+
+def single_object_fingerprint(value) -> bytes:
+    """
+    Return the 8-byte Rabin fingerprint of the schema that was used to write the single-object encoded `value`.
+    """
+    return _fingerprint_bytes(_read_single_object_header(MemoryReader(value)))
+
+
 cdef class Schema:
 
     """
@@ -42,9 +101,19 @@ cdef class Schema:
     cdef readonly Options options
     cdef readonly AvroType type
     cdef str _canonical_form
+    cdef dict _fingerprints
+    cdef CompiledSchema _compiled
 
     cdef readonly dict logical_types
 
+    # The single-object encoding header, created on first use
+    cdef bytes _single_object_header
+    cdef int64_t _single_object_fingerprint
+
+    # Re-used by binary_encode, to avoid allocating a new buffer for each value
+    cdef MemoryWriter _scratch
+    cdef bint _scratch_in_use
+
     def __init__(self, source: Union[str, object], Options options: Options=DEFAULT_OPTIONS, *, named_types: dict[str, AvroType]=None, parse_json: bool=True, _type=None, **extra_options):
         if isinstance(source, (str, bytes)) and parse_json:
             source = json.loads(source)
@@ -56,6 +125,15 @@ cdef class Schema:
         self.logical_types = self._make_logical_types(options)
         self.type = AvroType.for_schema(self) if _type is None else _type
 
+    @staticmethod
+    def cached(source, Options options=DEFAULT_OPTIONS, **extra_options):
+        """
+        Return a shared `Schema` for `source` from the process-wide `SCHEMA_CACHE`, parsing it only if it's not already cached.
+
+        Takes the same arguments as `Schema()`, see `SchemaCache.get()`.
+        """
+        return SCHEMA_CACHE.get(source, options, **extra_options)
+
     @_class_inst_method
     def _wrap_type(inst, cls, AvroType avro_type, Options options=None):
         """
@@ -115,6 +193,27 @@ cdef class Schema:
         def __get__(self):
             return json.dumps(self.schema, indent=2)
 
+    cdef object _new_hasher(self, method, dict kwargs):
+        if method == 'rabin':
+            hasher = Rabin()
+        else:
+            try:
+                hasher = hashlib.new(method, **kwargs)
+            except ValueError:
+                raise InvalidHasher(f'Unknown hash method: {method!r}')
+        hasher.update(self.canonical_form.encode('utf-8'))
+        return hasher
+
+    cdef object _fingerprint_hasher(self, method):
+        # Fingerprints (without extra hashlib arguments) are cached, as the schema is effectively immutable
+        if self._fingerprints is None:
+            self._fingerprints = {}
+        hasher = self._fingerprints.get(method)
+        if hasher is None:
+            hasher = self._new_hasher(method, {})
+            self._fingerprints[method] = hasher
+        return hasher
+
     def fingerprint(self, method='rabin', **kwargs) -> Union[bytes, hashlib._hashlib.HASH]:
         """
         Return the deterministic fingerprint of the schema, using the given hash method.
@@ -123,18 +222,25 @@ cdef class Schema:
         
         Return type is controlled by the `fingerprint_returns_digest` option.
         """
-        if method == 'rabin':
-            hasher = Rabin()
+        if kwargs:
+            hasher = self._new_hasher(method, kwargs)
         else:
-            try:
-                hasher = hashlib.new(method, **kwargs)
-            except ValueError:
-                raise InvalidHasher(f'Unknown hash method: {method!r}')
-        hasher.update(self.canonical_form.encode('utf-8'))
+            hasher = self._fingerprint_hasher(method)
+            if not self.options.fingerprint_returns_digest:
+                # Callers may update the returned hasher, so don't hand out the cached one
+                hasher = hasher.copy()
         if self.options.fingerprint_returns_digest:
             return hasher.digest()
         return hasher
 
+    cdef bytes single_object_header(self):
+        cdef Rabin hasher
+        if self._single_object_header is None:
+            hasher = self._fingerprint_hasher('rabin')
+            self._single_object_fingerprint = hasher.value
+            self._single_object_header = SINGLE_OBJECT_MAGIC + hasher.digest()
+        return self._single_object_header
+
     cpdef AvroType find_type(self, str namespace, str name, bint _raise=True):
         """
         Given a namespace and name (namespace may be None), find and return the `AvroType` instance matching this name.
@@ -156,6 +262,17 @@ cdef class Schema:
         if _raise:
             raise UnknownType(f'Unknown type: {resolved!r}')
 
+    def compile(self) -> CompiledSchema:
+        """
+        Return a `CompiledSchema` that encodes and decodes values in the same way as this schema, but faster,
+        by flattening nested types into a single list of operations.
+
+        The compiled schema is created on the first call, and re-used after that.
+        """
+        if self._compiled is None:
+            self._compiled = CompiledSchema(self)
+        return self._compiled
+
     def can_encode(self, value: object) -> bool:
         """
         Check if `value` can be encoded using this schema
@@ -163,13 +280,115 @@ cdef class Schema:
         fitness = self.type.get_value_fitness(value)
         return fitness > FIT_NONE
 
+    cdef MemoryWriter _take_scratch(self):
+        # Encoding may call back into python code that encodes using this schema (e.g. from another thread)
+        # so only one user of the scratch buffer is allowed at a time
+        if self._scratch_in_use:
+            return MemoryWriter()
+        self._scratch_in_use = True
+        if self._scratch is None:
+            self._scratch = MemoryWriter()
+        else:
+            self._scratch.reset()
+        return self._scratch
+
+    cdef void _release_scratch(self, MemoryWriter buffer):
+        if buffer is self._scratch:
+            self._scratch_in_use = False
+            # Don't hold on to huge buffers after encoding an unusually large value
+            if buffer.buffer.ob_size > MAX_SCRATCH_SIZE:
+                self._scratch = None
+
     def binary_encode(self, value: object) -> bytes:
         """
         Encode `value` using this schema and return the avro bytes representing it.
         """
-        cdef MemoryWriter buffer = MemoryWriter()
-        self.type.binary_buffer_encode(buffer, value)
-        return buffer.bytes()
+        cdef MemoryWriter buffer = self._take_scratch()
+        try:
+            self.type.binary_buffer_encode(buffer, value)
+            return buffer.bytes()
+        finally:
+            self._release_scratch(buffer)
+
+    def single_object_encode(self, value: object) -> bytes:
+        """
+        Encode `value` using the avro single-object encoding, and return the bytes.
+
+        Single-object encoded values start with a header that holds the fingerprint of this schema,
+        so can be decoded without knowing the writer schema in advance (see `SchemaStore`).
+        """
+        cdef bytes header = self.single_object_header()
+        cdef MemoryWriter buffer = self._take_scratch()
+        try:
+            buffer.write_n(header)
+            self.type.binary_buffer_encode(buffer, value)
+            return buffer.bytes()
+        finally:
+            self._release_scratch(buffer)
+
+    def single_object_decode(self, value) -> object:
+        """
+        Decode the single-object encoded `value` using this schema, and return the decoded value.
+
+        Raises `UnknownFingerprint` if `value` was not written using this schema.
+        To decode values written with other schemas, use a `SchemaStore`.
+        """
+        self.single_object_header()
+        cdef MemoryReader buffer = MemoryReader(value)
+        cdef int64_t fingerprint = _read_single_object_header(buffer)
+        if fingerprint != self._single_object_fingerprint:
+            raise UnknownFingerprint(_fingerprint_bytes(fingerprint))
+        return self.type.binary_buffer_decode(buffer)
+
+    def binary_encode_many(self, values, bint contiguous=False):
+        """
+        Encode each item in `values` using this schema.
+
+        If `contiguous` is `False` (the default), a list of `bytes` is returned, one for each value.
+        If `contiguous` is `True`, a tuple of `(data, offsets)` is returned, where `data` is a single `bytes` object
+        holding all of the encoded values, and `offsets` is an `array.array` of `len(values) + 1` positions,
+        such that the `i`th value is encoded in `data[offsets[i]:offsets[i + 1]]`.
+        """
+        cdef AvroType avro_type = self.type
+        cdef MemoryWriter buffer = self._take_scratch()
+        cdef list encoded
+        cdef array.array offsets
+        cdef Py_ssize_t *offset_ptr
+        cdef Py_ssize_t i
+        try:
+            if not contiguous:
+                encoded = []
+                for value in values:
+                    buffer.reset()
+                    avro_type.binary_buffer_encode(buffer, value)
+                    encoded.append(buffer.bytes())
+                return encoded
+            if not isinstance(values, (list, tuple)):
+                values = list(values)
+            offsets = array.clone(_EMPTY_ARRAY, len(values) + 1, zero=False)
+            offset_ptr = <Py_ssize_t *>offsets.data.as_voidptr
+            offset_ptr[0] = 0
+            for i, value in enumerate(values, 1):
+                avro_type.binary_buffer_encode(buffer, value)
+                offset_ptr[i] = buffer.len
+            return buffer.bytes(), offsets
+        finally:
+            self._release_scratch(buffer)
+
+    cpdef Py_ssize_t binary_encode_into(self, MemoryWriter writer, value) except -1:
+        """
+        Append the encoded form of `value` to `writer`, and return the number of bytes written.
+
+        This allows a single `MemoryWriter` to be re-used (see `MemoryWriter.reset()`) for encoding many values.
+        If encoding fails, `writer` is left unchanged.
+        """
+        cdef size_t start = writer.len
+        try:
+            self.type.binary_buffer_encode(writer, value)
+        except:
+            writer.len = start
+            raise
+        return writer.len - start
 
     def binary_decode(self, bytes value: bytes) -> object:
         """
@@ -178,6 +397,49 @@ cdef class Schema:
         cdef MemoryReader buffer = MemoryReader(value)
         return self.type.binary_buffer_decode(buffer)
 
+    def binary_decode_many(self, value, count=None) -> list:
+        """
+        Decode `count` consecutive values from `value` using this schema, and return them as a list.
+        `value` may be any object that supports the buffer protocol (e.g. `bytes`, `memoryview`).
+        If `count` is `None`, values are decoded until the end of `value` is reached.
+        """
+        cdef MemoryReader buffer = MemoryReader(value)
+        cdef list values
+        if count is not None:
+            return self.binary_read_many(buffer, count)
+        values = []
+        while buffer.ptr < buffer.end_ptr:
+            values.append(self.type.binary_buffer_decode(buffer))
+        return values
+
+    def validate_bytes(self, value, bint check_utf8=False):
+        """
+        Check that `value` holds exactly one validly encoded value for this schema, without decoding it.
+
+        Varints, lengths, union and enum indexes, and block sizes are checked.  If `check_utf8` is `True`, then
+        strings (and map keys) must also be valid utf-8.  Logical types are not checked.
+
+        Raises `InvalidEncoding`, with the offset of the invalid data, if the value is not valid.
+        """
+        cdef MemoryReader buffer = MemoryReader(value)
+        cdef _Validator validator = _Validator(buffer, check_utf8)
+        cdef const uint8_t *end = self.type.binary_buffer_validate(validator, buffer.ptr)
+        if end != buffer.end_ptr:
+            raise validator.error(end, f"{buffer.end_ptr - end} bytes of trailing data after the value")
+
+    cpdef list binary_read_many(self, _Reader reader: _Reader, Py_ssize_t count):
+        """
+        Read `count` consecutive values from `reader` using this schema, and return them as a list.
+        """
+        if count < 0:
+            raise ValueError(f"count must not be negative, got: {count}")
+        cdef AvroType avro_type = self.type
+        cdef list values = [None] * count
+        cdef Py_ssize_t i
+        for i in range(count):
+            values[i] = avro_type.binary_buffer_decode(reader)
+        return values
+
     cpdef binary_read(self, _Reader reader: _Reader):
         """
         Read a value from `reader` using this schema and return the decoded value.
@@ -223,6 +485,105 @@ cdef class Schema:
 
 
 
+DEFAULT_SCHEMA_CACHE_SIZE = 128
+
+
+@cython.final
+cdef class SchemaCache:
+
+    """
+    A thread-safe cache of parsed `Schema` objects, that discards the least recently used schema when full.
+
+    Parsing a schema is relatively expensive, so code that repeatedly creates schemas from the same source
+    can use a cache to share a single `Schema` instance.  `Schema.cached()` uses the process-wide `SCHEMA_CACHE`.
+
+    Schemas are looked up by their source text (or json-encoded source object), options instance, and extra options.
+    The source is used, rather than the canonical form, as the canonical form ignores attributes
+    such as defaults, aliases, and logical types, which change how values are encoded and decoded.
+
+    Arguments:
+     * `maxsize`: The maximum number of schemas to keep. Defaults to `DEFAULT_SCHEMA_CACHE_SIZE`
+    """
+
+    cdef readonly Py_ssize_t maxsize
+    cdef readonly Py_ssize_t hits
+    cdef readonly Py_ssize_t misses
+    cdef object entries
+    cdef object lock
+
+    def __init__(self, Py_ssize_t maxsize=DEFAULT_SCHEMA_CACHE_SIZE):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, not {maxsize}")
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        return f'<SchemaCache size={len(self.entries)} maxsize={self.maxsize} hits={self.hits} misses={self.misses}>'
+
+    cdef object _key(self, source, Options options, dict extra_options):
+        # Returns None if the arguments cannot be cached
+        if isinstance(source, (str, bytes)):
+            source_key = source
+        else:
+            try:
+                source_key = json.dumps(source, sort_keys=True)
+            except (TypeError, ValueError):
+                return None
+        key = (source_key, id(options))
+        if extra_options:
+            key += tuple(sorted(extra_options.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, source, Options options=DEFAULT_OPTIONS, **extra_options) -> Schema:
+        """
+        Return the cached `Schema` for `source`, creating (and caching) it if needed.
+
+        The returned schema is shared with every other caller, so must not be modified.
+        Arguments are as for `Schema()`, except that `named_types` and `parse_json` are not supported.
+        """
+        key = self._key(source, options, extra_options)
+        if key is None:
+            return Schema(source, options, **extra_options)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        # Parse without holding the lock, another thread may race us to the same schema, in which case the first one wins
+        schema = Schema(source, options, **extra_options)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                return entry[1]
+            # The options are kept alive with the schema, so that their id cannot be re-used while the entry exists
+            self.entries[key] = (options, schema)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return schema
+
+    def clear(self):
+        """
+        Remove all schemas from the cache, and reset the `hits` and `misses` counters.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+SCHEMA_CACHE = SchemaCache()
+
+
 cdef class ResolvedSchema(Schema):
 
     """
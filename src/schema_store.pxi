@@ -0,0 +1,89 @@
+
+@cython.final
+cdef class SchemaStore:
+
+    """
+    A collection of schemas, looked up by their Rabin fingerprint, for decoding single-object encoded values.
+
+    When a `reader_schema` is given, each writer schema is resolved to it (see `Schema.reader_for_writer()`)
+    the first time it's used, and the resolved schema is cached, so all values are decoded to match the reader schema.
+    Without a `reader_schema`, values are decoded using the writer schema directly.
+
+    Arguments:
+     * `schemas`: Writer schemas to add to the store
+     * `reader_schema`: Optional schema that decoded values should match. This is added to the store
+    """
+
+    cdef readonly Schema reader_schema
+    cdef dict writers  # fingerprint -> writer Schema
+    cdef dict readers  # fingerprint -> Schema used to decode values written with that fingerprint
+
+    def __init__(self, schemas=(), Schema reader_schema=None):
+        self.writers = {}
+        self.readers = {}
+        self.reader_schema = reader_schema
+        if reader_schema is not None:
+            self.add(reader_schema)
+        for schema in schemas:
+            self.add(schema)
+
+    def __len__(self):
+        return len(self.writers)
+
+    def __contains__(self, bytes fingerprint):
+        return self._fingerprint_value(fingerprint) in self.writers
+
+    cdef int64_t _fingerprint_value(self, bytes fingerprint) except? -1:
+        if len(fingerprint) != 8:
+            raise ValueError(f"Rabin fingerprints are 8 bytes long, got {len(fingerprint)}")
+        return int.from_bytes(fingerprint, 'little', signed=True)
+
+    cpdef bytes add(self, Schema schema):
+        """
+        Add the writer `schema` to this store, and return its 8-byte Rabin fingerprint.
+        """
+        header = schema.single_object_header()
+        self.writers[schema._single_object_fingerprint] = schema
+        self.readers.pop(schema._single_object_fingerprint, None)
+        return header[2:]
+
+    def get(self, bytes fingerprint) -> Schema:
+        """
+        Return the writer schema with the given 8-byte Rabin `fingerprint`, raising `UnknownFingerprint` if it's not in this store.
+        """
+        schema = self.writers.get(self._fingerprint_value(fingerprint))
+        if schema is None:
+            raise UnknownFingerprint(fingerprint)
+        return schema
+
+    cdef Schema _reader_for(self, int64_t fingerprint):
+        cdef Schema reader = self.readers.get(fingerprint)
+        if reader is not None:
+            return reader
+        cdef Schema writer = self.writers.get(fingerprint)
+        if writer is None:
+            raise UnknownFingerprint(_fingerprint_bytes(fingerprint))
+        if self.reader_schema is None or writer is self.reader_schema:
+            reader = writer
+        else:
+            reader = self.reader_schema.reader_for_writer(writer)
+        self.readers[fingerprint] = reader
+        return reader
+
+    def decode(self, value) -> object:
+        """
+        Decode the single-object encoded `value`, using the schema that matches its fingerprint.
+
+        Raises `UnknownFingerprint` if the value was written with a schema that is not in this store.
+        """
+        cdef MemoryReader buffer = MemoryReader(value)
+        cdef Schema reader = self._reader_for(_read_single_object_header(buffer))
+        return reader.type.binary_buffer_decode(buffer)
+
+    def encode(self, value) -> bytes:
+        """
+        Encode `value` using the single-object encoding of `reader_schema`.
+        """
+        if self.reader_schema is None:
+            raise ValueError("Encoding requires a SchemaStore with a reader_schema")
+        return self.reader_schema.single_object_encode(value)
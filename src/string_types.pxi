@@ -24,6 +24,14 @@ cdef class BytesType(AvroType):
         cdef uint64_t length = zigzag_decode_long(buffer)
         return buffer.read_bytes(length)
 
+    cdef int binary_buffer_skip(self, _Reader buffer) except -1:
+        skip_length_prefixed(buffer)
+
+    cdef const uint8_t *binary_buffer_validate(self, _Validator validator, const uint8_t *ptr) except NULL:
+        cdef int64_t length
+        ptr = validator.read_length(ptr, &length)
+        return ptr + length
+
     cdef int _get_value_fitness(self, value) except -1:
         if isinstance(value, (bytes, bytearray)):  # If bytes, we're good
             return FIT_EXACT
@@ -46,6 +54,11 @@ cdef class BytesType(AvroType):
             return FIT_NONE
         return MAX_FIT
 
+    cdef bint _may_fit_type(self, type value_type) except -1:
+        if self.options.bytes_codec:
+            return True
+        return issubclass(value_type, (bytes, bytearray))
+
     cdef _json_format(self, value):
         value = self.convert_value(value)
         return value.decode('latin-1')
@@ -114,6 +127,12 @@ cdef class StringType(AvroType):
         cdef uint64_t length = zigzag_decode_long(buffer)
         return buffer.read_bytes(length).decode('utf-8', errors=self.options.unicode_errors)
 
+    cdef int binary_buffer_skip(self, _Reader buffer) except -1:
+        skip_length_prefixed(buffer)
+
+    cdef const uint8_t *binary_buffer_validate(self, _Validator validator, const uint8_t *ptr) except NULL:
+        return _validate_string(validator, ptr)
+
     cdef int _get_value_fitness(self, value) except -1:
         if isinstance(value, str):
             return FIT_EXACT
@@ -123,6 +142,9 @@ cdef class StringType(AvroType):
             return FIT_POOR
         return FIT_NONE
 
+    cdef bint _may_fit_type(self, type value_type) except -1:
+        return issubclass(value_type, str) or self.options.coerce_values_to_str
+
     cdef _json_format(self, value):
         return self._convert_value(value)
 
@@ -181,6 +203,12 @@ cdef class FixedType(_NamedType):
     cdef _binary_buffer_decode(self, _Reader buffer):
         return bytes(buffer.read_n(self.size))
 
+    cdef int binary_buffer_skip(self, _Reader buffer) except -1:
+        buffer.skip(self.size)
+
+    cdef const uint8_t *binary_buffer_validate(self, _Validator validator, const uint8_t *ptr) except NULL:
+        return validator.need(ptr, self.size)
+
     cdef int _get_value_fitness(self, value) except -1:
         MAX_FIT = FIT_EXACT
         if not isinstance(value, (bytes, bytearray)):
@@ -214,6 +242,9 @@ cdef class FixedType(_NamedType):
             return FIT_OK
         return FIT_NONE
 
+    cdef bint _may_fit_type(self, type value_type) except -1:
+        return issubclass(value_type, (bytes, bytearray)) or self.options.fixed_codec is not None
+
     cdef _json_format(self, value):
         value = self._convert_value(value)
         return value.decode('latin1', errors=self.options.unicode_errors)
@@ -22,3 +22,157 @@ def _tests(add):
         import pytest
         with pytest.raises(EOFError):
             buffer.read_n(2)
+
+    @add
+    def _test_buffered_file_reader_read_u8():
+        import io
+        import pytest
+        reader = FileReader(io.BytesIO(b'\x01\x02\x03\x04\x05'), 2)
+        assert [reader.read_u8() for _ in range(5)] == [1, 2, 3, 4, 5]
+        with pytest.raises(EOFError):
+            reader.read_u8()
+
+    @add
+    def _test_buffered_file_reader_read_n():
+        import io
+        import pytest
+        reader = FileReader(io.BytesIO(b'abacuscounter1'), 4)
+        assert reader.read_u8() == ord('a')
+        assert bytes(reader.read_n(5)) == b'bacus'
+        assert bytes(reader.read_n(7)) == b'counter'
+        assert reader.buffer_size == 4
+        with pytest.raises(EOFError):
+            reader.read_n(2)
+
+    @add
+    def _test_buffered_file_reader_short_reads():
+        import io
+
+        class Trickle(io.RawIOBase):
+            def __init__(self, data):
+                self.data = data
+            def readable(self):
+                return True
+            def read(self, n):
+                chunk, self.data = self.data[:1], self.data[1:]
+                return chunk
+
+        reader = FileReader(Trickle(b'0123456789'), 4)
+        assert bytes(reader.read_n(3)) == b'012'
+        assert bytes(reader.read_n(3)) == b'345'
+        assert bytes(reader.read_n(4)) == b'6789'
+
+    @add
+    def _test_buffered_file_writer():
+        import io
+        out = io.BytesIO()
+        writer = FileWriter(out, 4)
+        writer.write_u8(1)
+        writer.write_n(b'\x02\x03')
+        assert out.getvalue() == b''
+        writer.write_n(b'\x04\x05')
+        assert out.getvalue() == b'\x01\x02\x03'
+        writer.write_n(b'abcdefgh')
+        assert out.getvalue() == b'\x01\x02\x03\x04\x05abcdefgh'
+        writer.write_u8(6)
+        writer.flush()
+        assert out.getvalue() == b'\x01\x02\x03\x04\x05abcdefgh\x06'
+        assert writer.buffer_size == 4
+
+    @add
+    def _test_buffered_file_writer_del():
+        import io
+        out = io.BytesIO()
+        writer = FileWriter(out, 1024)
+        writer.write_n(b'abc')
+        del writer
+        assert out.getvalue() == b'abc'
+
+    @add
+    def _test_mmap_reader():
+        import tempfile
+        import pytest
+        with tempfile.TemporaryFile() as fh:
+            fh.write(b'\x01abacus')
+            fh.flush()
+            reader = MmapReader(fh)
+            assert reader.read_u8() == 1
+            view = reader.read_n(6)
+            assert bytes(view) == b'abacus'
+            assert (<object>view).base is reader.mapping
+            with pytest.raises(EOFError):
+                reader.read_u8()
+
+    @add
+    def _test_mmap_reader_empty():
+        import tempfile
+        import pytest
+        with tempfile.TemporaryFile() as fh:
+            reader = MmapReader(fh)
+            with pytest.raises(EOFError):
+                reader.read_u8()
+
+    @add
+    def _test_memory_reader_seek():
+        import pytest
+        reader = MemoryReader(b'0123456789')
+        reader.skip(3)
+        assert reader.tell() == 3
+        reader.seek(8)
+        assert bytes(reader.read_n(2)) == b'89'
+        reader.seek(1)
+        assert reader.read_u8() == ord('1')
+        with pytest.raises(EOFError):
+            reader.seek(11)
+        with pytest.raises(EOFError):
+            reader.skip(20)
+
+    def _test_file_reader_seek(buffer_size):
+        import io
+        reader = FileReader(io.BytesIO(b'0123456789'), buffer_size)
+        assert reader.read_u8() == ord('0')
+        assert reader.tell() == 1
+        reader.skip(2)
+        assert reader.tell() == 3
+        assert bytes(reader.read_n(2)) == b'34'
+        reader.seek(1)
+        assert reader.tell() == 1
+        assert bytes(reader.read_n(3)) == b'123'
+        reader.skip(5)
+        assert reader.tell() == 9
+        assert reader.read_u8() == ord('9')
+        reader.seek(0)
+        assert bytes(reader.read_n(10)) == b'0123456789'
+    for buffer_size in [0, 4, 1024]:
+        add(_test_file_reader_seek, buffer_size)
+
+    @add
+    def _test_buffered_file_reader_seek_after_skip():
+        import io
+        reader = FileReader(io.BytesIO(b'abcdefghijklmnopqrstuvwxyz'), 4)
+        assert reader.read_u8() == ord('a')
+        # Skipping, and large reads, move the file past the window
+        reader.skip(10)
+        assert reader.tell() == 11
+        reader.seek(15)
+        assert reader.read_u8() == ord('p')
+        reader.seek(1)
+        assert bytes(reader.read_n(2)) == b'bc'
+        assert bytes(reader.read_n(10)) == b'defghijklm'
+        reader.seek(2)
+        assert reader.read_u8() == ord('c')
+
+    @add
+    def _test_buffered_file_reader_skip_unseekable():
+        class ReadOnly:
+            def __init__(self, data):
+                self.data = data
+            def read(self, n):
+                chunk, self.data = self.data[:n], self.data[n:]
+                return chunk
+
+        for buffer_size in [0, 4]:
+            reader = FileReader(ReadOnly(b'abcdefghijklmnopqrstuvwxyz'), buffer_size)
+            assert reader.read_u8() == ord('a')
+            reader.skip(10)
+            assert reader.read_u8() == ord('l')
@@ -0,0 +1,68 @@
+cdef Py_ssize_t _resolve_all_members(UnionType union_type, value) except -2:
+    # The union resolution rules, checking every member
+    cdef AvroType candidate
+    cdef int type_fitness
+    cdef int cur_fit = FIT_NONE
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t best_index = -1
+    for candidate in union_type.union_types:
+        type_fitness = candidate.get_value_fitness(value)
+        if type_fitness > cur_fit:
+            best_index = i
+            if type_fitness == FIT_EXACT:
+                return i
+            cur_fit = type_fitness
+        i += 1
+    return best_index if cur_fit > FIT_NONE else -1
+
+
+_RECORD_A = {'type': 'record', 'name': 'A', 'fields': [{'name': 'x', 'type': 'int'}]}
+_RECORD_B = {'type': 'record', 'name': 'B', 'fields': [{'name': 'x', 'type': ['int', 'string']}]}
+_RECORD_C = {'type': 'record', 'name': 'C', 'fields': [{'name': 'x', 'type': 'int'}, {'name': 'y', 'type': 'string', 'default': ''}]}
+
+_UNION_RESOLVE_CASES = [
+    (['int', 'long'], {}, [5, 2**40, 5, -2**31, -2**31 - 1, 'a', None, True]),
+    (['null', 'int', 'double', 'string'], {}, [None, 1, 1.5, 'a', b'b', True, 2**40, [1]]),
+    (['null', 'int', 'double', 'string'], {'coerce_values_to_str': True, 'coerce_values_to_int': True}, [None, 1, 1.5, 'a', b'b', True, 2**40, [1]]),
+    (['boolean', 'float', 'bytes'], {'coerce_values_to_boolean': True, 'bytes_codec': 'utf-8'}, [True, 1, 1.5, 'a', b'b', None, 1e300]),
+    (['string', {'type': 'enum', 'name': 'E', 'symbols': ['a', 'b']}], {}, ['a', 'c', 1]),
+    ([{'type': 'array', 'items': 'int'}, {'type': 'map', 'values': 'int'}, 'string'], {}, [[1], (1, 2), {'a': 1}, 'a', 1, None, [('a', 1)]]),
+    ([_RECORD_A, _RECORD_B, _RECORD_C], {}, [{'x': 1}, {'x': 'a'}, {'x': 1}, {'x': 1, 'y': 'a'}, {'y': 'a'}, {}, {'x': 1, 'z': 1}, 1]),
+    ([_RECORD_A, _RECORD_B, _RECORD_C], {'record_allow_extra_fields': True}, [{'x': 1}, {'x': 'a'}, {'x': 1, 'z': 1}, {'x': 'a', 'z': 1}]),
+    ([_RECORD_A, _RECORD_B, _RECORD_C], {'record_values_type_hint': True}, [{'x': 1}, {'x': 1, '-type': 'B'}, {'x': 1, '-type': 'C'}, {'x': 'a', '-type': 'A'}, {'x': 1, '-type': 1}]),
+    (['null', _RECORD_A, {'type': 'map', 'values': 'int'}], {}, [{'x': 1}, {'x': 'a'}, {'y': 1}, None]),
+    (['null', {'type': 'long', 'logicalType': 'timestamp-millis'}, 'string'], {}, [None, 'a', 1, datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)]),
+]
+
+
+@_tests
+def _tests(add):
+
+    def _test_union_resolve_cache(case_index):
+        source, options, values = _UNION_RESOLVE_CASES[case_index]
+        for ordering in itertools.islice(itertools.permutations(range(len(values))), 50):
+            schema = Schema(source, **options)
+            union_type = <UnionType>schema.type
+            # Records are included, as well as dicts
+            ordered = [values[i] for i in ordering]
+            ordered += [schema.named_types['A'].record(**v) for v in ordered if schema.named_types.get('A') and v == {'x': 1}]
+            for value in ordered + ordered:
+                expected = _resolve_all_members(union_type, value)
+                try:
+                    actual = union_type.resolve_from_value(value)
+                except InvalidValue:
+                    actual = -1
+                assert actual == expected, (source, value, actual, expected)
+
+    for case_index in range(len(_UNION_RESOLVE_CASES)):
+        add(_test_union_resolve_cache, case_index)
+
+    @add
+    def _test_union_resolve_cache_bounded():
+        schema = Schema(['null', _RECORD_A, _RECORD_C])
+        union_type = <UnionType>schema.type
+        for i in range(MAX_UNION_RESOLVE_CACHE_SIZE + 10):
+            value = {'x': 1, 'y': 'a', f'extra{i}': 1}
+            assert union_type.resolve_from_value(value) == _resolve_all_members(union_type, value)
+        assert len(union_type.resolve_cache) == MAX_UNION_RESOLVE_CACHE_SIZE
+        assert union_type.resolve_from_value({'x': 1, 'y': 'a'}) == 2
@@ -97,4 +97,32 @@ def _tests(add):
          0x7fffffffffffull, 0x7fffffffffffffull, 0x7fffffffffffffffull,
         UINT64_MAX]:
         add(test_readvarlong, mask)
-        add(test_zigzag_long, mask)
\ No newline at end of file
+        add(test_zigzag_long, mask)
+
+    def test_varint_memory_paths(uint64_t mask):
+        # Values are decoded directly from the buffer if there's space for the longest varint, and byte-by-byte otherwise
+        cdef random_t state
+        cdef uint64_t given
+        cdef bytes src
+        cdef MemoryReader reader
+        cdef uint64_t i
+        cdef uint64_t pad = UINT64_MAX
+
+        for i in range(10_000):
+            given = (<uint64_t>rand(&state) | (<uint64_t>rand(&state) << 32)) & mask
+            src = boring_varint_encoder(given)
+            for padded in (src, src + (<char*>&pad)[:8] + (<char*>&pad)[:2]):
+                reader = MemoryReader(padded)
+                if read_varlong(reader) != given or reader.tell() != len(src):
+                    raise AssertionError(f"{padded}: {given} != {read_varlong(MemoryReader(padded))}")
+                if given <= UINT32_MAX:
+                    reader = MemoryReader(padded)
+                    if read_varint(reader) != given or reader.tell() != len(src):
+                        raise AssertionError(f"{padded}: {given} != {read_varint(MemoryReader(padded))}")
+                reader = MemoryReader(padded)
+                skip_varint(reader)
+                if reader.tell() != len(src):
+                    raise AssertionError(f"{padded}: skipped {reader.tell()} bytes, not {len(src)}")
+
+    for mask in [0x7f, 0x7fff, 0x7fffffff, UINT32_MAX, 0x7fffffffffffffffull, UINT64_MAX]:
+        add(test_varint_memory_paths, mask)
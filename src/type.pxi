@@ -4,6 +4,8 @@ cdef int FIT_POOR = 1  # Value may be valid depending on the schema options
 cdef int FIT_OK = 2    # Value can be converted to the correct type
 cdef int FIT_EXACT = 3 # Value is the exact type and needs no further conversion
 
+cdef type NoneType = type(None)
+
 
 CANONICAL_FORM_KEYS = ('name', 'type', 'fields', 'symbols', 'items', 'values', 'size')
 
@@ -166,6 +168,15 @@ cdef class AvroType:
         raise NotImplementedError(
             f"{type(self).__name__} does not implement binary_buffer_decode")
 
+    cdef int binary_buffer_skip(self, _Reader buffer) except -1:
+        # Move past an encoded value, without creating it.  Types that can do better than decoding override this.
+        self._binary_buffer_decode(buffer)
+
+    cdef const uint8_t *binary_buffer_validate(self, _Validator validator, const uint8_t *ptr) except NULL:
+        # Check that an encoded value starting at `ptr` is valid, and return a pointer to the end of it.
+        # Types that can check more than skipping does override this.
+        return validator.skip_with(self, ptr)
+
     cdef int get_value_fitness(self, value) except -1:
         cdef ValueAdapter adapter
         
@@ -190,6 +201,17 @@ cdef class AvroType:
         raise NotImplementedError(
             f"{type(self).__name__} does not implement _get_value_fitness")
 
+    cdef bint may_fit_type(self, type value_type) except -1:
+        # Returns False only if get_value_fitness() is FIT_NONE for every value of exactly `value_type`.
+        # Used by unions to narrow down the members that have to be checked for a value.
+        if self.value_adapters:
+            # Adapters (e.g. logical types) may convert values of any type
+            return True
+        return self._may_fit_type(value_type)
+
+    cdef bint _may_fit_type(self, type value_type) except -1:
+        return True
+
     cdef int assert_value(self, object value) except -1:
         cdef int fitness = self.get_value_fitness(value)
         if fitness == FIT_NONE:
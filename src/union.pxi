@@ -21,6 +21,10 @@ cdef bint are_union_values_ambiguous(sub_types):
     return False
 
 
+# The maximum number of value types (or record dict key sets) a union remembers the candidate members for
+cdef Py_ssize_t MAX_UNION_RESOLVE_CACHE_SIZE = 256
+
+
 @cython.final
 cdef class UnionType(AvroType):
     """The avro union type"""
@@ -29,9 +33,13 @@ cdef class UnionType(AvroType):
     cdef readonly tuple union_types
     cdef readonly dict by_name_map
     cdef readonly tuple return_type_tuple
+    cdef dict resolve_cache
+    cdef int has_records
 
     def __init__(self, schema, source, namespace):
         super().__init__(schema, source, namespace)
+        self.resolve_cache = {}
+        self.has_records = -1
         self.union_types = tuple(AvroType.for_source(schema, s, namespace) for s in source)
         if len(self.union_types) == 0 and not self.options.allow_empty_unions:
             raise ValueError("Unions must contain at least one member type")
@@ -79,6 +87,8 @@ cdef class UnionType(AvroType):
         new_inst.union_types = self.union_types
         new_inst.by_name_map = self.by_name_map.copy()
         new_inst.return_type_tuple = self.return_type_tuple
+        new_inst.resolve_cache = {}
+        new_inst.has_records = -1
         return new_inst
 
     cdef _make_logical(self, schema, source):
@@ -99,20 +109,75 @@ cdef class UnionType(AvroType):
             created = set()
         return [t.get_schema(created) for t in self.union_types]
 
+    cdef object _resolve_cache_key(self, object value):
+        # Values with the same key have the same set of members that might fit them, see _candidate_indexes.
+        # Returns None if the value should not be cached.
+        cdef type value_type = type(value)
+        if self.options.allow_tuple_notation and value_type is tuple:
+            return None
+        if not isinstance(value, dict):
+            return value_type
+        if self.has_records < 0:
+            self.has_records = any(isinstance(member, RecordType) for member in self.union_types)
+        if not self.has_records:
+            return value_type
+        # Whether a record might fit a dict depends on its keys
+        if self.options.record_values_type_hint and '-type' in value:
+            type_hint = value['-type']
+            if not isinstance(type_hint, str):
+                return None
+            return (value_type, frozenset(value), type_hint)
+        return (value_type, frozenset(value))
+
+    cdef tuple _candidate_indexes(self, object value):
+        # The indexes of the members that might fit values with the same cache key as `value`.
+        # Other members would always have a fitness of FIT_NONE, so can never be chosen.
+        cdef AvroType member
+        cdef Py_ssize_t i = 0
+        cdef list candidates = []
+        cdef type value_type = type(value)
+        cdef bint is_dict = isinstance(value, dict)
+        for member in self.union_types:
+            if member.may_fit_type(value_type):
+                if not (is_dict and type(member) is RecordType and not member.value_adapters) or (<RecordType>member).may_fit_keys(value):
+                    candidates.append(i)
+            i += 1
+        return tuple(candidates)
+
     cdef Py_ssize_t resolve_from_value(self, object value) except -1:
         cdef AvroType candidate
         cdef int type_fitness
         cdef int cur_fit = FIT_NONE
         cdef Py_ssize_t i = 0
         cdef Py_ssize_t best_index = -1
-        for candidate in self.union_types:
-            type_fitness = candidate.get_value_fitness(value)
-            if type_fitness > cur_fit:
-                best_index = i
-                if type_fitness == FIT_EXACT:
-                    return i
-                cur_fit = type_fitness
-            i += 1
+        cdef tuple candidates = None
+        if self.resolve_cache is None:
+            self.resolve_cache = {}
+        key = self._resolve_cache_key(value)
+        if key is not None:
+            candidates = self.resolve_cache.get(key)
+            if candidates is None and len(self.resolve_cache) < MAX_UNION_RESOLVE_CACHE_SIZE:
+                candidates = self._candidate_indexes(value)
+                self.resolve_cache[key] = candidates
+        if candidates is not None:
+            # Same rules as below, but only checking the members that might fit
+            for i in candidates:
+                candidate = self.union_types[i]
+                type_fitness = candidate.get_value_fitness(value)
+                if type_fitness > cur_fit:
+                    best_index = i
+                    if type_fitness == FIT_EXACT:
+                        return i
+                    cur_fit = type_fitness
+        else:
+            for candidate in self.union_types:
+                type_fitness = candidate.get_value_fitness(value)
+                if type_fitness > cur_fit:
+                    best_index = i
+                    if type_fitness == FIT_EXACT:
+                        return i
+                    cur_fit = type_fitness
+                i += 1
         if cur_fit == FIT_NONE or best_index < 0:
             raise InvalidValue(value, self)
         return best_index
@@ -134,6 +199,21 @@ cdef class UnionType(AvroType):
             return (item.type, decoded)
         return decoded
 
+    cdef int binary_buffer_skip(self, _Reader buffer) except -1:
+        cdef Py_ssize_t index = zigzag_decode_long(buffer)
+        if index < 0 or index >= len(self.union_types):
+            raise ValueError(f"Value {index} is not valid for a union of {len(self.union_types)} items")
+        cdef AvroType item = self.union_types[index]
+        item.binary_buffer_skip(buffer)
+
+    cdef const uint8_t *binary_buffer_validate(self, _Validator validator, const uint8_t *ptr) except NULL:
+        cdef int64_t index
+        cdef const uint8_t *end = validator.read_long(ptr, &index)
+        if index < 0 or index >= len(self.union_types):
+            raise validator.error(ptr, f"Value {index} is not valid for a union of {len(self.union_types)} items")
+        cdef AvroType item = self.union_types[index]
+        return item.binary_buffer_validate(validator, end)
+
     cdef int _get_value_fitness(self, value) except -1:
         cdef AvroType union_type
         cdef int level = FIT_NONE
@@ -143,6 +223,13 @@ cdef class UnionType(AvroType):
                 return level
         return level
 
+    cdef bint _may_fit_type(self, type value_type) except -1:
+        cdef AvroType member
+        for member in self.union_types:
+            if member.may_fit_type(value_type):
+                return True
+        return False
+
     cdef _json_format(self, value):
         cdef size_t type_index = self.resolve_from_value(value)
         cdef AvroType union_type = self.union_types[type_index]
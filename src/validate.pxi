@@ -0,0 +1,123 @@
+# Structural validation of encoded values.  Types validate by walking the encoded data with raw pointers
+# (see AvroType.binary_buffer_validate), so no python objects are created for valid data.
+
+@cython.final
+cdef class _Validator:
+
+    cdef MemoryReader reader  # Used by types that validate by skipping
+    cdef const uint8_t *start
+    cdef const uint8_t *end
+    cdef bint check_utf8
+
+    def __init__(self, MemoryReader reader, bint check_utf8):
+        self.reader = reader
+        self.start = &reader.data[0]
+        self.end = reader.end_ptr
+        self.check_utf8 = check_utf8
+
+    cdef error(self, const uint8_t *ptr, str reason):
+        return InvalidEncoding(reason, ptr - self.start)
+
+    cdef inline const uint8_t *need(self, const uint8_t *ptr, size_t num) except NULL:
+        if <size_t>(self.end - ptr) < num:
+            raise self.error(ptr, "Not enough input data to read value")
+        return ptr + num
+
+    cdef const uint8_t *read_long(self, const uint8_t *ptr, int64_t *out, bint is_int=False) except NULL:
+        # Read a zigzag varint, checking that it's not too long for an int (or long)
+        cdef const uint8_t *value_start = ptr
+        cdef uint64_t value = 0
+        cdef uint64_t cur
+        cdef unsigned int shift = 0
+        cdef unsigned int max_shift = 28 if is_int else 63
+        while True:
+            if ptr == self.end:
+                raise self.error(value_start, "Not enough input data to read value")
+            cur = ptr[0]
+            ptr += 1
+            if shift == max_shift and cur >> (32 - max_shift if is_int else 1):
+                raise self.error(value_start, f"Varint is too large for {'an int' if is_int else 'a long'}")
+            value |= (cur & 0b01111111) << shift
+            if not cur & 0b10000000:
+                break
+            shift += 7
+        out[0] = <int64_t>((value >> 1) ^ (-(value & 1)))
+        return ptr
+
+    cdef const uint8_t *read_length(self, const uint8_t *ptr, int64_t *out) except NULL:
+        # Read a length prefix, and check that the data it refers to is available
+        cdef const uint8_t *value_start = ptr
+        ptr = self.read_long(ptr, out)
+        if out[0] < 0:
+            raise self.error(value_start, f"Invalid negative length: {out[0]}")
+        if <uint64_t>(self.end - ptr) < <uint64_t>out[0]:
+            raise self.error(value_start, "Not enough input data to read value")
+        return ptr
+
+    cdef const uint8_t *skip_with(self, AvroType avro_type, const uint8_t *ptr) except NULL:
+        # Validate by skipping the value, for types without their own validation
+        self.reader.ptr = ptr
+        try:
+            avro_type.binary_buffer_skip(self.reader)
+        except (EOFError, ValueError) as e:
+            raise self.error(ptr, str(e)) from None
+        return self.reader.ptr
+
+
+cdef Py_ssize_t _utf8_error(const uint8_t *data, Py_ssize_t length) noexcept nogil:
+    # Return the offset of the first byte of the first invalid utf-8 sequence in data, or -1 if it is all valid
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t k
+    cdef Py_ssize_t extra
+    cdef uint64_t chunk
+    cdef uint32_t code_point
+    cdef uint8_t c
+    while i < length:
+        # Check ascii text 8 bytes at a time
+        while i + 8 <= length:
+            memcpy(&chunk, data + i, 8)
+            if chunk & 0x8080808080808080ull:
+                break
+            i += 8
+        if i == length:
+            break
+        c = data[i]
+        if c < 0x80:
+            i += 1
+            continue
+        if c < 0xc2:
+            return i
+        elif c < 0xe0:
+            extra = 1
+            code_point = c & 0x1f
+        elif c < 0xf0:
+            extra = 2
+            code_point = c & 0x0f
+        elif c < 0xf5:
+            extra = 3
+            code_point = c & 0x07
+        else:
+            return i
+        if i + extra >= length:
+            return i
+        for k in range(1, extra + 1):
+            if data[i + k] & 0xc0 != 0x80:
+                return i
+            code_point = (code_point << 6) | (data[i + k] & 0x3f)
+        if extra == 2 and (code_point < 0x800 or 0xd800 <= code_point <= 0xdfff):
+            return i
+        if extra == 3 and (code_point < 0x10000 or code_point > 0x10ffff):
+            return i
+        i += extra + 1
+    return -1
+
+
+cdef const uint8_t *_validate_string(_Validator validator, const uint8_t *ptr) except NULL:
+    cdef int64_t length
+    cdef Py_ssize_t error
+    ptr = validator.read_length(ptr, &length)
+    if validator.check_utf8:
+        error = _utf8_error(ptr, length)
+        if error >= 0:
+            raise validator.error(ptr + error, "Invalid utf-8 data in string")
+    return ptr + length
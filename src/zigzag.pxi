@@ -1,6 +1,15 @@
 from libc.stdint cimport *
 
-cdef uint32_t read_varint(_Reader buf) except? 0xfffffbad:
+# A varint long is never more than 10 bytes, so if that many remain in a MemoryReader, the varint can be
+# decoded directly from its buffer without checking the end of the data for each byte
+cdef size_t MAX_VARINT_SIZE = 10
+
+
+cdef inline bint _has_varint_space(_Reader buf):
+    return isinstance(buf, MemoryReader) and <size_t>((<MemoryReader>buf).end_ptr - (<MemoryReader>buf).ptr) >= MAX_VARINT_SIZE
+
+
+cdef uint32_t _read_varint_slow(_Reader buf) except? 0xfffffbad:
     cdef uint32_t cur
     cdef uint32_t shift = 0
     cdef uint32_t value = 0
@@ -12,7 +21,7 @@ cdef uint32_t read_varint(_Reader buf) except? 0xfffffbad:
             return value
 
 
-cdef uint64_t read_varlong(_Reader buf) except? 0xfffffffffffffbadull:
+cdef uint64_t _read_varlong_slow(_Reader buf) except? 0xfffffffffffffbadull:
     cdef uint64_t cur
     cdef uint64_t shift = 0
     cdef uint64_t value = 0
@@ -24,6 +33,49 @@ cdef uint64_t read_varlong(_Reader buf) except? 0xfffffffffffffbadull:
             return value
 
 
+cdef uint32_t read_varint(_Reader buf) except? 0xfffffbad:
+    cdef MemoryReader reader
+    cdef const uint8_t *ptr
+    cdef uint32_t cur
+    cdef uint32_t shift = 0
+    cdef uint32_t value = 0
+    if not _has_varint_space(buf):
+        return _read_varint_slow(buf)
+    reader = <MemoryReader>buf
+    ptr = reader.ptr
+    while shift < 35:
+        cur = ptr[0]
+        ptr += 1
+        value |= (cur & 0b01111111) << shift
+        if not cur & 0b10000000:
+            reader.ptr = ptr
+            return value
+        shift += 7
+    # Longer than any valid int, so leave it to the byte-by-byte decoder
+    return _read_varint_slow(buf)
+
+
+cdef uint64_t read_varlong(_Reader buf) except? 0xfffffffffffffbadull:
+    cdef MemoryReader reader
+    cdef const uint8_t *ptr
+    cdef uint64_t cur
+    cdef uint64_t shift = 0
+    cdef uint64_t value = 0
+    if not _has_varint_space(buf):
+        return _read_varlong_slow(buf)
+    reader = <MemoryReader>buf
+    ptr = reader.ptr
+    while shift < 70:
+        cur = ptr[0]
+        ptr += 1
+        value |= (cur & 0b01111111) << shift
+        if not cur & 0b10000000:
+            reader.ptr = ptr
+            return value
+        shift += 7
+    return _read_varlong_slow(buf)
+
+
 cdef int32_t zigzag_decode_int(_Reader buf) except? 0x7ffffbadu:
     cdef uint32_t value = read_varint(buf)
     return (value >> 1) ^ (-(value & 1))
@@ -33,8 +85,52 @@ cdef int64_t zigzag_decode_long(_Reader buf) except? 0x7ffffffffffffbadull:
     cdef uint64_t value = read_varlong(buf)
     return (value >> 1) ^ (-(value & 1ull))
 
+
+cdef int skip_varint(_Reader buf) except -1:
+    # Move past a varint without decoding it
+    cdef MemoryReader reader
+    cdef const uint8_t *ptr
+    cdef size_t num
+    if _has_varint_space(buf):
+        reader = <MemoryReader>buf
+        ptr = reader.ptr
+        for num in range(MAX_VARINT_SIZE):
+            if not ptr[num] & 0b10000000:
+                reader.ptr = ptr + num + 1
+                return 0
+    while buf.read_u8() & 0b10000000:
+        pass
+
+
+cdef int skip_length_prefixed(_Reader buf) except -1:
+    # Move past a long length, and that many bytes
+    cdef int64_t length = zigzag_decode_long(buf)
+    if length < 0:
+        raise ValueError(f"Invalid negative length: {length}")
+    buf.skip(length)
+
+cdef inline size_t zigzag_encode_long_ptr(uint8_t *out, int64_t value) noexcept nogil:
+    # Write the zigzag varint encoding of `value` to `out`, which must have space for 10 bytes.
+    # Returns the number of bytes written
+    cdef uint64_t zz = (<uint64_t>value << 1) ^ <uint64_t>(value >> 63)
+    cdef size_t num = 0
+    while zz > 0b01111111:
+        out[num] = (zz & 0b01111111) | 0b10000000
+        zz >>= 7
+        num += 1
+    out[num] = zz
+    return num + 1
+
+
 @cython.cdivision(True)
 cdef int zigzag_encode_int(_Writer buf, int32_t value) except -1:
+    cdef MemoryWriter writer
+    if isinstance(buf, MemoryWriter):
+        # An int zigzag encodes to the same bytes as the equivalent long
+        writer = <MemoryWriter>buf
+        writer.reserve(MAX_VARINT_SIZE)
+        writer.len += zigzag_encode_long_ptr(writer.buffer.data.as_uchars + writer.len, value)
+        return 0
     cdef uint32_t zz = (value << 1) ^ (value >> 31)
     cdef uint8_t cur
     if zz == 0:
@@ -48,6 +144,13 @@ cdef int zigzag_encode_int(_Writer buf, int32_t value) except -1:
 
 @cython.cdivision(True)
 cdef int zigzag_encode_long(_Writer buf, int64_t value) except -1:
+    cdef MemoryWriter writer
+    if isinstance(buf, MemoryWriter):
+        # Write the whole varint at once, rather than a byte at a time
+        writer = <MemoryWriter>buf
+        writer.reserve(MAX_VARINT_SIZE)
+        writer.len += zigzag_encode_long_ptr(writer.buffer.data.as_uchars + writer.len, value)
+        return 0
     cdef uint64_t zz = (value << 1) ^ (value >> 63)
     cdef uint8_t cur
     if zz == 0:
@@ -58,3 +161,5 @@ cdef int zigzag_encode_long(_Writer buf, int64_t value) except -1:
         if zz:
             cur |= 0b10000000
         buf.write_u8(cur)
+
+
@@ -0,0 +1,184 @@
+import datetime
+import uuid
+
+import cavro
+import numpy
+import pytest
+
+
+NESTED_SCHEMA = {
+    'type': 'record',
+    'name': 'Download',
+    'fields': [
+        {'name': 'id', 'type': 'long'},
+        {'name': 'count', 'type': 'int'},
+        {'name': 'ok', 'type': 'boolean'},
+        {'name': 'ratio', 'type': 'float'},
+        {'name': 'size', 'type': 'double'},
+        {'name': 'project', 'type': 'string'},
+        {'name': 'digest', 'type': 'bytes'},
+        {'name': 'md5', 'type': {'type': 'fixed', 'name': 'MD5', 'size': 4}},
+        {'name': 'kind', 'type': {'type': 'enum', 'name': 'Kind', 'symbols': ['sdist', 'wheel']}},
+        {'name': 'nothing', 'type': 'null'},
+        {'name': 'file', 'type': {
+            'type': 'record',
+            'name': 'File',
+            'fields': [
+                {'name': 'version', 'type': ['null', 'string']},
+                {'name': 'tags', 'type': {'type': 'array', 'items': 'string'}},
+                {'name': 'extra', 'type': {'type': 'map', 'values': 'long'}},
+            ],
+        }},
+        {'name': 'files', 'type': {'type': 'array', 'items': 'File'}},
+        {'name': 'by_name', 'type': {'type': 'map', 'values': 'File'}},
+        {'name': 'either', 'type': ['null', 'File', 'long', 'string']},
+        {'name': 'when', 'type': {'type': 'long', 'logicalType': 'timestamp-millis'}},
+        {'name': 'uid', 'type': {'type': 'string', 'logicalType': 'uuid'}},
+    ],
+}
+
+FILE = {'version': '1.0', 'tags': ['a', 'b'], 'extra': {'x': 1, 'y': -2}}
+
+NESTED_VALUE = {
+    'id': 2 ** 40,
+    'count': -5,
+    'ok': True,
+    'ratio': 0.5,
+    'size': 1e100,
+    'project': 'cavro £',
+    'digest': b'\x00\xff',
+    'md5': b'abcd',
+    'kind': 'wheel',
+    'nothing': None,
+    'file': FILE,
+    'files': [FILE, dict(FILE, version=None, tags=[], extra={})],
+    'by_name': {'one': FILE},
+    'either': FILE,
+    'when': datetime.datetime(2023, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+    'uid': uuid.UUID(int=12345),
+}
+
+LINKED_LIST_SCHEMA = {
+    'type': 'record',
+    'name': 'Node',
+    'fields': [
+        {'name': 'value', 'type': 'int'},
+        {'name': 'next', 'type': ['null', 'Node']},
+        {'name': 'children', 'type': {'type': 'array', 'items': 'Node'}},
+    ],
+}
+
+LINKED_LIST_VALUE = {
+    'value': 1,
+    'next': {'value': 2, 'next': {'value': 3, 'next': None, 'children': []}, 'children': []},
+    'children': [{'value': 4, 'next': None, 'children': []}],
+}
+
+
+def _check_same(schema, value):
+    compiled = schema.compile()
+    encoded = schema.binary_encode(value)
+    assert compiled.binary_encode(value) == encoded
+    decoded = schema.binary_decode(encoded)
+    compiled_decoded = compiled.binary_decode(encoded)
+    assert repr(compiled_decoded) == repr(decoded)
+    assert type(compiled_decoded) is type(decoded)
+    assert compiled.binary_encode(decoded) == schema.binary_encode(decoded)
+    return compiled_decoded
+
+
+@pytest.mark.parametrize('options', [
+    {},
+    {'record_decodes_to_dict': True},
+    {'union_decodes_to': cavro.UnionDecodeOption.TYPE_TUPLE_ALWAYS, 'allow_tuple_notation': True},
+    {'allow_tuple_notation': True},
+    {'record_encode_use_defaults': False},
+])
+def test_compiled_matches_schema(options):
+    schema = cavro.Schema(NESTED_SCHEMA, **options)
+    _check_same(schema, NESTED_VALUE)
+    record_value = schema.binary_decode(schema.binary_encode(NESTED_VALUE))
+    _check_same(schema, record_value)
+
+
+def test_compiled_recursive():
+    schema = cavro.Schema(LINKED_LIST_SCHEMA)
+    decoded = _check_same(schema, LINKED_LIST_VALUE)
+    assert decoded.next.next.value == 3
+
+
+@pytest.mark.parametrize('source, value', [
+    ('"long"', 123),
+    ('"string"', 'hi'),
+    (['null', 'long', 'string'], 'x'),
+    ({'type': 'array', 'items': 'long'}, numpy.arange(5)),
+    ({'type': 'array', 'items': 'long'}, range(5)),
+    ({'type': 'map', 'values': 'int'}, [('a', 1)]),
+])
+def test_compiled_values(source, value):
+    _check_same(cavro.Schema(source), value)
+
+
+def test_compiled_numpy_arrays():
+    schema = cavro.Schema({'type': 'array', 'items': 'double'}, array_decodes_to_numpy=True)
+    decoded = schema.compile().binary_decode(schema.binary_encode([1.0, 2.5]))
+    assert isinstance(decoded, numpy.ndarray)
+    assert decoded.tolist() == [1.0, 2.5]
+
+
+def test_compiled_promotion():
+    writer = cavro.Schema({'type': 'record', 'name': 'A', 'fields': [
+        {'name': 'a', 'type': 'int'},
+        {'name': 'dropped', 'type': {'type': 'array', 'items': 'string'}},
+        {'name': 'b', 'type': 'string'},
+    ]})
+    reader = cavro.Schema({'type': 'record', 'name': 'A', 'fields': [
+        {'name': 'b', 'type': 'string'},
+        {'name': 'a', 'type': 'double'},
+        {'name': 'c', 'type': 'long', 'default': 7},
+    ]})
+    resolved = reader.reader_for_writer(writer)
+    encoded = writer.binary_encode({'a': 1, 'dropped': ['x', 'y'], 'b': 'z'})
+    decoded = resolved.compile().binary_decode(encoded)
+    assert decoded._asdict() == resolved.binary_decode(encoded)._asdict() == {'b': 'z', 'a': 1.0, 'c': 7}
+
+
+def test_compiled_many_and_read():
+    schema = cavro.Schema(LINKED_LIST_SCHEMA)
+    compiled = schema.compile()
+    assert schema.compile() is compiled
+    values = [LINKED_LIST_VALUE, {'value': 9, 'next': None, 'children': []}]
+    data = b''.join(schema.binary_encode(v) for v in values)
+    assert [v.value for v in compiled.binary_decode_many(data)] == [1, 9]
+    assert [v.value for v in compiled.binary_decode_many(data, 1)] == [1]
+    writer = cavro.MemoryWriter()
+    for value in values:
+        compiled.binary_write(writer, value)
+    assert writer.bytes() == data
+    reader = cavro.MemoryReader(data)
+    assert compiled.binary_read(reader).value == 1
+    assert compiled.binary_read(reader).value == 9
+
+
+@pytest.mark.parametrize('value', [
+    dict(NESTED_VALUE, count=2 ** 40),
+    dict(NESTED_VALUE, id='x'),
+    dict(NESTED_VALUE, file=dict(FILE, tags=[1])),
+    dict(NESTED_VALUE, by_name={'a': None}),
+    {k: v for k, v in NESTED_VALUE.items() if k != 'project'},
+])
+def test_compiled_errors_match(value):
+    schema = cavro.Schema(NESTED_SCHEMA)
+    with pytest.raises(Exception) as expected:
+        schema.binary_encode(value)
+    with pytest.raises(type(expected.value)) as actual:
+        schema.compile().binary_encode(value)
+    assert str(actual.value) == str(expected.value)
+
+
+def test_compiled_decode_errors():
+    schema = cavro.Schema(['null', 'long'])
+    with pytest.raises(ValueError, match='not valid for a union'):
+        schema.compile().binary_decode(b'\x08')
+    with pytest.raises(EOFError):
+        cavro.Schema('"string"').compile().binary_decode(b'\x08a')
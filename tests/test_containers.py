@@ -1,6 +1,8 @@
-from io import BytesIO
+from io import BytesIO, StringIO
+import threading
 import uuid
 import cavro
+import numpy
 import pytest
 
 
@@ -10,6 +12,38 @@ from pathlib import Path
 SIMPLE_CONTAINER = b'Obj\x01\x04\x14avro.codec\x08null\x16avro.schema\x0a"int"\x00aaaaaaaaaaaaaaaa\x02\x02\x02aaaaaaaaaaaaaaaa'
 
 
+def _string_container(codec='null', num_values=5000, **kwargs):
+    # A container of `num_values` strings, in many small blocks
+    buf = BytesIO()
+    values = [f'value {i}' for i in range(num_values)]
+    with cavro.ContainerWriter(buf, cavro.Schema('"string"'), codec, max_blocksize=500, **kwargs) as writer:
+        writer.write_many(values)
+    return buf.getvalue(), values
+
+
+def _string_container_file(tmp_path, codec='null', num_values=5000):
+    data, values = _string_container(codec, num_values)
+    path = tmp_path / 'data.avro'
+    path.write_bytes(data)
+    return path, values
+
+
+CONTAINER_SOURCES = ['bytes', 'unbuffered', 'buffered', 'path', 'mmap', 'workers']
+
+
+def _container_source(tmp_path, data, source):
+    path = tmp_path / 'source.avro'
+    path.write_bytes(data)
+    return {
+        'bytes': lambda: cavro.ContainerReader(data),
+        'unbuffered': lambda: cavro.ContainerReader(BytesIO(data), buffer_size=0),
+        'buffered': lambda: cavro.ContainerReader(BytesIO(data), buffer_size=1024),
+        'path': lambda: cavro.ContainerReader(path),
+        'mmap': lambda: cavro.ContainerReader(str(path), use_mmap=True),
+        'workers': lambda: cavro.ContainerReader(BytesIO(data), decompress_workers=2),
+    }[source]()
+
+
 def test_simplest_container_invalid_magic():
     container = cavro.ContainerReader(SIMPLE_CONTAINER)
     assert list(container) == [1]
@@ -147,4 +181,588 @@ def test_round_tripping(codec, source_vals, schema):
     buf.seek(0)
     reader = cavro.ContainerReader(buf)
     obs = list(reader)
-    assert obs == source_vals
\ No newline at end of file
+    assert obs == source_vals
+
+@pytest.mark.parametrize('buffer_size', [0, 1, 7, 4096, cavro.DEFAULT_READ_BUFFER_SIZE])
+def test_container_reading_buffered(buffer_size):
+    here = Path(__file__).parent
+    container_file = here / 'data' / 'weather.avro'
+    expected = [r._asdict() for r in cavro.ContainerReader(container_file.read_bytes())]
+    with container_file.open('rb') as fh:
+        container = cavro.ContainerReader(fh, buffer_size=buffer_size)
+        assert [r._asdict() for r in container] == expected
+    container = cavro.ContainerReader(container_file, buffer_size=buffer_size)
+    assert [r._asdict() for r in container] == expected
+
+
+def test_container_reading_file_object_unbuffered():
+    # File objects passed in are only read as far as the values decoded, by default
+    fh = BytesIO(_string_container()[0])
+    reader = cavro.ContainerReader(fh)
+    assert next(reader) == 'value 0'
+    assert fh.tell() < 1000
+
+
+@pytest.mark.parametrize('buffer_size', [0, 1, 5, 64, cavro.DEFAULT_WRITE_BUFFER_SIZE])
+def test_writing_buffered_flushes_blocks(monkeypatch, buffer_size):
+    monkeypatch.setattr(uuid, 'uuid4', FakeUUID)
+    buf = BytesIO()
+    sch = cavro.Schema('"int"')
+    writer = cavro.ContainerWriter(buf, sch, max_blocksize=1, buffer_size=buffer_size)
+    writer.write_one(64)
+    assert buf.getvalue() == b''
+    writer.write_one(1)
+    assert buf.getvalue() == FakeUUID.HEADER + b'\x02\x04\x80\x01' + FakeUUID.bytes
+    writer.close()
+    assert buf.getvalue() == FakeUUID.HEADER + b'\x02\x04\x80\x01' + FakeUUID.bytes + b'\x02\x02\x02' + FakeUUID.bytes
+
+
+def test_schema_write_to_buffered_file_writer():
+    buf = BytesIO()
+    sch = cavro.Schema({'type': 'array', 'items': 'long'})
+    writer = cavro.FileWriter(buf, 16)
+    sch.binary_write(writer, list(range(100)))
+    writer.flush()
+    assert buf.getvalue() == sch.binary_encode(list(range(100)))
+
+
+@pytest.mark.parametrize('codec', [c.decode() for c in cavro.CODECS.keys()])
+@pytest.mark.parametrize('source', CONTAINER_SOURCES)
+def test_container_reading_sources(tmp_path, codec, source):
+    data, values = _string_container(codec)
+    assert list(_container_source(tmp_path, data, source)) == values
+
+
+def test_container_mmap_requires_path():
+    with pytest.raises(ValueError, match='only supported when reading from a path'):
+        cavro.ContainerReader(SIMPLE_CONTAINER, use_mmap=True)
+
+
+@pytest.mark.parametrize('codec', [c.decode() for c in cavro.CODECS.keys()])
+@pytest.mark.parametrize('workers,prefetch', [(1, None), (4, None), (2, 1), (3, 50)])
+def test_container_parallel_decompression(codec, workers, prefetch):
+    data, values = _string_container(codec)
+    reader = cavro.ContainerReader(BytesIO(data), decompress_workers=workers, prefetch_blocks=prefetch)
+    assert list(reader) == values
+
+
+def test_container_parallel_decompression_truncated():
+    truncated = _string_container('deflate')[0][:-200]
+    reader = cavro.ContainerReader(BytesIO(truncated), decompress_workers=2)
+    with pytest.raises(EOFError):
+        list(reader)
+
+
+def _decompress_threads():
+    return [t for t in threading.enumerate() if t.name.startswith('cavro-decompress')]
+
+
+@pytest.mark.parametrize('codec,workers', [('null', 0), ('deflate', 0), ('deflate', 2)])
+def test_container_mmap_close(tmp_path, codec, workers):
+    path, values = _string_container_file(tmp_path, codec, 2000)
+    with cavro.ContainerReader(path, use_mmap=True, decompress_workers=workers) as reader:
+        assert next(reader) == 'value 0'
+    assert list(reader) == []
+    with cavro.ContainerReader(path, use_mmap=True, decompress_workers=workers) as reader:
+        assert list(reader) == values
+    reader.close()
+
+
+def test_container_parallel_decompression_close(tmp_path):
+    path, values = _string_container_file(tmp_path, 'deflate')
+    existing = set(_decompress_threads())
+    with cavro.ContainerReader(path, decompress_workers=4) as reader:
+        assert next(reader) == 'value 0'
+        threads = set(_decompress_threads()) - existing
+        assert threads
+    for thread in threads:
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+
+def test_container_parallel_decompression_exhausted(tmp_path):
+    path, values = _string_container_file(tmp_path, 'deflate')
+    existing = set(_decompress_threads())
+    with cavro.ContainerReader(path, decompress_workers=4) as reader:
+        assert list(reader) == values
+        threads = set(_decompress_threads()) - existing
+        for thread in threads:
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+        reader.seek_record(4000)
+        assert list(reader) == values[4000:]
+    with pytest.raises(ValueError, match='closed'):
+        reader.seek_block(0)
+        next(reader)
+
+
+def test_container_parallel_decompression_invalid_args():
+    with pytest.raises(ValueError, match='decompress_workers'):
+        cavro.ContainerReader(SIMPLE_CONTAINER, decompress_workers=-1)
+    with pytest.raises(ValueError, match='prefetch_blocks'):
+        cavro.ContainerReader(SIMPLE_CONTAINER, decompress_workers=1, prefetch_blocks=0)
+
+
+MARKER = b'0123456789abcdef'
+
+
+@pytest.mark.parametrize('codec', [c.decode() for c in cavro.CODECS.keys()])
+@pytest.mark.parametrize('workers', [1, 3])
+@pytest.mark.parametrize('num_values', [0, 5000])
+def test_container_parallel_compression(codec, workers, num_values):
+    expected, values = _string_container(codec, num_values, marker=MARKER)
+    assert _string_container(codec, num_values, marker=MARKER, compress_workers=workers)[0] == expected
+    assert list(cavro.ContainerReader(BytesIO(expected))) == values
+
+
+def test_container_parallel_compression_flush():
+    buf = BytesIO()
+    sch = cavro.Schema('"int"')
+    writer = cavro.ContainerWriter(buf, sch, 'deflate', compress_workers=2)
+    writer.write_many([1, 2, 3])
+    writer.flush()
+    assert list(cavro.ContainerReader(BytesIO(buf.getvalue()))) == [1, 2, 3]
+    writer.close()
+
+
+def test_container_parallel_compression_invalid_args():
+    with pytest.raises(ValueError, match='compress_workers'):
+        cavro.ContainerWriter(BytesIO(), cavro.Schema('"int"'), compress_workers=-1)
+
+
+@pytest.mark.parametrize('codec', [c.decode() for c in cavro.CODECS.keys()])
+def test_container_build_index(codec):
+    data, values = _string_container(codec)
+    reader = cavro.ContainerReader(data)
+    index = reader.build_index()
+    assert reader.index is index
+    assert index.codec_name == codec
+    assert index.num_records == len(values)
+    assert len(index) > 10
+    assert sum(block.count for block in index) == len(values)
+    assert index[0].first_record == 0
+    for block in index:
+        assert block.uncompressed_size == (block.compressed_size if codec == 'null' else None)
+    # Building the index doesn't move the reader
+    assert list(reader) == values
+
+
+@pytest.mark.parametrize('codec', [c.decode() for c in cavro.CODECS.keys()])
+def test_container_build_index_decompress(codec):
+    data, values = _string_container(codec)
+    index = cavro.ContainerReader(data).build_index(decompress=True)
+    null_index = cavro.ContainerReader(_string_container('null')[0]).build_index()
+    assert [b.uncompressed_size for b in index] == [b.uncompressed_size for b in null_index]
+    assert [b.count for b in index] == [b.count for b in null_index]
+
+
+@pytest.mark.parametrize('codec', ['null', 'deflate'])
+@pytest.mark.parametrize('source', CONTAINER_SOURCES)
+def test_container_seek_record(tmp_path, codec, source):
+    data, values = _string_container(codec)
+    reader = _container_source(tmp_path, data, source)
+    assert next(reader) == values[0]
+    for record in [4999, 0, 1234, 1235, 17, 3000]:
+        reader.seek_record(record)
+        assert next(reader) == values[record]
+    reader.seek_record(4990)
+    assert list(reader) == values[4990:]
+    reader.seek_block(-1)
+    last_block = reader.index[-1]
+    assert list(reader) == values[last_block.first_record:]
+    reader.seek_block(0)
+    assert list(reader) == values
+
+
+def test_container_seek_record_out_of_range():
+    data, values = _string_container('null', 100)
+    reader = cavro.ContainerReader(data)
+    with pytest.raises(IndexError):
+        reader.seek_record(100)
+    with pytest.raises(IndexError):
+        reader.seek_record(-1)
+    with pytest.raises(IndexError):
+        reader.seek_block(len(reader.index))
+
+
+def test_container_index_save_load(tmp_path):
+    data, values = _string_container('deflate')
+    index = cavro.ContainerReader(data).build_index()
+    index_path = tmp_path / 'indexed.avro.idx'
+    index.save(index_path)
+    loaded = cavro.BlockIndex.load(index_path)
+    assert loaded.marker == index.marker
+    assert list(loaded) == list(index)
+    buf = StringIO()
+    loaded.save(buf)
+    buf.seek(0)
+    assert list(cavro.BlockIndex.load(buf)) == list(index)
+
+    reader = cavro.ContainerReader(data, index=loaded)
+    reader.seek_record(2500)
+    assert next(reader) == values[2500]
+
+
+def test_container_index_wrong_container():
+    data, values = _string_container('null')
+    other, _ = _string_container('null')
+    index = cavro.ContainerReader(other).build_index()
+    reader = cavro.ContainerReader(data, index=index)
+    with pytest.raises(ValueError, match='Invalid block sync marker'):
+        reader.seek_block(1)
+    with pytest.raises(ValueError, match='codec'):
+        cavro.ContainerReader(_string_container('deflate')[0], index=index)
+
+
+def test_container_index_incomplete_block():
+    data, values = _string_container('null')
+    full_index = cavro.ContainerReader(data).build_index()
+    index = cavro.ContainerReader(data[:-20]).build_index()
+    assert list(index) == list(full_index)[:-1]
+
+
+def test_container_index_corrupt_marker():
+    data, values = _string_container('null')
+    index = cavro.ContainerReader(data).build_index()
+    corrupt = bytearray(data)
+    corrupt[index[1].offset - 1] ^= 0xff
+    reader = cavro.ContainerReader(bytes(corrupt))
+    with pytest.raises(ValueError, match='Invalid block sync marker'):
+        reader.build_index()
+    assert reader.index is None
+
+
+def test_container_index_unseekable():
+    class Unseekable:
+        def __init__(self, data):
+            self.data = BytesIO(data)
+        def read(self, n):
+            return self.data.read(n)
+
+    data, values = _string_container('null', 10)
+    reader = cavro.ContainerReader(Unseekable(data))
+    with pytest.raises(ValueError, match='does not support seeking'):
+        reader.build_index()
+    assert list(reader) == values
+
+
+@pytest.mark.parametrize('codec', ['null', 'deflate'])
+@pytest.mark.parametrize('num_splits', [1, 2, 7, 50, 1000])
+@pytest.mark.parametrize('buffer_size,workers', [(0, 0), (1024, 0), (cavro.DEFAULT_READ_BUFFER_SIZE, 0), (1024, 2)])
+def test_container_splits(tmp_path, codec, num_splits, buffer_size, workers):
+    path, values = _string_container_file(tmp_path, codec)
+    splits = cavro.container_splits(path, num_splits)
+    assert len(splits) == num_splits
+    assert splits[0][0] == 0
+    assert splits[-1][1] == path.stat().st_size
+    read = []
+    for start, end in splits:
+        reader = cavro.ContainerReader(path, start=start, end=end, buffer_size=buffer_size, decompress_workers=workers)
+        read.extend(reader)
+    assert read == values
+
+
+def test_container_split_ranges():
+    data, values = _string_container('null')
+    index = cavro.ContainerReader(data).build_index()
+    block = index[3]
+    # Ranges are matched against the position of the sync marker preceding each block
+    marker_pos = block.offset - 16
+    assert list(cavro.ContainerReader(data, start=marker_pos, end=marker_pos + 1)) == values[block.first_record:block.first_record + block.count]
+    assert list(cavro.ContainerReader(data, start=marker_pos + 1, end=marker_pos + 2)) == []
+    assert list(cavro.ContainerReader(data, start=marker_pos, end=marker_pos)) == []
+    header_marker_pos = index[0].offset - 16
+    assert list(cavro.ContainerReader(data, end=header_marker_pos)) == []
+    assert list(cavro.ContainerReader(data, end=header_marker_pos + 1)) == values[:index[0].count]
+    assert list(cavro.ContainerReader(data, start=5, end=header_marker_pos + 1)) == values[:index[0].count]
+    assert list(cavro.ContainerReader(data, start=len(data) + 10)) == []
+    assert list(cavro.ContainerReader(data, start=index[-1].offset)) == []
+    assert list(cavro.ContainerReader(data, start=1, end=len(data) * 2)) == values
+
+
+def test_container_split_requires_seekable():
+    class Unseekable:
+        def __init__(self, data):
+            self.data = BytesIO(data)
+        def read(self, n):
+            return self.data.read(n)
+
+    with pytest.raises(ValueError, match='seekable'):
+        cavro.ContainerReader(Unseekable(SIMPLE_CONTAINER), start=10)
+    with pytest.raises(ValueError, match='num_splits'):
+        cavro.container_splits('foo.avro', 0)
+
+
+def _double(value):
+    return value * 2
+
+
+@pytest.mark.parametrize('codec', ['null', 'deflate'])
+@pytest.mark.parametrize('ordered', [True, False])
+@pytest.mark.parametrize('workers,split_size', [(1, cavro.DEFAULT_SPLIT_SIZE), (2, 1000), (3, 50)])
+def test_parallel_read(tmp_path, codec, ordered, workers, split_size):
+    path, values = _string_container_file(tmp_path, codec)
+    results = list(cavro.parallel_read(path, _double, workers=workers, ordered=ordered, split_size=split_size))
+    expected = [_double(v) for v in values]
+    if not ordered:
+        results.sort()
+        expected.sort()
+    assert results == expected
+
+
+def test_parallel_read_reader_schema(tmp_path):
+    writer_schema = cavro.Schema({'type': 'record', 'name': 'A', 'fields': [
+        {'name': 'a', 'type': 'int'},
+        {'name': 'b', 'type': 'string'},
+    ]})
+    reader_schema = cavro.Schema({'type': 'record', 'name': 'A', 'fields': [
+        {'name': 'a', 'type': 'long'},
+        {'name': 'c', 'type': 'string', 'default': 'c'},
+    ]}, record_decodes_to_dict=True)
+    path = tmp_path / 'records.avro'
+    with cavro.ContainerWriter(path, writer_schema, 'deflate', max_blocksize=100) as writer:
+        writer.write_many([{'a': i, 'b': str(i)} for i in range(1000)])
+    results = list(cavro.parallel_read(path, dict, workers=2, reader_schema=reader_schema, split_size=500))
+    assert results == [{'a': i, 'c': 'c'} for i in range(1000)]
+
+
+def test_parallel_read_invalid_args(tmp_path):
+    with pytest.raises(ValueError, match='workers'):
+        list(cavro.parallel_read(tmp_path / 'missing.avro', _double, workers=0))
+
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_container_read_block_objects(workers):
+    data, values = _string_container('deflate', 1000)
+    reader = cavro.ContainerReader(data, decompress_workers=workers)
+    index = cavro.ContainerReader(data).build_index()
+    first = next(reader)
+    assert first == values[0]
+    assert reader.read_block_objects() == values[1:index[0].count]
+    assert reader.read_block_objects() == values[index[1].first_record:index[2].first_record]
+    read = []
+    while True:
+        block = reader.read_block_objects()
+        if not block:
+            break
+        read.extend(block)
+    assert read == values[index[2].first_record:]
+    assert reader.read_block_objects() == []
+
+
+@pytest.mark.parametrize('batch_size', [1, 7, 100, 1000, 5000])
+def test_container_read_batch(batch_size):
+    data, values = _string_container('null', 1000)
+    reader = cavro.ContainerReader(data)
+    read = []
+    while True:
+        batch = reader.read_batch(batch_size)
+        assert len(batch) <= batch_size
+        if not batch:
+            break
+        read.extend(batch)
+        if len(batch) < batch_size:
+            assert reader.read_batch(batch_size) == []
+            break
+    assert read == values
+    assert reader.read_batch(0) == []
+    with pytest.raises(ValueError):
+        reader.read_batch(-1)
+
+
+def test_container_read_batch_mixed():
+    data, values = _string_container('null', 1000)
+    reader = cavro.ContainerReader(data)
+    assert reader.read_batch(3) == values[:3]
+    assert next(reader) == values[3]
+    assert reader.read_batch(500) == values[4:504]
+    assert list(reader) == values[504:]
+
+
+COLUMNS_SCHEMA = {
+    'type': 'record',
+    'name': 'Download',
+    'fields': [
+        {'name': 'id', 'type': 'long'},
+        {'name': 'count', 'type': 'int'},
+        {'name': 'ratio', 'type': 'float'},
+        {'name': 'score', 'type': 'double'},
+        {'name': 'ok', 'type': 'boolean'},
+        {'name': 'project', 'type': 'string'},
+        {'name': 'digest', 'type': 'bytes'},
+        {'name': 'country', 'type': ['null', 'string']},
+        {'name': 'size', 'type': ['long', 'null']},
+        {'name': 'file', 'type': {
+            'type': 'record',
+            'name': 'File',
+            'fields': [
+                {'name': 'version', 'type': 'string'},
+                {'name': 'kind', 'type': {'type': 'enum', 'name': 'Kind', 'symbols': ['sdist', 'wheel']}},
+            ],
+        }},
+        {'name': 'tags', 'type': {'type': 'array', 'items': 'string'}},
+    ],
+}
+
+
+def _columns_container(num_values=1000):
+    values = [{
+        'id': i * 10**10,
+        'count': -i,
+        'ratio': i / 4,
+        'score': i / 3,
+        'ok': i % 3 == 0,
+        'project': f'project-{i}',
+        'digest': bytes([i % 256]) * (i % 5),
+        'country': None if i % 4 else f'c{i}',
+        'size': None if i % 2 else i,
+        'file': {'version': f'1.{i}', 'kind': 'wheel' if i % 2 else 'sdist'},
+        'tags': [str(i)] * (i % 3),
+    } for i in range(num_values)]
+    buf = BytesIO()
+    with cavro.ContainerWriter(buf, cavro.Schema(COLUMNS_SCHEMA), max_blocksize=2000) as writer:
+        writer.write_many(values)
+    return buf.getvalue(), values
+
+
+@pytest.mark.parametrize('batch_size', [1, 7, 100, 5000])
+def test_container_read_columns(batch_size):
+    data, values = _columns_container()
+    reader = cavro.ContainerReader(data)
+    batches = list(reader.iter_columns(batch_size))
+    assert all(len(batch['id']) <= batch_size for batch in batches)
+    assert reader.read_columns(batch_size) == {}
+    assert list(batches[0]) == [
+        'id', 'count', 'ratio', 'score', 'ok', 'project', 'digest', 'country', 'size', 'file.version', 'file.kind', 'tags'
+    ]
+    columns = {name: [v for batch in batches for v in batch[name]] for name in batches[0]}
+    assert columns['id'] == [v['id'] for v in values]
+    assert columns['count'] == [v['count'] for v in values]
+    assert columns['ratio'] == [v['ratio'] for v in values]
+    assert columns['score'] == [v['score'] for v in values]
+    assert columns['ok'] == [v['ok'] for v in values]
+    assert columns['project'] == [v['project'] for v in values]
+    assert columns['digest'] == [v['digest'] for v in values]
+    assert columns['country'] == [v['country'] for v in values]
+    assert columns['file.version'] == [v['file']['version'] for v in values]
+    assert columns['file.kind'] == [v['file']['kind'] for v in values]
+    assert columns['tags'] == [v['tags'] for v in values]
+    sizes = numpy.ma.concatenate([batch['size'] for batch in batches])
+    assert sizes.filled(-1).tolist() == [-1 if v['size'] is None else v['size'] for v in values]
+
+
+def test_container_read_columns_types():
+    data, values = _columns_container(10)
+    columns = cavro.ContainerReader(data).read_columns()
+    assert columns['id'].dtype == numpy.int64
+    assert columns['count'].dtype == numpy.int32
+    assert columns['ratio'].dtype == numpy.dtype('<f4')
+    assert columns['score'].dtype == numpy.dtype('<f8')
+    assert columns['ok'].dtype == numpy.bool_
+    assert isinstance(columns['size'], numpy.ma.MaskedArray)
+    assert columns['size'].mask.tolist() == [v['size'] is None for v in values]
+    project = columns['project']
+    assert isinstance(project, cavro.BinaryColumn)
+    assert project.is_string and project.validity is None
+    assert len(project) == 10
+    assert project[-1] == 'project-9'
+    assert project.data == b''.join(v['project'].encode() for v in values)
+    assert project.offsets.tolist()[:3] == [0, 9, 18]
+    with pytest.raises(IndexError):
+        project[10]
+    assert not columns['digest'].is_string
+    assert columns['country'].validity.tolist() == [v['country'] is not None for v in values]
+    assert columns['file.kind'].dtype == object
+    assert columns['tags'].tolist() == [v['tags'] for v in values]
+
+
+def test_container_read_columns_mixed():
+    data, values = _columns_container()
+    reader = cavro.ContainerReader(data)
+    assert next(reader).id == values[0]['id']
+    columns = reader.read_columns(10)
+    assert columns['id'].tolist() == [v['id'] for v in values[1:11]]
+    assert next(reader).id == values[11]['id']
+
+
+def test_container_read_columns_reader_schema():
+    data, values = _columns_container(100)
+    reader_schema = cavro.Schema({
+        'type': 'record',
+        'name': 'Download',
+        'fields': [
+            {'name': 'project', 'type': 'string'},
+            {'name': 'extra', 'type': 'int', 'default': 42},
+            {'name': 'file', 'type': {
+                'type': 'record',
+                'name': 'File',
+                'fields': [{'name': 'version', 'type': 'bytes'}],
+            }},
+            {'name': 'count', 'type': 'long'},
+            {'name': 'score', 'type': ['null', 'double']},
+        ],
+    })
+    columns = cavro.ContainerReader(data, reader_schema=reader_schema).read_columns()
+    assert list(columns) == ['project', 'extra', 'file.version', 'count', 'score']
+    assert columns['project'].to_list() == [v['project'] for v in values]
+    assert columns['extra'].tolist() == [42] * 100
+    assert columns['file.version'].to_list() == [v['file']['version'].encode() for v in values]
+    assert columns['count'].tolist() == [v['count'] for v in values]
+    assert columns['score'].tolist() == [v['score'] for v in values]
+
+
+def test_container_read_columns_invalid():
+    with pytest.raises(ValueError, match='record schema'):
+        cavro.ContainerReader(SIMPLE_CONTAINER).read_columns()
+    data, _ = _columns_container(10)
+    with pytest.raises(ValueError, match='batch_size'):
+        cavro.ContainerReader(data).read_columns(0)
+
+
+def test_container_read_columns_bad_record():
+    schema = cavro.Schema({'type': 'record', 'name': 'A', 'fields': [
+        {'name': 'a', 'type': 'long'},
+        {'name': 'b', 'type': 'string'},
+        {'name': 'c', 'type': ['null', 'long']},
+    ]})
+    values = [{'a': i, 'b': f'b{i}', 'c': 7} for i in range(10)]
+    buf = BytesIO()
+    # One record per block, so that the bad record can be seeked past
+    with cavro.ContainerWriter(buf, schema, max_blocksize=1) as writer:
+        writer.write_many(values)
+    data = bytearray(buf.getvalue())
+    # Corrupt the union index of the last field of the fifth record
+    bad_record = schema.binary_encode(values[4])
+    data[data.index(bad_record) + len(bad_record) - 2] = 0x0a
+    reader = cavro.ContainerReader(bytes(data))
+    assert reader.read_columns(2)['a'].tolist() == [0, 1]
+    for _ in range(2):
+        with pytest.raises(ValueError, match='union'):
+            reader.read_columns()
+    reader.seek_record(5)
+    columns = reader.read_columns()
+    assert columns['a'].tolist() == [5, 6, 7, 8, 9]
+    assert columns['b'].to_list() == ['b5', 'b6', 'b7', 'b8', 'b9']
+    assert columns['c'].tolist() == [7] * 5
+
+
+def test_mmap_reader_close(tmp_path):
+    path = tmp_path / 'data.bin'
+    path.write_bytes(b'\x02\x04')
+    with cavro.MmapReader(path) as reader:
+        assert cavro.Schema('"long"').binary_read(reader) == 1
+    assert reader.mapping is None
+    with pytest.raises(EOFError):
+        cavro.Schema('"long"').binary_read(reader)
+    reader.close()
+
+    lazy = cavro.Schema({'type': 'record', 'name': 'A', 'fields': [{'name': 'a', 'type': 'long'}]}, record_decodes_lazily=True)
+    reader = cavro.MmapReader(path)
+    record = lazy.binary_read(reader)
+    with pytest.raises(BufferError):
+        reader.close()
+    assert cavro.Schema('"long"').binary_read(reader) == 2
+    assert record.a == 1
+    del record
+    reader.close()
+    assert reader.mapping is None
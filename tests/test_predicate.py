@@ -0,0 +1,166 @@
+from io import BytesIO
+
+import cavro
+import pytest
+
+
+SCHEMA = {
+    'type': 'record',
+    'name': 'Download',
+    'fields': [
+        {'name': 'id', 'type': 'long'},
+        {'name': 'project', 'type': 'string'},
+        {'name': 'kind', 'type': {'type': 'enum', 'name': 'Kind', 'symbols': ['sdist', 'wheel', 'egg']}},
+        {'name': 'size', 'type': ['null', 'long']},
+        {'name': 'file', 'type': {
+            'type': 'record',
+            'name': 'File',
+            'fields': [
+                {'name': 'version', 'type': 'string'},
+                {'name': 'tags', 'type': {'type': 'array', 'items': 'string'}},
+                {'name': 'python', 'type': 'int'},
+            ],
+        }},
+        {'name': 'extra', 'type': {'type': 'map', 'values': 'string'}},
+    ],
+}
+
+
+def _make_value(i):
+    return {
+        'id': i,
+        'project': f'project-{i % 7}',
+        'kind': ['sdist', 'wheel', 'egg'][i % 3],
+        'size': None if i % 5 == 0 else i * 100,
+        'file': {'version': f'1.{i}', 'tags': ['a'] * (i % 4), 'python': 30 + i % 10},
+        'extra': {'i': str(i)},
+    }
+
+
+@pytest.fixture(scope='module')
+def container():
+    buf = BytesIO()
+    with cavro.ContainerWriter(buf, cavro.Schema(SCHEMA), max_blocksize=1000) as writer:
+        writer.write_many(_make_value(i) for i in range(500))
+    return buf.getvalue()
+
+
+def _ids(container, where, **kwargs):
+    return [obj.id for obj in cavro.ContainerReader(container, where=where, **kwargs)]
+
+
+@pytest.mark.parametrize('where,expected', [
+    (cavro.field('id') == 10, lambda v: v['id'] == 10),
+    (cavro.field('id') != 10, lambda v: v['id'] != 10),
+    (cavro.field('id') < 10, lambda v: v['id'] < 10),
+    (cavro.field('id') <= 10, lambda v: v['id'] <= 10),
+    (cavro.field('id') > 490, lambda v: v['id'] > 490),
+    (cavro.field('id') >= 490, lambda v: v['id'] >= 490),
+    (cavro.field('id').between(100, 110), lambda v: 100 <= v['id'] <= 110),
+    (cavro.field('kind').isin(['wheel', 'egg']), lambda v: v['kind'] in ('wheel', 'egg')),
+    (cavro.field('project') == 'project-3', lambda v: v['project'] == 'project-3'),
+    (cavro.field('size').is_null(), lambda v: v['size'] is None),
+    (cavro.field('size') > 40000, lambda v: v['size'] is not None and v['size'] > 40000),
+    (~(cavro.field('size') > 40000), lambda v: not (v['size'] is not None and v['size'] > 40000)),
+    (cavro.field('file.python') == 35, lambda v: v['file']['python'] == 35),
+    (cavro.field('file.tags') == ['a', 'a'], lambda v: v['file']['tags'] == ['a', 'a']),
+    (cavro.field('file.tags').isin([['a'], []]), lambda v: v['file']['tags'] in (['a'], [])),
+    (cavro.field('extra') == {'i': '3'}, lambda v: v['extra'] == {'i': '3'}),
+    (
+        (cavro.field('kind') == 'egg') & (cavro.field('file.version') == '1.5') | (cavro.field('id') < 3),
+        lambda v: (v['kind'] == 'egg' and v['file']['version'] == '1.5') or v['id'] < 3,
+    ),
+])
+def test_container_where(container, where, expected):
+    expected_ids = [i for i in range(500) if expected(_make_value(i))]
+    assert expected_ids
+    assert _ids(container, where) == expected_ids
+
+
+def test_container_where_batches(container):
+    where = cavro.field('kind') == 'wheel'
+    expected = [i for i in range(500) if i % 3 == 1]
+    reader = cavro.ContainerReader(container, where=where)
+    assert [obj.id for obj in reader.read_batch(10)] == expected[:10]
+    read = []
+    while True:
+        block = reader.read_block_objects()
+        if not block:
+            break
+        read.extend(obj.id for obj in block)
+    assert read == expected[10:]
+
+    reader = cavro.ContainerReader(container, where=where)
+    ids = [id for batch in reader.iter_columns(7) for id in batch['id']]
+    assert ids == expected
+
+
+def test_container_where_no_matches(container):
+    reader = cavro.ContainerReader(container, where=cavro.field('id') < 0)
+    assert list(reader) == []
+    assert reader.read_block_objects() == []
+    assert reader.read_batch(10) == []
+
+
+def test_container_where_reader_schema(container):
+    reader_schema = cavro.Schema({
+        'type': 'record',
+        'name': 'Download',
+        'fields': [
+            {'name': 'ident', 'type': 'long', 'aliases': ['id']},
+            {'name': 'size', 'type': ['null', 'double']},
+            {'name': 'mirror', 'type': 'string', 'default': 'pypi'},
+        ],
+    })
+    reader = cavro.ContainerReader(
+        container,
+        reader_schema=reader_schema,
+        where=(cavro.field('size') == 300.0) | (cavro.field('mirror') != 'pypi'),
+    )
+    assert [obj.ident for obj in reader] == [3]
+    with pytest.raises(ValueError, match='Unknown fields in predicate: id'):
+        cavro.ContainerReader(container, reader_schema=reader_schema, where=cavro.field('id') == 1)
+
+
+def test_container_where_invalid_fields(container):
+    with pytest.raises(ValueError, match='Unknown fields in predicate: file.nope, nope'):
+        cavro.ContainerReader(container, where=(cavro.field('nope') == 1) & (cavro.field('file.nope') == 1))
+    with pytest.raises(ValueError, match='not a record'):
+        cavro.ContainerReader(container, where=cavro.field('project.name') == 1)
+    with pytest.raises(ValueError, match='both'):
+        cavro.ContainerReader(container, where=(cavro.field('file') == 1) & (cavro.field('file.python') == 1))
+    with pytest.raises(ValueError, match='record schema'):
+        cavro.ContainerReader(
+            b'Obj\x01\x04\x14avro.codec\x08null\x16avro.schema\x0a"int"\x00aaaaaaaaaaaaaaaa',
+            where=cavro.field('id') == 1,
+        )
+
+
+@pytest.mark.parametrize('path', ['', 'a..b', '.a', 'a.'])
+def test_field_invalid_path(path):
+    with pytest.raises(ValueError, match='Invalid field path'):
+        cavro.field(path)
+
+
+def test_predicate_evaluate():
+    where = (cavro.field('a') > 1) & ~cavro.field('b').isin({'x', 'y'}) | cavro.field('c').is_null()
+    assert where.paths() == ['a', 'b', 'c']
+    assert where({'a': 2, 'b': 'z', 'c': 1})
+    assert not where({'a': 2, 'b': 'x', 'c': 1})
+    assert not where({'a': None, 'b': 'z', 'c': 1})
+    assert where({'a': None, 'b': 'z', 'c': None})
+    assert repr(cavro.field('a') <= 1) == "(field('a') <= 1)"
+    with pytest.raises(TypeError):
+        cavro.field('a') & cavro.field('b')
+
+
+def _get_id(obj):
+    return obj.id
+
+
+def test_parallel_read_where(tmp_path, container):
+    path = tmp_path / 'downloads.avro'
+    path.write_bytes(container)
+    where = cavro.field('file.python') == 31
+    results = list(cavro.parallel_read(path, _get_id, workers=2, split_size=2000, where=where))
+    assert results == [i for i in range(500) if i % 10 == 1]
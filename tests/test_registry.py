@@ -0,0 +1,136 @@
+import datetime
+
+import cavro
+import pytest
+
+
+WRITER_SCHEMA = {
+    'type': 'record',
+    'name': 'Reading',
+    'fields': [
+        {'name': 'station', 'type': 'string'},
+        {'name': 'temp', 'type': 'int'},
+    ],
+}
+
+READER_SCHEMA = {
+    'type': 'record',
+    'name': 'Reading',
+    'fields': [
+        {'name': 'station', 'type': 'string'},
+        {'name': 'temp', 'type': 'long'},
+        {'name': 'unit', 'type': 'string', 'default': 'C'},
+    ],
+}
+
+
+class CountingRegistry(cavro.SchemaRegistry):
+
+    def __init__(self, schemas):
+        self.schemas = schemas
+        self.requested = []
+
+    def get_schema(self, schema_id):
+        self.requested.append(schema_id)
+        if schema_id not in self.schemas:
+            raise cavro.UnknownSchemaId(schema_id)
+        return self.schemas[schema_id]
+
+
+def test_registry_framing():
+    schema = cavro.Schema('"long"')
+    registry = cavro.MemorySchemaRegistry()
+    codec = cavro.RegistryCodec(registry, schema)
+    encoded = codec.encode(3)
+    assert encoded == b'\x00\x00\x00\x00\x01\x06'
+    assert codec.schema_id(encoded) == 1
+    assert codec.decode(encoded) == 3
+    assert codec.decode(memoryview(encoded)) == 3
+    assert codec.encode_many([1, 2]) == [b'\x00\x00\x00\x00\x01\x02', b'\x00\x00\x00\x00\x01\x04']
+
+
+def test_registry_large_id():
+    registry = cavro.MemorySchemaRegistry({0x01020304: cavro.Schema('"string"')})
+    codec = cavro.RegistryCodec(registry)
+    assert codec.decode(b'\x00\x01\x02\x03\x04\x04hi') == 'hi'
+
+
+def test_registry_invalid_framing():
+    codec = cavro.RegistryCodec(cavro.MemorySchemaRegistry())
+    with pytest.raises(cavro.InvalidRegistryFraming):
+        codec.decode(b'\x00\x00')
+    with pytest.raises(cavro.InvalidRegistryFraming):
+        codec.decode(b'\x01\x00\x00\x00\x01\x00')
+    with pytest.raises(cavro.UnknownSchemaId) as exc_info:
+        codec.decode(b'\x00\x00\x00\x00\x07\x00')
+    assert exc_info.value.schema_id == 7
+    with pytest.raises(ValueError):
+        codec.encode(1)
+
+
+def test_registry_resolves_writer_schemas():
+    writer = cavro.Schema(WRITER_SCHEMA)
+    writer_codec = cavro.RegistryCodec(cavro.MemorySchemaRegistry({5: writer}), writer)
+    values = writer_codec.encode_many([{'station': 'BOL', 'temp': i} for i in range(3)])
+    assert writer_codec.schema_id(values[0]) == 5
+
+    registry = CountingRegistry({5: WRITER_SCHEMA})
+    codec = cavro.RegistryCodec(registry, cavro.Schema(READER_SCHEMA))
+    decoded = codec.decode_many(values)
+    assert [value._asdict() for value in decoded] == [{'station': 'BOL', 'temp': i, 'unit': 'C'} for i in range(3)]
+    assert codec.decode(values[0])._asdict() == {'station': 'BOL', 'temp': 0, 'unit': 'C'}
+    assert registry.requested == [5]
+    assert codec.writer_schema(5).canonical_form == writer.canonical_form
+
+
+def test_registry_decode_many_mixed_schemas():
+    registry = cavro.MemorySchemaRegistry({1: cavro.Schema('"long"'), 2: cavro.Schema('"string"')})
+    codec = cavro.RegistryCodec(registry)
+    values = [b'\x00\x00\x00\x00\x01\x02', b'\x00\x00\x00\x00\x02\x02a', b'\x00\x00\x00\x00\x01\x04']
+    assert codec.decode_many(values) == [1, 'a', 2]
+    assert codec.decode_many([]) == []
+
+
+def test_memory_registry_register():
+    registry = cavro.MemorySchemaRegistry()
+    assert registry.register(cavro.Schema('"long"')) == 1
+    assert registry.register(cavro.Schema('"string"')) == 2
+    assert registry.register(cavro.Schema('{"type": "long"}')) == 1
+    assert len(registry) == 2
+
+
+def test_file_registry(tmp_path):
+    registry = cavro.FileSchemaRegistry(tmp_path)
+    assert registry.register(cavro.Schema(WRITER_SCHEMA)) == 1
+    assert registry.register(cavro.Schema('"long"')) == 2
+    assert registry.register(cavro.Schema(WRITER_SCHEMA)) == 1
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['1.avsc', '2.avsc']
+    with pytest.raises(cavro.UnknownSchemaId):
+        registry.get_schema(3)
+
+    encoded = cavro.RegistryCodec(registry, cavro.Schema(WRITER_SCHEMA)).encode({'station': 'PIK', 'temp': 4})
+    codec = cavro.RegistryCodec(cavro.FileSchemaRegistry(str(tmp_path)), cavro.Schema(READER_SCHEMA))
+    assert codec.decode(encoded)._asdict() == {'station': 'PIK', 'temp': 4, 'unit': 'C'}
+
+
+def test_registry_logical_types_distinct(tmp_path):
+    timestamp = cavro.Schema({'type': 'long', 'logicalType': 'timestamp-millis'})
+    for registry in [cavro.MemorySchemaRegistry(), cavro.FileSchemaRegistry(tmp_path)]:
+        assert registry.register(cavro.Schema('"long"')) == 1
+        assert registry.register(timestamp) == 2
+        assert registry.register(timestamp) == 2
+        codec = cavro.RegistryCodec(registry, timestamp)
+        encoded = codec.encode(datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc))
+        assert codec.schema_id(encoded) == 2
+        assert cavro.RegistryCodec(registry).decode(encoded) == datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def test_registry_high_schema_ids(tmp_path):
+    schema_id = 2 ** 31 + 5
+    registry = cavro.MemorySchemaRegistry({schema_id: cavro.Schema('"long"')})
+    codec = cavro.RegistryCodec(registry)
+    assert codec.decode(b'\x00\x80\x00\x00\x05\x06') == 3
+    with pytest.raises(cavro.UnknownSchemaId):
+        codec.decode(b'\x00\xff\xff\xff\xff\x06')
+    with pytest.raises(cavro.UnknownSchemaId):
+        cavro.FileSchemaRegistry(tmp_path).get_schema(0xffffffff)
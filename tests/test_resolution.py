@@ -148,4 +148,83 @@ def test_field_resolution():
     rec = {'a': 1, 'b': 'hello', 'c': 2}
     encoded = writer.binary_encode(rec)
     decoded = resolved.binary_decode(encoded)
-    assert decoded._asdict() == {'a': 1, 'c': 2}
\ No newline at end of file
+    assert decoded._asdict() == {'a': 1, 'c': 2}
+
+
+SKIPPED_FIELD_TYPES = [
+    ('null', None),
+    ('boolean', True),
+    ('int', -12345),
+    ('long', 2**40),
+    ('float', 1.5),
+    ('double', 2.5),
+    ('bytes', b'\x00\x01\x02'),
+    ('string', 'hello'),
+    ({'type': 'fixed', 'name': 'F', 'size': 3}, b'abc'),
+    ({'type': 'enum', 'name': 'E', 'symbols': ['x', 'y']}, 'y'),
+    ({'type': 'array', 'items': 'string'}, ['a', 'bb', 'ccc']),
+    ({'type': 'map', 'values': ['null', 'long']}, {'a': 1, 'b': None}),
+    (['null', 'string', 'double'], 3.5),
+    ({'type': 'record', 'name': 'Sub', 'fields': [{'name': 'x', 'type': 'string'}, {'name': 'y', 'type': {'type': 'array', 'items': 'int'}}]}, {'x': 'sub', 'y': [1, 2]}),
+]
+
+
+@pytest.mark.parametrize('record_decodes_to_dict', [True, False])
+@pytest.mark.parametrize('skipped_type,skipped_value', SKIPPED_FIELD_TYPES)
+def test_record_resolution_skips_writer_fields(skipped_type, skipped_value, record_decodes_to_dict):
+    writer = cavro.Schema({
+        "type": "record",
+        "name": "test",
+        "fields": [
+            {"name": "a", "type": "long"},
+            {"name": "skipped", "type": skipped_type},
+            {"name": "b", "type": "string"},
+        ]
+    })
+    reader = cavro.Schema({
+        "type": "record",
+        "name": "test",
+        "fields": [
+            {"name": "b", "type": "string"},
+            {"name": "a", "type": "long"},
+        ]
+    }, record_decodes_to_dict=record_decodes_to_dict)
+    resolved = reader.reader_for_writer(writer)
+    encoded = writer.binary_encode({"a": 1, "skipped": skipped_value, "b": "after"})
+    decoded = resolved.binary_decode(encoded)
+    if not record_decodes_to_dict:
+        decoded = decoded._asdict()
+    assert decoded == {"b": "after", "a": 1}
+
+
+@pytest.mark.parametrize('items_type,block', [
+    ('int', b'\x03\x04\x02\x04'),  # Block of 2 items, 2 bytes long
+    ('string', b'\x03\x08\x02a\x02b'),  # Block of 2 items, 4 bytes long
+])
+def test_record_resolution_skips_sized_blocks(items_type, block):
+    writer = cavro.Schema({
+        "type": "record",
+        "name": "test",
+        "fields": [
+            {"name": "skipped", "type": {"type": "array", "items": items_type}},
+            {"name": "a", "type": "int"},
+        ]
+    })
+    reader = cavro.Schema({
+        "type": "record",
+        "name": "test",
+        "fields": [{"name": "a", "type": "int"}]
+    }, record_decodes_to_dict=True)
+    encoded = block + b'\x00' + b'\x54'
+    assert reader.reader_for_writer(writer).binary_decode(encoded) == {'a': 42}
+
+
+def test_record_resolution_skip_invalid_length():
+    writer = cavro.Schema({
+        "type": "record",
+        "name": "test",
+        "fields": [{"name": "skipped", "type": "string"}, {"name": "a", "type": "int"}]
+    })
+    reader = cavro.Schema({"type": "record", "name": "test", "fields": [{"name": "a", "type": "int"}]})
+    with pytest.raises(ValueError, match='negative length'):
+        reader.reader_for_writer(writer).binary_decode(b'\x01\x02')
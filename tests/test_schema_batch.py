@@ -0,0 +1,143 @@
+import io
+
+import cavro
+import pytest
+
+
+RECORD_SCHEMA = {
+    'type': 'record',
+    'name': 'A',
+    'fields': [
+        {'name': 'a', 'type': 'int'},
+        {'name': 'b', 'type': ['null', 'string']},
+    ],
+}
+
+
+def test_binary_decode_many():
+    schema = cavro.Schema(RECORD_SCHEMA, record_decodes_to_dict=True)
+    values = [{'a': i, 'b': None if i % 3 else str(i)} for i in range(100)]
+    encoded = b''.join(schema.binary_encode(v) for v in values)
+    assert schema.binary_decode_many(encoded, 100) == values
+    assert schema.binary_decode_many(encoded, 10) == values[:10]
+    assert schema.binary_decode_many(encoded) == values
+    assert schema.binary_decode_many(memoryview(encoded)) == values
+    assert schema.binary_decode_many(encoded, 0) == []
+    assert schema.binary_decode_many(b'') == []
+
+
+def test_binary_decode_many_errors():
+    schema = cavro.Schema('"long"')
+    encoded = schema.binary_encode(1) + schema.binary_encode(2)
+    with pytest.raises(EOFError):
+        schema.binary_decode_many(encoded, 3)
+    with pytest.raises(EOFError):
+        schema.binary_decode_many(encoded + b'\x80')
+    with pytest.raises(ValueError):
+        schema.binary_decode_many(encoded, -1)
+
+
+def test_binary_read_many():
+    schema = cavro.Schema('"string"')
+    reader = cavro.MemoryReader(b''.join(schema.binary_encode(s) for s in 'abcd'))
+    assert schema.binary_read_many(reader, 2) == ['a', 'b']
+    assert schema.binary_read(reader) == 'c'
+    assert schema.binary_read_many(reader, 1) == ['d']
+
+
+def test_binary_encode_many():
+    schema = cavro.Schema(RECORD_SCHEMA)
+    values = [{'a': i, 'b': None if i % 3 else str(i)} for i in range(100)]
+    expected = [schema.binary_encode(v) for v in values]
+    assert schema.binary_encode_many(values) == expected
+    assert schema.binary_encode_many(iter(values)) == expected
+    assert schema.binary_encode_many([]) == []
+
+
+def test_binary_encode_many_contiguous():
+    schema = cavro.Schema(RECORD_SCHEMA)
+    values = [{'a': i, 'b': None if i % 3 else str(i)} for i in range(100)]
+    expected = [schema.binary_encode(v) for v in values]
+    data, offsets = schema.binary_encode_many(values, contiguous=True)
+    assert data == b''.join(expected)
+    assert len(offsets) == len(values) + 1
+    assert [data[offsets[i]:offsets[i + 1]] for i in range(len(values))] == expected
+    assert schema.binary_decode_many(data, len(values)) == schema.binary_decode_many(b''.join(expected))
+    data, offsets = schema.binary_encode_many([], contiguous=True)
+    assert data == b''
+    assert list(offsets) == [0]
+
+
+def test_binary_encode_into():
+    schema = cavro.Schema('"string"')
+    writer = cavro.MemoryWriter()
+    assert schema.binary_encode_into(writer, 'abc') == 4
+    assert schema.binary_encode_into(writer, '') == 1
+    assert writer.bytes() == b'\x06abc\x00'
+    with pytest.raises(cavro.CavroException):
+        schema.binary_encode_into(writer, 1)
+    assert writer.bytes() == b'\x06abc\x00'
+    writer.reset()
+    assert writer.bytes() == b''
+    assert schema.binary_encode_into(writer, 'x' * 10_000) == 10_003
+    assert writer.bytes() == schema.binary_encode('x' * 10_000)
+
+
+def test_binary_encode_reuses_buffer_safely():
+    schema = cavro.Schema('"string"')
+    big = 'x' * 5_000_000
+    assert schema.binary_encode(big)[4:] == big.encode()
+    assert schema.binary_encode('a') == b'\x02a'
+    first = schema.binary_encode('first')
+    second = schema.binary_encode('second')
+    assert first == b'\x0afirst'
+    assert second == b'\x0csecond'
+
+
+def test_binary_encode_reentrant():
+    schema = None
+
+    class Adapter(cavro.CustomLogicalType):
+        logical_name = 'reenter'
+        underlying_types = (cavro.StringType, )
+
+        @classmethod
+        def _for_type(cls, underlying):
+            return cls()
+
+        @classmethod
+        def custom_encode_value(cls, value):
+            # Encoding with the same schema, while the outer encode is in progress
+            if value.isupper():
+                return schema.binary_encode(value.lower()).decode()
+            return value
+
+        @classmethod
+        def custom_decode_value(cls, value):
+            return value
+
+    options = cavro.DEFAULT_OPTIONS.with_logical_types(Adapter)
+    schema = cavro.Schema({'type': 'string', 'logicalType': 'reenter'}, options)
+    assert schema.binary_encode('ABC') == b'\x08\x06abc'
+
+
+def test_memory_writer_reserve():
+    writer = cavro.MemoryWriter(1)
+    writer.reserve(100)
+    assert len(writer.buffer) >= 100
+    assert writer.bytes() == b''
+    schema = cavro.Schema({'type': 'record', 'name': 'A', 'fields': [
+        {'name': 'a', 'type': {'type': 'array', 'items': 'long'}},
+        {'name': 'b', 'type': {'type': 'array', 'items': 'int'}},
+    ]})
+    value = {
+        'a': [0, -1, 1, 63, -64, 64, 2 ** 31, -2 ** 63, 2 ** 63 - 1] * 3,
+        'b': [0, -1, 1, 2 ** 31 - 1, -2 ** 31] * 3,
+    }
+    for size in range(12):
+        writer = cavro.MemoryWriter(size)
+        schema.binary_write(writer, value)
+        buf = io.BytesIO()
+        schema.binary_write(cavro.FileWriter(buf), value)
+        assert writer.bytes() == buf.getvalue()
+        assert schema.binary_decode(writer.bytes())._asdict() == value
@@ -0,0 +1,116 @@
+import json
+import threading
+from types import MappingProxyType
+
+import cavro
+import pytest
+
+
+SCHEMA = {
+    'type': 'record',
+    'name': 'Reading',
+    'fields': [
+        {'name': 'station', 'type': 'string'},
+        {'name': 'temp', 'type': 'int', 'default': 0},
+    ],
+}
+
+
+def test_cache_returns_same_schema():
+    cache = cavro.SchemaCache()
+    schema = cache.get(SCHEMA)
+    assert cache.get(SCHEMA) is schema
+    assert cache.get(json.dumps(SCHEMA)) is not schema
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert len(cache) == 2
+    assert schema.binary_decode(schema.binary_encode({'station': 'a', 'temp': 3}))._asdict() == {'station': 'a', 'temp': 3}
+
+
+def test_cache_ignores_dict_key_order():
+    cache = cavro.SchemaCache()
+    reordered = dict(reversed(list(SCHEMA.items())))
+    assert cache.get(reordered) is cache.get(SCHEMA)
+
+
+def test_cache_keys_on_defaults():
+    # The canonical form of these schemas is the same, but they decode differently
+    cache = cavro.SchemaCache()
+    other = dict(SCHEMA, fields=[SCHEMA['fields'][0], {'name': 'temp', 'type': 'int', 'default': 5}])
+    assert cache.get(SCHEMA).canonical_form == cache.get(other).canonical_form
+    assert cache.get(SCHEMA) is not cache.get(other)
+
+
+def test_cache_keys_on_options():
+    cache = cavro.SchemaCache()
+    options = cavro.DEFAULT_OPTIONS.replace(coerce_values_to_str=True)
+    default = cache.get(SCHEMA)
+    with_options = cache.get(SCHEMA, options)
+    assert with_options is not default
+    assert with_options.options is options
+    assert cache.get(SCHEMA, options) is with_options
+    # Equal, but distinct, options instances are cached separately
+    assert cache.get(SCHEMA, cavro.DEFAULT_OPTIONS.replace(coerce_values_to_str=True)) is not with_options
+
+    extra = cache.get(SCHEMA, coerce_values_to_str=True)
+    assert extra.options.coerce_values_to_str
+    assert extra is not default
+    assert cache.get(SCHEMA, coerce_values_to_str=True) is extra
+
+
+def test_cache_bypassed_for_unhashable_options():
+    cache = cavro.SchemaCache()
+    external = MappingProxyType({})
+    schema = cache.get(SCHEMA, externally_defined_types=external)
+    assert schema.options.externally_defined_types is external
+    assert cache.get(SCHEMA, externally_defined_types=external) is not schema
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = cavro.SchemaCache(maxsize=2)
+    int_schema = cache.get('"int"')
+    long_schema = cache.get('"long"')
+    assert cache.get('"int"') is int_schema
+    cache.get('"string"')
+    assert len(cache) == 2
+    assert cache.get('"int"') is int_schema
+    assert cache.get('"long"') is not long_schema
+
+
+def test_cache_clear():
+    cache = cavro.SchemaCache()
+    schema = cache.get(SCHEMA)
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
+    assert cache.get(SCHEMA) is not schema
+
+
+def test_cache_invalid_size():
+    with pytest.raises(ValueError):
+        cavro.SchemaCache(maxsize=0)
+
+
+def test_cache_threads():
+    cache = cavro.SchemaCache()
+    results = []
+
+    def get():
+        for _ in range(100):
+            results.append(cache.get(SCHEMA))
+
+    threads = [threading.Thread(target=get) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 400
+    assert len({id(schema) for schema in results[-10:]}) == 1
+    assert len(cache) == 1
+
+
+def test_schema_cached():
+    cavro.SCHEMA_CACHE.clear()
+    schema = cavro.Schema.cached(SCHEMA)
+    assert cavro.Schema.cached(SCHEMA) is schema
+    assert cavro.SCHEMA_CACHE.hits == 1
@@ -38,6 +38,36 @@ def test_avro_schema_tests(schema_text, canonical, fingerprint):
         )
     if fingerprint:
         assert schema.fingerprint().value == int(fingerprint)
+        assert cavro.fingerprint_many([schema, canonical.encode()]) == [schema.fingerprint().digest()] * 2
+
+
+def test_fingerprint_cached():
+    schema = cavro.Schema('{"type": "fixed", "name": "F", "size": 4}')
+    first = schema.fingerprint()
+    first.update(b'x')
+    assert schema.fingerprint().value != first.value
+    assert schema.fingerprint().value == schema.fingerprint().value
+    assert schema.fingerprint('sha256').digest() == hashlib.sha256(schema.canonical_form.encode()).digest()
+    assert schema.fingerprint('sha256', usedforsecurity=False).digest() == schema.fingerprint('sha256').digest()
+    digest_schema = cavro.Schema('"int"', fingerprint_returns_digest=True)
+    assert digest_schema.fingerprint() == cavro.Schema('"int"').fingerprint().digest()
+    with pytest.raises(cavro.InvalidHasher):
+        schema.fingerprint('not-a-hash')
+
+
+@pytest.mark.parametrize("size", [0, 1, 100, 10_000])
+def test_rabin_update_buffers(size):
+    data = bytes(range(256)) * (size // 256) + bytes(range(size % 256))
+    hasher = cavro.Rabin()
+    hasher.update(data)
+    split = cavro.Rabin()
+    split.update(bytearray(data[:size // 2]))
+    split.update(memoryview(data)[size // 2:])
+    assert split.value == hasher.value
+    expected = cavro.Rabin()
+    for i in range(size):
+        expected.update(data[i:i + 1])
+    assert expected.value == hasher.value
 
 
 def test_wrapping():
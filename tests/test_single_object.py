@@ -0,0 +1,89 @@
+import cavro
+import pytest
+
+
+WRITER_SCHEMA = {
+    'type': 'record',
+    'name': 'Reading',
+    'fields': [
+        {'name': 'station', 'type': 'string'},
+        {'name': 'temp', 'type': 'int'},
+    ],
+}
+
+READER_SCHEMA = {
+    'type': 'record',
+    'name': 'Reading',
+    'fields': [
+        {'name': 'station', 'type': 'string'},
+        {'name': 'temp', 'type': 'long'},
+        {'name': 'unit', 'type': 'string', 'default': 'C'},
+    ],
+}
+
+
+def test_single_object_encode():
+    schema = cavro.Schema('"long"')
+    encoded = schema.single_object_encode(1)
+    assert encoded == b'\xc3\x01' + schema.fingerprint().digest() + b'\x02'
+    assert cavro.single_object_fingerprint(encoded) == schema.fingerprint().digest()
+    assert schema.single_object_decode(encoded) == 1
+    assert schema.single_object_decode(memoryview(encoded)) == 1
+
+
+def test_single_object_fingerprint_byte_order():
+    fingerprint = bytes(range(1, 9))
+    assert cavro.single_object_fingerprint(b'\xc3\x01' + fingerprint + b'\x02') == fingerprint
+    assert cavro.single_object_fingerprint(b'\xc3\x01' + b'\xff' * 8) == b'\xff' * 8
+
+
+def test_single_object_decode_errors():
+    schema = cavro.Schema('"long"')
+    with pytest.raises(cavro.InvalidSingleObject):
+        schema.single_object_decode(b'\xc3\x01\x00')
+    with pytest.raises(cavro.InvalidSingleObject):
+        schema.single_object_decode(b'\xc3\x02' + bytes(9))
+    with pytest.raises(cavro.UnknownFingerprint) as exc_info:
+        schema.single_object_decode(cavro.Schema('"int"').single_object_encode(1))
+    assert exc_info.value.fingerprint == cavro.Schema('"int"').fingerprint().digest()
+
+
+def test_schema_store_decode():
+    long_schema = cavro.Schema('"long"')
+    string_schema = cavro.Schema('"string"')
+    store = cavro.SchemaStore([long_schema, string_schema])
+    assert len(store) == 2
+    assert long_schema.fingerprint().digest() in store
+    assert store.get(string_schema.fingerprint().digest()) is string_schema
+    assert store.decode(long_schema.single_object_encode(5)) == 5
+    assert store.decode(string_schema.single_object_encode('hi')) == 'hi'
+
+
+def test_schema_store_unknown_fingerprint():
+    store = cavro.SchemaStore([cavro.Schema('"long"')])
+    fingerprint = cavro.Schema('"int"').fingerprint().digest()
+    assert fingerprint not in store
+    with pytest.raises(cavro.UnknownFingerprint):
+        store.get(fingerprint)
+    with pytest.raises(cavro.UnknownFingerprint):
+        store.decode(cavro.Schema('"int"').single_object_encode(1))
+    with pytest.raises(ValueError):
+        store.get(b'\x00')
+
+
+def test_schema_store_reader_schema():
+    writer = cavro.Schema(WRITER_SCHEMA)
+    reader = cavro.Schema(READER_SCHEMA)
+    store = cavro.SchemaStore([writer], reader_schema=reader)
+    assert len(store) == 2
+    for _ in range(2):
+        decoded = store.decode(writer.single_object_encode({'station': 'BOL', 'temp': 20}))
+        assert decoded._asdict() == {'station': 'BOL', 'temp': 20, 'unit': 'C'}
+    encoded = store.encode({'station': 'PIK', 'temp': 3, 'unit': 'F'})
+    assert cavro.single_object_fingerprint(encoded) == reader.fingerprint().digest()
+    assert store.decode(encoded)._asdict() == {'station': 'PIK', 'temp': 3, 'unit': 'F'}
+
+
+def test_schema_store_encode_requires_reader():
+    with pytest.raises(ValueError):
+        cavro.SchemaStore().encode(1)
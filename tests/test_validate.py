@@ -0,0 +1,167 @@
+import io
+import random
+
+import cavro
+import pytest
+
+
+SCHEMA = {
+    'type': 'record',
+    'name': 'Download',
+    'fields': [
+        {'name': 'id', 'type': 'long'},
+        {'name': 'count', 'type': 'int'},
+        {'name': 'ok', 'type': 'boolean'},
+        {'name': 'size', 'type': 'double'},
+        {'name': 'ratio', 'type': 'float'},
+        {'name': 'project', 'type': 'string'},
+        {'name': 'digest', 'type': 'bytes'},
+        {'name': 'md5', 'type': {'type': 'fixed', 'name': 'MD5', 'size': 2}},
+        {'name': 'kind', 'type': {'type': 'enum', 'name': 'Kind', 'symbols': ['sdist', 'wheel']}},
+        {'name': 'version', 'type': ['null', 'string']},
+        {'name': 'tags', 'type': {'type': 'array', 'items': 'string'}},
+        {'name': 'extra', 'type': {'type': 'map', 'values': 'long'}},
+        {'name': 'when', 'type': {'type': 'long', 'logicalType': 'timestamp-millis'}},
+    ],
+}
+
+VALUE = {
+    'id': 2 ** 40,
+    'count': -5,
+    'ok': True,
+    'size': 1.5,
+    'ratio': 0.5,
+    'project': 'cavro £',
+    'digest': b'\xff',
+    'md5': b'ab',
+    'kind': 'wheel',
+    'version': '1.0',
+    'tags': ['a', 'b'],
+    'extra': {'x': 1},
+    'when': 1234,
+}
+
+
+def test_validate_bytes():
+    schema = cavro.Schema(SCHEMA)
+    encoded = schema.binary_encode(VALUE)
+    assert schema.validate_bytes(encoded) is None
+    assert schema.validate_bytes(memoryview(encoded), check_utf8=True) is None
+    assert cavro.Schema('"null"').validate_bytes(b'') is None
+    with pytest.raises(cavro.InvalidEncoding) as exc_info:
+        schema.validate_bytes(encoded + b'\x00')
+    assert exc_info.value.offset == len(encoded)
+    for end in range(len(encoded)):
+        with pytest.raises(cavro.InvalidEncoding, match='Not enough input data'):
+            schema.validate_bytes(encoded[:end])
+
+
+@pytest.mark.parametrize('source, encoded, offset, message', [
+    ('"boolean"', b'\x02', 0, 'Invalid boolean value'),
+    ('"int"', b'\x80\x80\x80\x80\x10', 0, 'too large for an int'),
+    ('"int"', b'\x80\x80\x80\x80\x80\x01', 0, 'too large for an int'),
+    ('"long"', b'\x80' * 9 + b'\x02', 0, 'too large for a long'),
+    ('"string"', b'\x03a', 0, 'negative length'),
+    ('"string"', b'\x06ab', 0, 'Not enough input data'),
+    ({'type': 'enum', 'name': 'E', 'symbols': ['a']}, b'\x02', 0, 'not valid for an enum'),
+    ({'type': 'enum', 'name': 'E', 'symbols': ['a']}, b'\x01', 0, 'not valid for an enum'),
+    (['null', 'int'], b'\x04', 0, 'not valid for a union'),
+    ({'type': 'array', 'items': ['null', 'int']}, b'\x04\x00\x04\x00', 2, 'not valid for a union'),
+    ({'type': 'array', 'items': 'int'}, b'\x03\x06\x02\x04\x00', 2, 'block size is 3'),
+    ({'type': 'map', 'values': 'int'}, b'\x01\x08\x02a\x02\x00', 2, 'block size is 4'),
+])
+def test_validate_bytes_invalid(source, encoded, offset, message):
+    with pytest.raises(cavro.InvalidEncoding, match=message) as exc_info:
+        cavro.Schema(source).validate_bytes(encoded)
+    assert exc_info.value.offset == offset
+    assert isinstance(exc_info.value, ValueError)
+
+
+def test_validate_bytes_blocks():
+    schema = cavro.Schema({'type': 'array', 'items': 'int'})
+    assert schema.validate_bytes(b'\x03\x04\x02\x04\x02\x08\x00') is None
+    nulls = cavro.Schema({'type': 'array', 'items': 'null'})
+    assert nulls.validate_bytes(b'\xfe\xff\xff\xff\xff\xff\xff\xff\x7f\x00') is None
+
+
+def test_validate_bytes_utf8():
+    schema = cavro.Schema({'type': 'map', 'values': 'string'})
+    bad_value = b'\x02\x02a\x04\xc3\x28\x00'
+    assert schema.validate_bytes(bad_value) is None
+    with pytest.raises(cavro.InvalidEncoding, match='utf-8') as exc_info:
+        schema.validate_bytes(bad_value, check_utf8=True)
+    assert exc_info.value.offset == 4
+    with pytest.raises(cavro.InvalidEncoding, match='utf-8'):
+        schema.validate_bytes(b'\x02\x02\xff\x02a\x00', check_utf8=True)
+
+
+def test_validate_utf8_matches_python():
+    schema = cavro.Schema('"string"')
+    rnd = random.Random(1)
+    samples = [
+        'hello world, this is plain ascii'.encode(), 'é€😀'.encode(), b'\xed\xa0\x80', b'\xf4\x90\x80\x80',
+        b'\xe0\x80\xaf', b'\xc0\xaf', b'abcdefgh\xe2\x82', b'\x80',
+    ]
+    samples += [bytes(rnd.choice(b'a\x80\xbf\xc2\xdf\xe0\xe1\xed\xef\xf0\xf4\xf5') for _ in range(rnd.randrange(12))) for _ in range(2000)]
+    for sample in samples:
+        encoded = cavro.Schema('"bytes"').binary_encode(sample)
+        try:
+            sample.decode('utf-8')
+        except UnicodeDecodeError as e:
+            with pytest.raises(cavro.InvalidEncoding) as exc_info:
+                schema.validate_bytes(encoded, check_utf8=True)
+            assert exc_info.value.offset == len(encoded) - len(sample) + e.start
+        else:
+            schema.validate_bytes(encoded, check_utf8=True)
+
+
+def _container(values, codec='null', **kwargs):
+    buf = io.BytesIO()
+    with cavro.ContainerWriter(buf, cavro.Schema(SCHEMA), codec, max_blocksize=500, **kwargs) as writer:
+        writer.write_many(values)
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize('codec', ['null', 'deflate'])
+def test_container_verify(codec):
+    values = [dict(VALUE, id=i) for i in range(100)]
+    data = _container(values, codec)
+    assert cavro.ContainerReader(data).verify(check_utf8=True) == 100
+    reader = cavro.ContainerReader(data)
+    next(reader)
+    assert reader.verify() == 99
+    assert list(reader) == []
+    assert cavro.ContainerReader(data, decompress_workers=2).verify() == 100
+    assert cavro.ContainerReader(_container([])).verify() == 0
+
+
+@pytest.mark.parametrize('codec,workers', [('null', 0), ('deflate', 0), ('deflate', 2)])
+def test_container_verify_invalid(codec, workers):
+    data = _container([VALUE] * 20, codec, marker=b'0123456789abcdef')
+    with pytest.raises(EOFError):
+        cavro.ContainerReader(data[:-1], decompress_workers=workers).verify()
+    with pytest.raises(ValueError, match='sync marker'):
+        cavro.ContainerReader(data[:-1] + b'X', decompress_workers=workers).verify()
+    # A damaged marker between blocks
+    middle = data.index(b'0123456789abcdef', data.index(b'0123456789abcdef') + 16)
+    bad_marker = data[:middle] + b'X' + data[middle + 1:]
+    with pytest.raises(ValueError, match='sync marker'):
+        cavro.ContainerReader(bad_marker, decompress_workers=workers).verify()
+
+    # Corrupt the enum index of the first value
+    data = _container([VALUE] * 20, marker=b'0123456789abcdef')
+    encoded = cavro.Schema(SCHEMA).binary_encode(VALUE)
+    enum_pos = data.index(encoded) + encoded.index(b'\x02\x02\x061.0')
+    bad = data[:enum_pos] + b'\x06' + data[enum_pos + 1:]
+    with pytest.raises(cavro.InvalidEncoding, match='Value 0: .* not valid for an enum'):
+        cavro.ContainerReader(bad).verify()
+
+
+def test_validate_bytes_resolved():
+    writer = cavro.Schema({'type': 'record', 'name': 'A', 'fields': [{'name': 'a', 'type': 'int'}, {'name': 'b', 'type': 'string'}]})
+    reader = cavro.Schema({'type': 'record', 'name': 'A', 'fields': [{'name': 'a', 'type': 'double'}, {'name': 'c', 'type': 'int', 'default': 1}]})
+    resolved = reader.reader_for_writer(writer)
+    encoded = writer.binary_encode({'a': 1, 'b': 'x'})
+    assert resolved.validate_bytes(encoded) is None
+    with pytest.raises(cavro.InvalidEncoding):
+        resolved.validate_bytes(encoded[:-1])
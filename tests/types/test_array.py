@@ -1,4 +1,9 @@
+from io import BytesIO
+import struct
+
 import cavro
+import numpy
+import pytest
 
 
 def test_array_binary_encoding():
@@ -23,4 +28,113 @@ def test_array_json_decoding():
     decoded = schema.json_decode('[1, 2, 3]')
     assert decoded == [1,2,3]
     decoded = schema.json_decode('[]')
-    assert decoded == []
\ No newline at end of file
+    assert decoded == []
+
+@pytest.mark.parametrize('item_type,dtype,values', [
+    ('int', numpy.int32, [0, 1, -1, 2**31 - 1, -2**31]),
+    ('long', numpy.int64, [0, 1, -1, 2**63 - 1, -2**63]),
+    ('float', numpy.float32, [0.0, 1.5, -2.25, float('inf')]),
+    ('double', numpy.float64, [0.0, 1.5, -2.25, 1e300, float('-inf')]),
+])
+def test_array_decodes_to_numpy(item_type, dtype, values):
+    schema = cavro.Schema({'type': 'array', 'items': item_type}, array_decodes_to_numpy=True)
+    decoded = schema.binary_decode(schema.binary_encode(values))
+    assert isinstance(decoded, numpy.ndarray)
+    assert decoded.dtype == dtype
+    assert decoded.tolist() == values
+    empty = schema.binary_decode(schema.binary_encode([]))
+    assert empty.dtype == dtype
+    assert len(empty) == 0
+    # Round trip ndarrays
+    assert schema.binary_encode(decoded) == schema.binary_encode(values)
+
+
+def test_array_decodes_to_numpy_multiple_blocks():
+    schema = cavro.Schema({'type': 'array', 'items': 'long'}, array_decodes_to_numpy=True)
+    # Two blocks, the second with a negative count, followed by its size in bytes
+    encoded = b'\x04\x02\x04' + b'\x01\x02\x06' + b'\x00'
+    decoded = schema.binary_decode(encoded)
+    assert decoded.dtype == numpy.int64
+    assert decoded.tolist() == [1, 2, 3]
+    doubles = cavro.Schema({'type': 'array', 'items': 'double'}, array_decodes_to_numpy=True)
+    encoded = b'\x02' + struct.pack('<d', 1.5) + b'\x02' + struct.pack('<d', 2.5) + b'\x00'
+    assert doubles.binary_decode(encoded).tolist() == [1.5, 2.5]
+    assert doubles.binary_decode(encoded).dtype == numpy.dtype('<f8')
+    floats = cavro.Schema({'type': 'array', 'items': 'float'}, array_decodes_to_numpy=True)
+    encoded = b'\x04' + struct.pack('<ff', 1.5, -2.25) + b'\x00'
+    decoded = floats.binary_decode(encoded)
+    assert decoded.dtype == numpy.dtype('<f4')
+    assert decoded.tolist() == [1.5, -2.25]
+
+
+def test_array_decodes_to_numpy_fallback():
+    # Non-numeric items, and items with logical types, are still decoded to lists
+    for items in ['string', {'type': 'int', 'logicalType': 'date'}, {'type': 'array', 'items': 'int'}]:
+        schema = cavro.Schema({'type': 'array', 'items': items}, array_decodes_to_numpy=True)
+        assert isinstance(schema.binary_decode(b'\x00'), list)
+    nested = cavro.Schema({'type': 'array', 'items': {'type': 'array', 'items': 'int'}}, array_decodes_to_numpy=True)
+    decoded = nested.binary_decode(nested.binary_encode([[1, 2], [3]]))
+    assert [d.tolist() for d in decoded] == [[1, 2], [3]]
+
+
+def test_array_decodes_to_numpy_file_reader():
+    schema = cavro.Schema({'type': 'array', 'items': 'double'}, array_decodes_to_numpy=True)
+    reader = cavro.FileReader(BytesIO(schema.binary_encode([1.0, 2.0, 3.0])))
+    assert schema.binary_read(reader).tolist() == [1.0, 2.0, 3.0]
+
+
+def test_array_decodes_to_numpy_truncated():
+    schema = cavro.Schema({'type': 'array', 'items': 'long'}, array_decodes_to_numpy=True)
+    with pytest.raises(EOFError):
+        schema.binary_decode(b'\xfe\xff\xff\xff\x0f\x02')
+    doubles = cavro.Schema({'type': 'array', 'items': 'double'}, array_decodes_to_numpy=True)
+    with pytest.raises(EOFError):
+        doubles.binary_decode(b'\x04' + struct.pack('<d', 1.5))
+
+
+@pytest.mark.parametrize('item_type,values', [
+    ('int', numpy.array([0, 1, -1, 2**31 - 1, -2**31], dtype=numpy.int32)),
+    ('long', numpy.array([0, 1, -1, 2**63 - 1, -2**63, 300, -300], dtype=numpy.int64)),
+    ('long', numpy.array([0, 1, -1, 2**31 - 1, -2**31], dtype=numpy.int32)),
+    ('float', numpy.array([0.0, 1.5, -2.25, float('inf')], dtype=numpy.float32)),
+    ('double', numpy.array([0.0, 1.5, -2.25, 1e300], dtype=numpy.float64)),
+    ('double', numpy.array([0.0, 1.5, -2.25], dtype=numpy.float32)),
+    ('boolean', numpy.array([True, False, True])),
+    ('long', numpy.arange(20, dtype=numpy.int64)[::3]),
+    ('double', numpy.arange(20, dtype=numpy.float64)[::-2]),
+    ('long', numpy.array([], dtype=numpy.int64)),
+])
+def test_array_encode_ndarray(item_type, values):
+    schema = cavro.Schema({'type': 'array', 'items': item_type})
+    expected = schema.binary_encode(values.tolist())
+    assert schema.binary_encode(values) == expected
+    assert schema.can_encode(values)
+    # Also via a FileWriter
+    out = BytesIO()
+    schema.binary_write(cavro.FileWriter(out), values)
+    assert out.getvalue() == expected
+
+
+def test_array_encode_ndarray_fallback():
+    # dtypes that don't exactly match the item type use the generic path
+    schema = cavro.Schema({'type': 'array', 'items': 'int'})
+    values = numpy.array([1, 2, 3], dtype=numpy.int64)
+    assert schema.binary_encode(values) == schema.binary_encode([1, 2, 3])
+    big_endian = numpy.array([1, 2, 3], dtype='>i8')
+    assert cavro.Schema({'type': 'array', 'items': 'long'}).binary_encode(big_endian) == schema.binary_encode([1, 2, 3])
+    doubles = cavro.Schema({'type': 'array', 'items': 'double'})
+    assert doubles.binary_encode(numpy.array([1.5, -2.25], dtype='>f8')) == b'\x04' + struct.pack('<dd', 1.5, -2.25) + b'\x00'
+    floats = cavro.Schema({'type': 'array', 'items': 'float'})
+    assert floats.binary_encode(numpy.array([1.5, -2.25], dtype='>f4')) == b'\x04' + struct.pack('<ff', 1.5, -2.25) + b'\x00'
+    with pytest.raises(cavro.CavroException):
+        schema.binary_encode(numpy.array([2**40], dtype=numpy.int64))
+
+
+def test_array_encode_ndarray_in_record():
+    schema = cavro.Schema({'type': 'record', 'name': 'A', 'fields': [
+        {'name': 'values', 'type': {'type': 'array', 'items': 'double'}},
+        {'name': 'maybe', 'type': ['null', {'type': 'array', 'items': 'long'}]},
+    ]})
+    value = {'values': numpy.array([1.0, 2.0]), 'maybe': numpy.array([1, 2])}
+    expected = schema.binary_encode({'values': [1.0, 2.0], 'maybe': [1, 2]})
+    assert schema.binary_encode(value) == expected
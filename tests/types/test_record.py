@@ -1,4 +1,7 @@
+import io
+
 import cavro
+import pytest
 
 
 def test_record_creation():
@@ -70,4 +73,79 @@ def test_record_json_decoding():
         {'name': 'c', 'type': ["null", "string"]},
     ]})
     expected = schema.type.record(a=1, b=2, c='hi')
-    assert schema.json_decode('{"a": 1, "b": 2, "c": {"string": "hi"}}') == expected
\ No newline at end of file
+    assert schema.json_decode('{"a": 1, "b": 2, "c": {"string": "hi"}}') == expected
+
+
+LAZY_SCHEMA = {'type': 'record', 'name': 'A', 'fields': [
+    {'name': 'a', 'type': 'int'},
+    {'name': 'b', 'type': 'string'},
+    {'name': 'c', 'type': ['null', 'A']},
+    {'name': 'd', 'type': {'type': 'array', 'items': 'A'}},
+]}
+
+LAZY_VALUE = {'a': 1, 'b': 'hi', 'c': {'a': 2, 'b': 'ho', 'c': None, 'd': []}, 'd': [{'a': 3, 'b': '', 'c': None, 'd': []}]}
+
+
+def test_record_decodes_lazily():
+    schema = cavro.Schema(LAZY_SCHEMA, record_decodes_lazily=True)
+    eager = cavro.Schema(LAZY_SCHEMA)
+    encoded = eager.binary_encode(LAZY_VALUE)
+    rec = schema.binary_decode(encoded)
+    assert isinstance(rec, schema.type.record)
+    assert rec.c.b == 'ho'
+    assert rec['d'][0].a == 3
+    assert rec.c._asdict() == LAZY_VALUE["c"]
+    assert rec == schema.binary_decode(encoded)
+    assert repr(rec) == repr(eager.binary_decode(encoded))
+    assert schema.binary_encode(schema.binary_decode(encoded)) == encoded
+    assert schema.compile().binary_decode(encoded).c.b == 'ho'
+
+    rec = schema.binary_decode(encoded)
+    rec.a = 5
+    assert schema.binary_encode(rec) == eager.binary_encode(dict(LAZY_VALUE, a=5))
+
+
+def test_record_decodes_lazily_many():
+    schema = cavro.Schema(LAZY_SCHEMA, record_decodes_lazily=True)
+    values = [dict(LAZY_VALUE, a=i) for i in range(3)]
+    encoded = b''.join(schema.binary_encode(value) for value in values)
+    decoded = list(schema.binary_decode_many(encoded))
+    assert [rec.c.b for rec in decoded] == ['ho'] * 3
+    assert [rec.a for rec in decoded] == [0, 1, 2]
+    assert repr(decoded) == repr(cavro.Schema(LAZY_SCHEMA).binary_decode_many(encoded))
+
+
+def test_record_decodes_lazily_errors():
+    schema = cavro.Schema(LAZY_SCHEMA, record_decodes_lazily=True)
+    with pytest.raises(EOFError):
+        schema.binary_decode(b'\x02\x08hi')
+    # Field values are only checked once accessed
+    rec = schema.binary_decode(b'\x02\x04\xff\xfe\x00\x00')
+    assert rec.a == 1
+    with pytest.raises(UnicodeDecodeError):
+        rec.b
+
+
+def test_record_decodes_lazily_promoted():
+    writer = cavro.Schema({'type': 'record', 'name': 'A', 'fields': [
+        {'name': 'a', 'type': 'int'},
+        {'name': 'dropped', 'type': 'string'},
+        {'name': 'b', 'type': 'string'},
+    ]})
+    reader = cavro.Schema({'type': 'record', 'name': 'A', 'fields': [
+        {'name': 'b', 'type': 'string'},
+        {'name': 'a', 'type': 'long'},
+        {'name': 'c', 'type': 'long', 'default': 7},
+    ]}, record_decodes_lazily=True)
+    resolved = reader.reader_for_writer(writer)
+    encoded = writer.binary_encode({'a': 1, 'dropped': 'x', 'b': 'z'})
+    rec = resolved.binary_decode(encoded)
+    assert (rec.b, rec.a, rec.c) == ('z', 1, 7)
+    assert rec._asdict() == {'b': 'z', 'a': 1, 'c': 7}
+
+
+def test_record_decodes_lazily_file_reader():
+    schema = cavro.Schema(LAZY_SCHEMA, record_decodes_lazily=True)
+    encoded = schema.binary_encode(LAZY_VALUE)
+    rec = schema.binary_read(cavro.FileReader(io.BytesIO(encoded)))
+    assert rec == schema.binary_decode(encoded)